@@ -6,6 +6,7 @@ from agentic_network.agents import AssistantAgent, ToolsAgent
 from agentic_network.core import AgentState
 from agentic_network.core import Routes
 from agentic_network.routing import decide_tools
+from monitoring import instrument_node
 from .agents.pre_processing_agent import PreProcessingAgent
 from .agents.post_processing_agent import PostProcessingAgent
 
@@ -38,10 +39,10 @@ class AgentGraph:
         graph_builder = StateGraph(AgentState)
 
         # ---------------------- Nodes -----------------------------------------------
-        graph_builder.add_node(Routes.PRE_PROCESSING, self.pre_processing_agent)
-        graph_builder.add_node(Routes.ASSISTANT, self.assistant_agent)
-        graph_builder.add_node(Routes.TOOLS, self.tools_agent)
-        graph_builder.add_node(Routes.POST_PROCESSING, self.post_processing_agent)
+        graph_builder.add_node(Routes.PRE_PROCESSING, instrument_node(Routes.PRE_PROCESSING, self.pre_processing_agent))
+        graph_builder.add_node(Routes.ASSISTANT, instrument_node(Routes.ASSISTANT, self.assistant_agent))
+        graph_builder.add_node(Routes.TOOLS, instrument_node(Routes.TOOLS, self.tools_agent))
+        graph_builder.add_node(Routes.POST_PROCESSING, instrument_node(Routes.POST_PROCESSING, self.post_processing_agent))
 
         # ---------------------- Lineer Edges ----------------------------------------
         graph_builder.add_edge(Routes.START, Routes.PRE_PROCESSING)
@@ -1,7 +1,8 @@
 # from .assistant_agent import AssistantAgent
+# AgentData first: the modules below import it back from this package
+from .agent_data import AgentData
 from .tools_agent import ToolsAgent
 from .pre_processing_agent import PreProcessingAgent
 from .post_processing_agent import PostProcessingAgent
 from .diagnosis import DiagnosisAgent
-from .appointment import AppointmentAgent
-from .agent_data import AgentData
+from .appointment import AppointmentAgent
\ No newline at end of file
@@ -2,22 +2,41 @@ from __future__ import annotations
 import asyncio
 
 from agentic_network.agents.appointment.system_prompt import system_msg
+from agentic_network.agents.appointment.tool_keywords import tool_keywords, tool_requires, tool_always
 from agentic_network.core import AgentState
-from agentic_network.utils import BaseAgent
+from agentic_network.utils import BaseAgent, ContextCompactor, ToolSelector, with_deadline
 from llm import LLMModel, get_llm
 from mcp_client import appointment_mcp
 
 
 class AppointmentAgent(BaseAgent):
     def __init__(self):
+        self.llm = get_llm(LLMModel.APPOINTMENT)
+        self.compactor = ContextCompactor("appointment")
+        self._load_tools()
+
+    def _sync_tools(self) -> None:
+        """Pick up the client's current toolset; it is swapped by the background manifest refresh."""
+        if self._manifest_hash != appointment_mcp.manifest_hash:
+            self._load_tools()
+
+    def _load_tools(self) -> None:
+        self._manifest_hash = appointment_mcp.manifest_hash
         self.tools = appointment_mcp.get_tools()
-        self.model = get_llm(LLMModel.APPOINTMENT).bind_tools(self.tools)
+        # Each call binds only the tools relevant to the turn (see ToolSelector)
+        self.tool_selector = ToolSelector("appointment", self.llm, self.tools,
+                                          keywords=tool_keywords, requires=tool_requires, always=tool_always)
 
     async def _get_node(self, state: AgentState) -> dict:
-        messages = state["messages"]
+        self._sync_tools()
+
+        # Old and superseded tool observations are shortened and the prompt kept within the agent's budget
+        # (tokens saved go to context_tokens_saved_total and the debug log)
+        context = self.compactor.compact(state["messages"], system=[system_msg])
 
         # call model
-        response = self.model.invoke([system_msg] + messages)
+        model = self.tool_selector.model_for(context.messages)
+        response = await with_deadline(model.ainvoke([system_msg] + context.messages))
 
         # return back the appointment data to llm
         return {
@@ -27,7 +46,8 @@ class AppointmentAgent(BaseAgent):
 
 async def test():
     from loguru import logger
-    from langchain_core.messages import HumanMessage, ToolMessage
+    from langchain_core.messages import HumanMessage
+    from agentic_network.utils import ToolExecutor
 
     try:
         logger.info(f"Initializing MCP Client for {appointment_mcp.label}...")
@@ -35,7 +55,7 @@ async def test():
 
         logger.info("Instantiating AppointmentAgent...")
         agent = AppointmentAgent()
-        tool_map = {tool.name: tool for tool in agent.tools}
+        executor = ToolExecutor(agent.tools)
 
         state: AgentState = {"messages": [], "intermediate_steps": [], "agent_outcome": None}
 
@@ -61,34 +81,18 @@ async def test():
 
                 if ai_msg.tool_calls:
                     for tool_call in ai_msg.tool_calls:
-                        tool_name = tool_call["name"]
-                        tool_args = tool_call["args"]
-                        tool_id = tool_call["id"]
+                        logger.warning(f"🛠️  TOOL CALL: {tool_call['name']} -> {tool_call['args']}")
 
-                        logger.warning(f"🛠️  TOOL CALL: {tool_name} -> {tool_args}")
+                    # Independent calls of one turn run concurrently; results keep the call order
+                    tool_msgs = await executor.run(ai_msg.tool_calls)
 
-                        selected_tool = tool_map.get(tool_name)
-                        tool_output = "Error: Tool not found"
-
-                        if selected_tool:
-                            try:
-                                tool_output = await selected_tool.ainvoke(tool_args)
-
-                                logger.info(f"   ✅ RESULT: {str(tool_output)[:100]}...")
-                            except Exception as e:
-                                tool_output = f"Tool Execution Error: {str(e)}"
-                                logger.error(f"   ❌ ERROR: {tool_output}")
+                    for tool_msg in tool_msgs:
+                        if tool_msg.status == "error":
+                            logger.error(f"   ❌ ERROR: {tool_msg.content}")
                         else:
-                            logger.error(f"   ❌ ERROR: Tool '{tool_name}' not found.")
-
-                        content_str = str(tool_output)
+                            logger.info(f"   ✅ RESULT: {str(tool_msg.content)[:100]}...")
 
-                        tool_msg = ToolMessage(
-                            content=content_str,
-                            tool_call_id=tool_id,
-                            name=tool_name
-                        )
-                        state["messages"].append(tool_msg)
+                    state["messages"].extend(tool_msgs)
 
                     continue
 
@@ -0,0 +1,33 @@
+# Words (prefixes) of a user message that make a tool relevant; the tool's own name parts count too,
+# unless another tool shares them. Matched after Turkish case folding, so "İptal" and "IPTAL" hit "iptal".
+tool_keywords = {
+    "get_available_hospitals": ["hastane", "hospital", "şehir", "city", "ilçe", "district", "nerede"],
+    "get_doctors_by_hospital_and_branch": ["doktor", "doctor", "hekim", "branş", "bölüm", "poliklinik", "uzman"],
+    "get_available_slots": ["saat", "müsait", "boş", "uygun", "tarih", "gün", "slot", "time", "date"],
+    "find_earliest_slots": ["erken", "yakın", "ilk", "hemen", "soon", "first"],
+    "get_patient_appointments": ["randevularım", "randevuları", "listele", "göster", "geçmiş", "my"],
+    # Verbs only: "randevu" / "appointment" name every write request, not just a new one.
+    "create_appointment": ["alm", "alabil", "alay", "oluştur", "ayarla", "yaz", "kaydet", "book", "schedul", "reserv"],
+    "update_appointment": ["değiştir", "ertele", "güncelle", "taşı", "change", "reschedul", "move"],
+    "cancel_appointment": ["iptal", "vazgeç", "sil", "cancel"],
+}
+
+# Tools a selected tool usually needs first (ids, free slots), bound along with it; followed transitively.
+tool_requires = {
+    "create_appointment": ["get_available_slots", "find_earliest_slots"],
+    "update_appointment": ["get_patient_appointments", "get_available_slots"],
+    "cancel_appointment": ["get_patient_appointments"],
+    "get_available_slots": ["get_doctors_by_hospital_and_branch"],
+    "get_doctors_by_hospital_and_branch": ["get_available_hospitals"],
+}
+
+# Read-only lookups, bound on every call: a step of any request may need to look up hospitals, doctors or slots.
+tool_always = [
+    "get_available_hospitals",
+    "get_doctors_by_hospital_and_branch",
+    "get_available_slots",
+    "find_earliest_slots",
+]
+
+# Tools whose success finishes the topic's task: the topic is completed and disclosed once the user moves on.
+tool_completes = ["create_appointment", "update_appointment", "cancel_appointment"]
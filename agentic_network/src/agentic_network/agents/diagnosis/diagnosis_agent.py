@@ -3,7 +3,7 @@ import asyncio
 
 from agentic_network.agents.diagnosis.system_prompt import system_msg
 from agentic_network.core import AgentState
-from agentic_network.utils import BaseAgent
+from agentic_network.utils import BaseAgent, ContextCompactor, with_deadline
 from llm import get_llm, LLMModel
 from mcp_client import diagnosis_mcp
 
@@ -11,15 +11,29 @@ from mcp_client import diagnosis_mcp
 class DiagnosisAgent(BaseAgent):
 
     def __init__(self):
+        self.llm = get_llm(LLMModel.DIAGNOSIS)
+        self.compactor = ContextCompactor("diagnosis")
+        self._load_tools()
+
+    def _sync_tools(self) -> None:
+        """Pick up the client's current toolset; it is swapped by the background manifest refresh."""
+        if self._manifest_hash != diagnosis_mcp.manifest_hash:
+            self._load_tools()
+
+    def _load_tools(self) -> None:
+        self._manifest_hash = diagnosis_mcp.manifest_hash
         self.tools = diagnosis_mcp.get_tools()
-        self.model = get_llm(LLMModel.DIAGNOSIS).bind_tools(self.tools)
+        self.model = self.llm.bind_tools(self.tools)
 
     async def _get_node(self, state: AgentState) -> dict:
+        self._sync_tools()
 
-        messages = state["messages"]
+        # Old and superseded tool observations are shortened and the prompt kept within the agent's budget
+        # (tokens saved go to context_tokens_saved_total and the debug log)
+        context = self.compactor.compact(state["messages"], system=[system_msg])
 
         # call model
-        response = self.model.invoke([system_msg] + messages)
+        response = await with_deadline(self.model.ainvoke([system_msg] + context.messages))
 
         # return back the appointment data to llm
         return {
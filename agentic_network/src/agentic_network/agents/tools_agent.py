@@ -1,75 +1,96 @@
-from mcp_client.util import mcp_client
-from langchain_core.tools.base import ToolException
-from pydantic import ValidationError
+from mcp_client import appointment_mcp, diagnosis_mcp
+from langchain_core.messages import AIMessage
+from os import getenv
 import json
 
-from agentic_network.utils import BaseAgent
+from agentic_network.agents.appointment.tool_keywords import tool_completes as appointment_completes
+from agentic_network.agents.topic_manager_cluster.utils.topic_manager_util import complete_current_topic
+from agentic_network.utils import BaseAgent, ToolExecutor
+from agentic_network.utils.tool_schema import compile_validator, summarize_schema, tool_args_schema
 from agentic_network.core import AgentState
 
+TOOL_ERROR_HINT = (
+    "Lütfen aynı aracı sadece geçerli argümanlar kullanarak yeniden çağır. "
+    "Tanımlanmamış key'ler kullanma. Tam ve kesin key adlarını kullan. "
+    "Customer no için her zaman 17976826 kullan. "
+    "Action Input yalnızca tek bir JSON nesnesi olmalı; kod blokları (```), yorum, trailing virgül YOK."
+)
+
 
 class ToolsAgent(BaseAgent):
     def __init__(self):
-        tools = mcp_client.get_tools()
-        self.tools_by_name = {t.name: t for t in tools}
+        self.clients = (appointment_mcp, diagnosis_mcp)
+        # A successful call of one of these finishes the current topic's task
+        self.completing_tools = frozenset(appointment_completes)
+
+        call_timeout = getenv("TOOL_CALL_TIMEOUT", "").strip()
+        self.executor = ToolExecutor(
+            [],
+            per_tool_limit=int(getenv("TOOL_CONCURRENCY_PER_TOOL", "4").strip()),
+            call_timeout=float(call_timeout) if call_timeout else None,
+            format_error=self._format_tool_error,
+        )
+
+        self.tools_by_name = {}
+        self.schema_summaries = {}
+        self._manifest_hashes = None
+        self._sync_tools()
 
+    def _sync_tools(self) -> None:
+        """Rebuild the tool lookups whenever a client swapped its toolset (background refresh, new manifest)."""
+        manifest_hashes = tuple(client.manifest_hash for client in self.clients)
+        if manifest_hashes == self._manifest_hashes:
+            return
+        self._manifest_hashes = manifest_hashes
+
+        tools = [tool for client in self.clients for tool in client.get_tools()]
         for t in tools:
             if not hasattr(t, "handle_tool_error"): continue
             t.handle_tool_error = lambda e: f"TOOL_ERROR: {e}"
 
+        # Schemas are compiled once per toolset: error summaries are pre-rendered and arguments
+        # validated locally, so a malformed call never costs an MCP round-trip.
+        schemas = {t.name: tool_args_schema(t) for t in tools}
+        self.tools_by_name = {t.name: t for t in tools}
+        self.schema_summaries = {name: summarize_schema(schema) for name, schema in schemas.items()}
+        self.executor.set_tools(tools, {name: compile_validator(schema) for name, schema in schemas.items()})
+
     async def _get_node(self, agent_state: AgentState) -> dict:
         print("\n---TOOLS AGENT---")
+        self._sync_tools()
+
+        # Native tool calling: run every call of the last model turn at once
+        messages = agent_state.get("messages") or []
+        if messages and isinstance(messages[-1], AIMessage) and messages[-1].tool_calls:
+            tool_messages = await self.executor.run(messages[-1].tool_calls)
+            for msg in tool_messages:
+                print(f"Tool output ({msg.name}):", msg.content)
+            if any(msg.name in self.completing_tools and msg.status == "success" for msg in tool_messages):
+                return {"messages": tool_messages, **complete_current_topic(agent_state)}
+            return {"messages": tool_messages}
 
         agent_action = agent_state["agent_outcome"]
         tool_name = getattr(agent_action, "tool", None) or agent_action.get("tool")
         raw_input = getattr(agent_action, "tool_input", None) or agent_action.get("tool_input")
 
-        output = ""
-        tool_to_call = self.tools_by_name.get(agent_action.tool)
-
-        if tool_to_call is None:
-            observation = self._format_tool_error(
-                tool_name or "(missing)",
-                "Tool not found.",
-                raw_input,
-            )
-            print("Tool output:", observation)
-            return {"intermediate_steps": [(agent_action, observation)]}
-
         # Normalize inputs first (turn malformed inputs into observation, not exceptions)
+        completed = {}
         args, parse_err = ToolsAgent._normalize_args(raw_input)
-        if parse_err:
+        if tool_name not in self.tools_by_name:
+            observation = self._format_tool_error(tool_name or "(missing)", "Tool not found.", raw_input)
+        elif parse_err:
             observation = self._format_tool_error(tool_name, parse_err, raw_input)
-            print("Tool output:", observation)
-            return {"intermediate_steps": [(agent_action, observation)]}
-
-        # Call the tool safely; convert *any* exception into an observation
-        try:
-            result = await tool_to_call.ainvoke(args)
-            observation = result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
-
-        except ToolException as e:
-            observation = self._format_tool_error(tool_name, str(e), args)
-
-        except ValidationError as e:
-            # Common case: missing or wrong-typed args
-            observation = self._format_tool_error(tool_name, f"ValidationError: {e}", args)
-
-        except Exception as e:
-            observation = self._format_tool_error(tool_name, f"{type(e).__name__}: {e}", args)
+        else:
+            # Call the tool safely; any exception becomes an observation
+            observation, ok = await self.executor.invoke(tool_name, args)
+            if ok and tool_name in self.completing_tools:
+                completed = complete_current_topic(agent_state)
 
         print("Tool output:", observation)
-        return {"intermediate_steps": [(agent_action, observation)]}
+        return {"intermediate_steps": [(agent_action, observation)], **completed}
 
     def _format_tool_error(self, tool_name: str, msg: str, args) -> str:
         """Uniform observation text the LLM can act on immediately."""
-        hint = (
-            "Lütfen aynı aracı sadece geçerli argümanlar kullanarak yeniden çağır. "
-            "Tanımlanmamış key'ler kullanma. Tam ve kesin key adlarını kullan. "
-            "Customer no için her zaman 17976826 kullan. "
-            "Action Input yalnızca tek bir JSON nesnesi olmalı; kod blokları (```), yorum, trailing virgül YOK. "
-            "Action Input yalnızca tek bir JSON nesnesi olmalı; kod blokları (```), yorum, trailing virgül KULLANMA. "
-            "Action Input yalnızca tek bir JSON nesnesi olmalı; kod blokları (```), yorum, trailing virgül YOK. "
-        )
         args_str = json.dumps(args, ensure_ascii=False) if isinstance(args, (dict, list)) else str(
             args)
 
@@ -77,46 +98,11 @@ class ToolsAgent(BaseAgent):
             f"TOOL_ERROR\n"
             f"tool: {tool_name}\n"
             f"message: {msg}\n"
-            f"expected_args:\n{ToolsAgent._format_schema(self.tools_by_name.get(tool_name) or None)}\n"
+            f"expected_args:\n{self.schema_summaries.get(tool_name, 'No schema available.')}\n"
             f"your_args: {args_str}\n"
-            f"hint: {hint}"
+            f"hint: {TOOL_ERROR_HINT}"
         )
 
-    @staticmethod
-    def _format_schema(tool) -> str:
-        """Best-effort summary of expected args for the agent."""
-
-        if tool is None:
-            return "No schema available."
-
-        schema_lines = []
-        schema = None
-
-        # LangChain BaseTool usually exposes args_schema (Pydantic model) or input_schema
-        args_schema = getattr(tool, "args_schema", None)
-        input_schema = getattr(tool, "input_schema", None)
-
-        if args_schema is not None:
-            # Pydantic v2: model_fields; v1: __fields__
-            fields = getattr(args_schema, "model_fields", None) or getattr(args_schema, "__fields__", {})
-            for name, field in (fields.items() if isinstance(fields, dict) else []):
-                # v2 style
-                required = getattr(field, "is_required", lambda: getattr(field, "required", False))()
-                typ = getattr(field, "annotation", None) or getattr(field, "outer_type_", None)
-                schema_lines.append(
-                    f"- {name} ({getattr(typ, '__name__', str(typ))}){' [required]' if required else ''}")
-
-        elif input_schema is not None:
-            # JSON schema-like structure
-            req = set(input_schema.get("required", []))
-            props = input_schema.get("properties", {})
-            for name, meta in props.items():
-                typ = meta.get("type", "any")
-                schema_lines.append(f"- {name} ({typ}){' [required]' if name in req else ''}")
-
-        if schema_lines: schema = "\n".join(schema_lines)
-        return schema or "(no argument schema available)"
-
     @staticmethod
     def _normalize_args(raw):
         """
@@ -1,10 +1,15 @@
 from agentic_network.agents.topic_manager_cluster.core import TopicManagerState
 from agentic_network.agents.topic_manager_cluster.utils.topic_manager_util import embed_topic_id_to_message, \
     get_current_topic
+from agentic_network.agents.topic_manager_cluster.utils.topic_lifecycle import TopicLifecycle
 from agentic_network.utils import BaseAgent
 
 
 class TopicManagerPostProcessingAgent(BaseAgent):
+    def __init__(self):
+        # Discloses idle/completed topics and caps the topics a session keeps
+        self.lifecycle = TopicLifecycle()
+
     def _get_node(self, agent_state: TopicManagerState) -> dict:
         current_topic = get_current_topic(agent_state)
         current_topic_id = current_topic["id"]
@@ -15,4 +20,5 @@ class TopicManagerPostProcessingAgent(BaseAgent):
 
         return {
             "current_message": id_embedded_message,
+            **self.lifecycle.advance(agent_state),
         }
@@ -3,6 +3,7 @@ from langchain.agents.structured_output import ProviderStrategy, ToolStrategy
 from langchain_core.messages import SystemMessage, AIMessage, HumanMessage
 from langchain_core.runnables import Runnable
 from pydantic import BaseModel
+from os import getenv
 
 from agentic_network.agents import AgentData
 from agentic_network.agents.topic_manager_cluster.core import TopicManagerState
@@ -10,8 +11,10 @@ from agentic_network.agents.topic_manager_cluster.utils.topic_manager_util impor
     format_dialog_with_topics,
     strip_quotes,
     resurface_topic,
+    format_topic_summary,
 )
-from agentic_network.utils import BaseAgent
+from agentic_network.agents.topic_manager_cluster.utils.topic_scoring import rank_topics
+from agentic_network.utils import BaseAgent, with_deadline
 from llm import get_llm
 from llm.llm_client import LLMModel
 
@@ -28,6 +31,8 @@ class PreTopicsCheckerAgent(BaseAgent):
 
     def __init__(self):
         self.llm = get_llm(LLMModel.TOPIC_MASTER)
+        # Open topics shown to the LLM: the best matches by embedding similarity, not the whole history
+        self.candidate_count = int(getenv("TOPIC_CANDIDATES", "3").strip())
         self._initialize_model()
 
     # ---- Internal Methods --------------------------------------------------------
@@ -43,32 +48,44 @@ class PreTopicsCheckerAgent(BaseAgent):
             print(f"[PreTopicsCheckerAgent] ❌LLM connection failed.\nError Message:\n{e}")
             exit()
 
-    def _get_node(self, agent_state: TopicManagerState) -> dict:
+    async def _get_node(self, agent_state: TopicManagerState) -> dict:
         # print("[PreTopicsCheckerAgent] Running agent...")
 
-        topic_stack = agent_state["topic_stack"]
-        disclosed_topics = agent_state["disclosed_topics"]
-        if not topic_stack and not disclosed_topics:
-            # print("[PreTopicsCheckerAgent] There was no topic in stack or disclosed topics, redirect to: NEW TOPIC AGENT")
+        # The current topic was already ruled out by TopicChangeCheckerAgent; only earlier topics can be resumed.
+        topics = agent_state["topic_stack"][:-1] + agent_state["disclosed_topics"]
+        if not topics:
+            # print("[PreTopicsCheckerAgent] There was no earlier topic in stack or disclosed topics, redirect to: NEW TOPIC AGENT")
 
             return {
                 "topic_selected": False,
             }
 
-        dialog = format_dialog_with_topics(agent_state["agentic_state"]["messages"])
         current_message = agent_state["current_message"]
-        system_message = SystemMessage(self._get_system_prompt(dialog, current_message.content, AgentData.agent_list))
-
-        response = self.agent.invoke(
+        candidates = rank_topics(current_message.content, topics, k=self.candidate_count)
+        candidate_ids = [topic["id"] for topic, _ in candidates]
+
+        # Only the candidates go into the prompt: compacted topics by their summary, open ones by their messages.
+        summarized = [topic for topic, _ in candidates if "summary" in topic]
+        open_ids = set(candidate_ids) - {topic["id"] for topic in summarized}
+        open_messages = [
+            m for m in agent_state["agentic_state"]["messages"]
+            if (getattr(m, "metadata", {}) or {}).get("topic_id") in open_ids
+        ]
+        dialog = "\n".join([format_topic_summary(topic) for topic in summarized] +
+                           [format_dialog_with_topics(open_messages)])
+        system_message = SystemMessage(self._get_system_prompt(dialog, current_message.content, AgentData.agent_list,
+                                                               candidate_ids))
+
+        response = await with_deadline(self.agent.ainvoke(
             {
                 "messages": [
                     system_message,
                     HumanMessage(content="Follow the instruction above and answer."),
                 ]
             }
-        )
-        selected_topic_uuid = strip_quotes(response["structured_response"].uuid.upper())
-        update_state = resurface_topic(agent_state, selected_topic_uuid)
+        ))
+        selected_topic_uuid = self._resolve_candidate(response["structured_response"].uuid, candidate_ids)
+        update_state = resurface_topic(agent_state, selected_topic_uuid) if selected_topic_uuid else {}
 
         if not update_state:
             return {
@@ -81,8 +98,24 @@ class PreTopicsCheckerAgent(BaseAgent):
         return update_state
 
     @staticmethod
-    def _get_system_prompt(dialog: str, message: str, agents_list: list) -> str:
+    def _resolve_candidate(answer: str, candidate_ids: list[str]) -> str | None:
+        """The candidate id the answer names (case-insensitive, or a unique prefix of one); None otherwise."""
+        answer = strip_quotes(answer.strip()).strip().lower()
+        if not answer or answer == ResponseModel.Choices.new_topic.lower():
+            return None
+
+        by_lower = {topic_id.lower(): topic_id for topic_id in candidate_ids}
+        if answer in by_lower:
+            return by_lower[answer]
+
+        # Truncated ids are accepted when unambiguous; anything else is a hallucinated id.
+        matches = [topic_id for lower, topic_id in by_lower.items() if len(answer) >= 8 and lower.startswith(answer)]
+        return matches[0] if len(matches) == 1 else None
+
+    @staticmethod
+    def _get_system_prompt(dialog: str, message: str, agents_list: list, candidate_ids: list[str]) -> str:
         formatted_agents = "\n".join([f"- {agent}" for agent in agents_list])
+        formatted_candidates = "\n".join([f"- {topic_id}" for topic_id in candidate_ids])
 
         return f"""\
     # ROLE
@@ -97,6 +130,11 @@ class PreTopicsCheckerAgent(BaseAgent):
     {dialog}
     ```
     
+    ### Candidate Topic IDs (the only valid answers besides NEW_TOPIC)
+    ```text
+    {formatted_candidates}
+    ```
+
     ### Latest User Message (`user_input`)
     ```text
     {message}
@@ -118,7 +156,7 @@ class PreTopicsCheckerAgent(BaseAgent):
 
     ## DEFINITIONS
     * **Topic:** A coherent, ongoing task, inquiry, or workflow within a specific domain (e.g., technical troubleshooting, billing, or scheduling).
-    * **Topic ID:** The UUID identifier appearing in `dialog_with_topics`. You must choose from IDs already present in the dialog. **Do NOT invent new IDs.**
+    * **Topic ID:** The UUID identifier appearing in `dialog_with_topics`. You must choose from the Candidate Topic IDs. **Do NOT invent new IDs.**
 
     ---
 
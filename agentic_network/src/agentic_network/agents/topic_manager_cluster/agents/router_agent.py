@@ -9,9 +9,9 @@ from agentic_network.agents.topic_manager_cluster.core import TopicManagerState
 from agentic_network.agents.topic_manager_cluster.utils.topic_manager_util import (
     create_topic,
     get_current_topic,
-    format_dialog,
+    format_topic_dialog,
 )
-from agentic_network.utils import BaseAgent
+from agentic_network.utils import BaseAgent, with_deadline
 from llm.llm_client import get_llm, LLMModel
 
 
@@ -38,23 +38,21 @@ class RouterAgent(BaseAgent):
             print(f"[RouterAgent] ❌LLM connection failed.\nError Message:\n{e}")
             exit()
 
-    def _get_node(self, agent_state: TopicManagerState) -> dict:
+    async def _get_node(self, agent_state: TopicManagerState) -> dict:
         # print("[RouterAgent] Running agent...")
 
         current_message = agent_state.get("current_message")
-        messages = get_current_topic(agent_state)["messages"][:]
-        messages.append(current_message)
-        topic_messages = format_dialog(messages)
+        topic_messages = format_topic_dialog(get_current_topic(agent_state), [current_message])
         system_message = SystemMessage(self._get_system_prompt(current_message.content, topic_messages, AgentData.agent_list))
 
-        response = self.agent.invoke(
+        response = await with_deadline(self.agent.ainvoke(
             {
                 "messages": [
                     system_message,
                     HumanMessage(content="Follow the instruction above and answer."),
                 ]
             }
-        )
+        ))
         selected_agent = response["structured_response"].agent
 
         # print("[RouterAgent] Routing to agent:", selected_agent)
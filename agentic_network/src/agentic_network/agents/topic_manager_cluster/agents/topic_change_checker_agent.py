@@ -11,9 +11,9 @@ from agentic_network.agents.topic_manager_cluster.core import TopicManagerState
 from agentic_network.agents.topic_manager_cluster.core.topic_manager_state import TopicState
 from agentic_network.agents.topic_manager_cluster.utils.topic_manager_util import (
     get_current_topic,
-    format_dialog,
+    format_topic_dialog,
 )
-from agentic_network.utils import BaseAgent, get_class_field_values
+from agentic_network.utils import BaseAgent, get_class_field_values, with_deadline
 from llm.llm_client import get_llm, LLMModel
 
 class ResponseModel:
@@ -47,7 +47,7 @@ class TopicChangeCheckerAgent(BaseAgent):
             print(f"[NewTopicAgent] ❌LLM connection failed.\nError Message:\n{e}")
             exit()
 
-    def _get_node(self, agent_state: TopicManagerState) -> dict:
+    async def _get_node(self, agent_state: TopicManagerState) -> dict:
         # print("[TopicChangeCheckerAgent] Running agent...")
 
         topic_stack = agent_state["topic_stack"]
@@ -60,18 +60,18 @@ class TopicChangeCheckerAgent(BaseAgent):
 
         current_message = agent_state["current_message"]
         cur_topic: TopicState = get_current_topic(agent_state)
-        cur_topic_messages = cur_topic.get("messages", []) + [current_message]
+        cur_topic_dialog = format_topic_dialog(cur_topic, [current_message])
 
-        system_message = SystemMessage(self._get_system_prompt(format_dialog(cur_topic_messages), current_message.content, AgentData.agent_list))
+        system_message = SystemMessage(self._get_system_prompt(cur_topic_dialog, current_message.content, AgentData.agent_list))
 
-        response = self.agent.invoke(
+        response = await with_deadline(self.agent.ainvoke(
             {
                 "messages": [
                     system_message,
                     HumanMessage(content="Follow the instruction above and answer."),
                 ]
             }
-        )
+        ))
         final_answer = response["structured_response"].final_answer.upper()
 
         return {
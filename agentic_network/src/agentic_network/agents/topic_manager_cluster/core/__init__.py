@@ -1,2 +1,2 @@
 from .topic_manager_routes import TopicManagerRoutes
-from .topic_manager_state import TopicManagerState
+from .topic_manager_state import TopicManagerState, ReplaceTopics
\ No newline at end of file
@@ -1,7 +1,5 @@
-from operator import add
-
 from langgraph.graph.message import add_messages
-from typing import TypedDict, Annotated, Optional
+from typing import TypedDict, Annotated, Optional, NotRequired
 from langchain_core.messages import AnyMessage
 
 from agentic_network.agents import AgentData
@@ -11,10 +9,25 @@ class TopicState(TypedDict):
     id: str
     messages: Annotated[list[AnyMessage], add_messages]
     agent: AgentData.agent_literals
+    last_turn: NotRequired[int]     # turn the topic last received a message
+    completed: NotRequired[bool]    # the topic's task is done; disclosed once the user moves on
+    summary: NotRequired[str]       # set when a disclosed topic is compacted
+
+
+class ReplaceTopics(list):
+    """A topic list returned by a node that replaces the current list instead of being appended to it."""
+
+
+def merge_topics(current: list[TopicState], update: list[TopicState]) -> list[TopicState]:
+    if isinstance(update, ReplaceTopics):
+        return list(update)
+    return (current or []) + list(update or [])
+
 
 class TopicManagerState(TypedDict):
     agentic_state: TypedDict
     current_message: Optional[AnyMessage]
-    topic_stack: Annotated[list[TopicState], add]
-    disclosed_topics: Annotated[list[TopicState], add]
+    topic_stack: Annotated[list[TopicState], merge_topics]
+    disclosed_topics: Annotated[list[TopicState], merge_topics]
     topic_selected: bool
+    turn: NotRequired[int]
@@ -16,6 +16,7 @@ from agentic_network.agents.topic_manager_cluster.agents import (
     NewTopicAgent,
     )
 from agentic_network.core import AgentState
+from monitoring import instrument_node
 
 
 class TopicManagerCluster(BaseAgent):
@@ -36,7 +37,7 @@ class TopicManagerCluster(BaseAgent):
         self._build_graph()
 
     # ---- Internal Methods --------------------------------------------------------
-    def _get_node(self, agent_state: AgentState) -> dict:
+    async def _get_node(self, agent_state: AgentState) -> dict:
         topic_master_state = agent_state.get("topic_master_state")
         current_message = topic_master_state["current_message"]
         # print(f"[TopicMaster] {current_message=}")
@@ -49,7 +50,8 @@ class TopicManagerCluster(BaseAgent):
         #     disclosed_topics=[],
         #     topic_selected=False
 
-        final_state = self.graph.invoke(topic_master_state)
+        # Runs inside the caller's task context, so the request deadline applies to every stage.
+        final_state = await self.graph.ainvoke(topic_master_state)
         topic_stack = final_state.get("topic_stack")
         current_topic = get_current_topic(final_state)
         # print(f"[TopicMaster] {topic_stack=}")
@@ -87,12 +89,16 @@ class TopicManagerCluster(BaseAgent):
 
         # ---------------------- Nodes -------------------------------------------------
         # Register each agent under a stable route key from GraphRoutes.
-        graph_builder.add_node(TopicManagerRoutes.PRE_PROCESSING_AGENT, self.pre_processing_agent)
-        graph_builder.add_node(TopicManagerRoutes.TOPIC_CHANGE_CHECKER_AGENT, self.topic_change_checker_agent)
-        graph_builder.add_node(TopicManagerRoutes.PRE_TOPICS_AGENT, self.pre_topics_checker_agent)
-        graph_builder.add_node(TopicManagerRoutes.NEW_TOPIC_AGENT, self.new_topic_agent)
-        graph_builder.add_node(TopicManagerRoutes.ROUTER_AGENT, self.router_agent)
-        graph_builder.add_node(TopicManagerRoutes.POST_PROCESSING_AGENT, self.post_processing_agent)
+        # Every node is wrapped so its latency is exported under its route key.
+        for route, agent in (
+            (TopicManagerRoutes.PRE_PROCESSING_AGENT, self.pre_processing_agent),
+            (TopicManagerRoutes.TOPIC_CHANGE_CHECKER_AGENT, self.topic_change_checker_agent),
+            (TopicManagerRoutes.PRE_TOPICS_AGENT, self.pre_topics_checker_agent),
+            (TopicManagerRoutes.NEW_TOPIC_AGENT, self.new_topic_agent),
+            (TopicManagerRoutes.ROUTER_AGENT, self.router_agent),
+            (TopicManagerRoutes.POST_PROCESSING_AGENT, self.post_processing_agent),
+        ):
+            graph_builder.add_node(route, instrument_node(f"topic_master.{route}", agent))
 
         # ---------------------- Linear Edge(s) ----------------------------------------
         graph_builder.add_edge(TopicManagerRoutes.START, TopicManagerRoutes.PRE_PROCESSING_AGENT)
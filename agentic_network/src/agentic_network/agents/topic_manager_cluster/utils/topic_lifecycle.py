@@ -0,0 +1,109 @@
+from os import getenv
+from typing import Optional
+
+from agentic_network.agents.topic_manager_cluster.core import TopicManagerState, ReplaceTopics
+from agentic_network.agents.topic_manager_cluster.core.topic_manager_state import TopicState
+from agentic_network.agents.topic_manager_cluster.utils.topic_manager_util import _content_str
+from monitoring.agent_metrics import topic_stack_depth, topic_disclosed_count, topic_transitions_total
+
+
+class TopicLifecycle:
+    """
+    Keeps a session's topics bounded. Run once per turn, after the current topic got the user's message:
+
+      1. topics other than the current one are disclosed when completed (the ToolsAgent completes the current
+         topic once a task-finishing tool succeeds) or idle for `idle_turns` turns
+      2. while more than `max_open` topics are open, the least recently active one is disclosed
+      3. disclosed topics are compacted to a short summary plus their last `keep_messages` messages; the summary is
+         shown before the kept messages wherever the topic is read (format_topic_dialog, format_topic_summary)
+      4. while the session holds more than `max_live` topics, the least recently active disclosed one is dropped
+
+    The current topic is never disclosed, and disclosed topics can still be resurfaced until dropped.
+    Configured by TOPIC_IDLE_TURNS, TOPIC_MAX_OPEN, TOPIC_MAX_LIVE, TOPIC_DISCLOSED_MESSAGES and TOPIC_SUMMARY_CHARS.
+    """
+
+    def __init__(
+        self,
+        idle_turns: Optional[int] = None,
+        max_open: Optional[int] = None,
+        max_live: Optional[int] = None,
+        keep_messages: Optional[int] = None,
+        summary_chars: Optional[int] = None,
+    ):
+        self.idle_turns = idle_turns or int(getenv("TOPIC_IDLE_TURNS", "10").strip())
+        self.max_open = max(max_open or int(getenv("TOPIC_MAX_OPEN", "5").strip()), 1)
+        self.max_live = max(max_live or int(getenv("TOPIC_MAX_LIVE", "20").strip()), self.max_open)
+        self.keep_messages = keep_messages if keep_messages is not None \
+            else int(getenv("TOPIC_DISCLOSED_MESSAGES", "2").strip())
+        self.summary_chars = summary_chars or int(getenv("TOPIC_SUMMARY_CHARS", "300").strip())
+
+        self._stack_depth = topic_stack_depth.labels()
+        self._disclosed_count = topic_disclosed_count.labels()
+        self._transitions = {reason: topic_transitions_total.labels(reason)
+                             for reason in ("completed", "idle", "evicted", "dropped")}
+
+    # ---- Public API ----
+
+    def advance(self, state: TopicManagerState) -> dict:
+        """
+        State patch closing the turn: the turn counter, the topic stack (the current topic's `last_turn` is
+        updated) and, when any topic was disclosed or dropped, the disclosed list. Topics are not mutated in place.
+        """
+        turn = state.get("turn", 0) + 1
+        stack = list(state.get("topic_stack") or [])
+        disclosed = list(state.get("disclosed_topics") or [])
+        if stack:
+            stack[-1] = {**stack[-1], "last_turn": turn}
+        changed = False
+
+        for topic in stack[:-1]:
+            reason = self._disclose_reason(topic, turn)
+            if reason:
+                stack.remove(topic)
+                disclosed.append(self._compact(topic))
+                self._transitions[reason].inc()
+                changed = True
+
+        while len(stack) > self.max_open:
+            topic = min(stack[:-1], key=self._last_turn)
+            stack.remove(topic)
+            disclosed.append(self._compact(topic))
+            self._transitions["evicted"].inc()
+            changed = True
+
+        while disclosed and len(stack) + len(disclosed) > self.max_live:
+            disclosed.remove(min(disclosed, key=self._last_turn))
+            self._transitions["dropped"].inc()
+            changed = True
+
+        self._stack_depth.observe(len(stack))
+        self._disclosed_count.observe(len(disclosed))
+
+        patch: dict = {"turn": turn, "topic_stack": ReplaceTopics(stack)}
+        if changed:
+            patch["disclosed_topics"] = ReplaceTopics(disclosed)
+        return patch
+
+    # ---------- helpers ----------
+
+    def _disclose_reason(self, topic: TopicState, turn: int) -> Optional[str]:
+        if topic.get("completed"):
+            return "completed"
+        if turn - self._last_turn(topic) >= self.idle_turns:
+            return "idle"
+        return None
+
+    @staticmethod
+    def _last_turn(topic: TopicState) -> int:
+        return topic.get("last_turn", 0)
+
+    def _compact(self, topic: TopicState) -> TopicState:
+        """The topic with its opening request as summary and only its latest messages."""
+        messages = topic.get("messages") or []
+        summary = topic.get("summary")
+        if summary is None:
+            opening = _content_str(messages[0]) if messages else ""
+            summary = opening if len(opening) <= self.summary_chars else opening[:self.summary_chars] + "..."
+
+        kept = messages[-self.keep_messages:] if self.keep_messages else []
+        return {**topic, "messages": list(kept), "summary": summary}
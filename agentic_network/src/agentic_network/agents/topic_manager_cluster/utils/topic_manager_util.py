@@ -4,7 +4,7 @@ from uuid import uuid4
 from agentic_network.agents import AgentData
 from agentic_network.agents.topic_manager_cluster.core.topic_manager_state import TopicState
 from agentic_network.core import AgentState
-from agentic_network.agents.topic_manager_cluster.core import TopicManagerState
+from agentic_network.agents.topic_manager_cluster.core import TopicManagerState, ReplaceTopics
 from langchain_core.messages import (
     AnyMessage,
     HumanMessage,
@@ -102,8 +102,36 @@ def disclose_current_topic(state: AgentState) -> AgentState:
     new_disclosed = disclosed + [topic]
 
     return {
-        "topic_stack": new_stack,
-        "disclosed_topics": new_disclosed,
+        "topic_stack": ReplaceTopics(new_stack),
+        "disclosed_topics": ReplaceTopics(new_disclosed),
+    }
+
+
+def complete_topic(state: TopicManagerState, topic_id: str) -> dict:
+    """
+    Mark an open topic as done; the lifecycle discloses it once another topic is current.
+    Returns a patch (no in-place mutation); no-op if the topic is not on the stack.
+    """
+    stack = list(state.get("topic_stack") or [])
+    idx = find_topic_index(topic_id, stack)
+    if idx == -1: return {}
+
+    stack[idx] = {**stack[idx], "completed": True}
+    return {
+        "topic_stack": ReplaceTopics(stack),
+    }
+
+
+def complete_current_topic(state: AgentState) -> dict:
+    """
+    AgentState patch marking the topic master's current topic as done, e.g. once a domain agent's task
+    succeeded. No-op if there is no current topic.
+    """
+    topic_state = state.get("topic_master_state")
+    if not topic_state or not topic_state.get("topic_stack"): return {}
+
+    return {
+        "topic_master_state": {**topic_state, **complete_topic(topic_state, get_current_topic(topic_state)["id"])},
     }
 
 
@@ -123,18 +151,18 @@ def resurface_topic(state: TopicManagerState, topic_id: str) -> dict:
         new_stack = topic_stack[:idx] + topic_stack[idx + 1:] + [topic]
 
         return {
-            "topic_stack": new_stack
+            "topic_stack": ReplaceTopics(new_stack)
         }
 
     # 2) Else try disclosed: remove from disclosed and push onto stack
     d_idx = find_topic_index(topic_id, disclosed)
     if d_idx != -1:
-        topic = disclosed[d_idx]
+        topic = {**disclosed[d_idx], "completed": False}
         new_disclosed = disclosed[:d_idx] + disclosed[d_idx + 1:]
         new_stack = topic_stack + [topic]
         return {
-            "topic_stack": new_stack,
-            "disclosed_topics": new_disclosed,
+            "topic_stack": ReplaceTopics(new_stack),
+            "disclosed_topics": ReplaceTopics(new_disclosed),
         }
 
     # 3) Not found anywhere → no-op
@@ -213,6 +241,14 @@ def format_dialog_with_topics(messages: Iterable[AnyMessage]) -> str:
     return "\n".join(lines)
 
 
+def format_topic_summary(topic: TopicState) -> str:
+    """A compacted (disclosed) topic as dialog lines: its summary, then the messages it kept."""
+    lines = [f"[topic:{topic['id']}] summary ({topic.get('agent')}): {topic.get('summary', '')}"]
+    if topic.get("messages"):
+        lines.append(format_dialog_with_topics(topic["messages"]))
+    return "\n".join(lines)
+
+
 def format_dialog_to_json(messages: Iterable[AnyMessage]) -> list:
     return [format_message_to_json(message) for message in messages]
 
@@ -226,6 +262,17 @@ def format_dialog(messages: Iterable[AnyMessage]) -> str:
     return "\n".join(f"{_role_of(m)}: {_content_str(m)}" for m in messages)
 
 
+def format_topic_dialog(topic: TopicState, messages: Iterable[AnyMessage] = ()) -> str:
+    """
+    A topic's dialog without topic IDs, followed by `messages`. A compacted topic only kept its latest
+    messages, so its summary (the opening request) comes first.
+    """
+    dialog = format_dialog(list(topic.get("messages") or []) + list(messages))
+    if topic.get("summary"):
+        return f"summary (earlier in this topic): {topic['summary']}\n{dialog}"
+    return dialog
+
+
 # def redirect_to_appointment_agent(agent_state: AgentState):
 #     get_current_topic(agent_state)["agent"] = GraphRoutes.APPOINTMENT_AGENT
 
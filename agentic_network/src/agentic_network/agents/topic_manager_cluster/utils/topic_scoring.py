@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from typing import Iterable, Optional
+import math, re, zlib
+
+import numpy as np
+from langchain_core.messages import AnyMessage
+
+from agentic_network.agents.topic_manager_cluster.core.topic_manager_state import TopicState
+
+EMBEDDING_DIM = 1024
+# Recent messages of a topic that make up its summary; older ones rarely decide attribution.
+SUMMARY_MESSAGES = 8
+MAX_CACHED_TOPICS = 10_000
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+# ----- Embedding -----
+def embed_text(text: str, dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """
+    Hashed bag of words: each word (and word bigram) adds ±(1 + log tf) to a crc32 bucket; L2-normalized.
+    No model and no vocabulary, so it costs microseconds and works for any language.
+    """
+    words = _WORD.findall(text.lower())
+    counts: dict[str, int] = {}
+    for token in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+        counts[token] = counts.get(token, 0) + 1
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for token, count in counts.items():
+        h = zlib.crc32(token.encode("utf-8"))
+        vector[h % dim] += (1.0 + math.log(count)) * (1.0 if h & 0x80000000 else -1.0)
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def topic_summary(topic: TopicState) -> str:
+    messages: list[AnyMessage] = (topic.get("messages") or [])[-SUMMARY_MESSAGES:]
+    parts = [str(topic.get("agent") or ""), topic.get("summary", "")]
+    parts.extend(m.content if isinstance(m.content, str) else str(m.content) for m in messages)
+    return "\n".join(parts)
+
+
+class TopicEmbeddingCache:
+    """Topic id -> embedding of its summary, recomputed only when the topic got new messages or was compacted."""
+
+    def __init__(self, max_topics: int = MAX_CACHED_TOPICS):
+        self.max_topics = max_topics
+        self._entries: OrderedDict[str, tuple[tuple, np.ndarray]] = OrderedDict()
+
+    def get(self, topic: TopicState) -> np.ndarray:
+        topic_id, version = topic["id"], (len(topic.get("messages") or []), topic.get("summary"))
+        entry = self._entries.get(topic_id)
+        if entry is None or entry[0] != version:
+            entry = (version, embed_text(topic_summary(topic)))
+            self._entries[topic_id] = entry
+            if len(self._entries) > self.max_topics:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(topic_id)
+        return entry[1]
+
+
+topic_embeddings = TopicEmbeddingCache()
+
+
+# ----- Scoring -----
+def rank_topics(message: str, topics: Iterable[TopicState], k: Optional[int] = None,
+                cache: TopicEmbeddingCache = topic_embeddings) -> list[tuple[TopicState, float]]:
+    """Topics by cosine similarity to `message`, best first; only the top `k` when given."""
+    topics = list(topics)
+    if not topics:
+        return []
+
+    # One matrix-vector product scores every open topic at once.
+    matrix = np.stack([cache.get(topic) for topic in topics])
+    scores = matrix @ embed_text(message)
+
+    if k is not None and k < len(topics):
+        best = np.argpartition(-scores, k - 1)[:k]
+    else:
+        best = np.arange(len(topics))
+    best = best[np.argsort(-scores[best], kind="stable")]
+    return [(topics[i], float(scores[i])) for i in best]
@@ -1,5 +1,9 @@
 # from .custom_react_parser import CustomReActParser
 # from .custom_react_agent import create_custom_react_agent
-# from .tokenizer import count_messages
+from .tokenizer import count_messages
 from .base_agent import BaseAgent
 from .base_utils import get_class_variable_fields, get_class_field_values
+from .request_context import RequestContext, RequestCancelled, request_scope, current_request, check_deadline, with_deadline
+from .tool_executor import ToolExecutor
+from .context_compactor import ContextCompactor, CompactionResult
+from .tool_selector import ToolSelector
\ No newline at end of file
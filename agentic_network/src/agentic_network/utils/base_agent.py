@@ -1,11 +1,20 @@
 from __future__ import annotations
 from abc import abstractmethod
 from typing import TypedDict
+import inspect
+
+from agentic_network.utils.request_context import check_deadline
 
 
 class BaseAgent:
-    def __call__(self, agent_state: TypedDict) -> dict:
-        return self._get_node(agent_state)
+    async def __call__(self, agent_state: TypedDict) -> dict:
+        # Do not start a new node once the turn's deadline has passed.
+        check_deadline()
+
+        result = self._get_node(agent_state)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
 
     @abstractmethod
     def _get_node(self, agent_state: TypedDict) -> dict:
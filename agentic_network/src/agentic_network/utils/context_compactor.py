@@ -0,0 +1,156 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from os import getenv
+from typing import Optional, Sequence
+import json
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from loguru import logger
+
+from agentic_network.utils.tokenizer import count_message, count_messages, count_text
+from monitoring.agent_metrics import context_prompt_tokens, context_tokens_saved_total
+
+
+@dataclass
+class CompactionResult:
+    messages: list[BaseMessage]
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+class ContextCompactor:
+    """
+    Shrinks a domain agent's history before each model call. The conversation in the state is left
+    untouched; only the prompt is compacted, in three steps:
+
+      1. superseded tool results (the same call made again later, or a failed call retried, successfully) are
+         replaced by a stub
+      2. tool observations older than the current turn, beyond the newest `keep_observations`, are summarized
+         to about `observation_tokens` tokens
+      3. while the prompt is over `max_tokens`, the oldest whole turns are dropped (never the current one)
+
+    Tool messages are shortened but never removed on their own, so every tool call keeps its answer.
+    Configured per agent by {LABEL}_CONTEXT_TOKEN_BUDGET, CONTEXT_KEEP_OBSERVATIONS and CONTEXT_OBSERVATION_TOKENS.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        max_tokens: Optional[int] = None,
+        keep_observations: Optional[int] = None,
+        observation_tokens: Optional[int] = None,
+    ):
+        self.label = label
+        self.max_tokens = max_tokens or int(getenv(f"{label.upper()}_CONTEXT_TOKEN_BUDGET", "8000").strip())
+        self.keep_observations = keep_observations if keep_observations is not None \
+            else int(getenv("CONTEXT_KEEP_OBSERVATIONS", "2").strip())
+        self.observation_tokens = observation_tokens or int(getenv("CONTEXT_OBSERVATION_TOKENS", "200").strip())
+
+        self._saved = context_tokens_saved_total.labels(label)
+        self._prompt_tokens = context_prompt_tokens.labels(label)
+
+    # ---- Public API ----
+
+    def compact(self, messages: Sequence[BaseMessage], system: Sequence[BaseMessage] = ()) -> CompactionResult:
+        """Compacted copy of `messages`; `system` only counts towards the budget."""
+        system_tokens = count_messages(list(system))
+        messages = list(messages)
+        # Every message is tokenized once; a step that replaces a message only recounts that one.
+        tokens = [count_message(m) for m in messages]
+        tokens_before = system_tokens + sum(tokens)
+
+        current_turn = self._current_turn_start(messages)
+        compacted = self._stub_superseded(messages)
+        compacted = self._summarize_old_observations(compacted, current_turn)
+        tokens = [count if new is old else count_message(new) for old, new, count in zip(messages, compacted, tokens)]
+        start = self._budget_start(compacted, tokens, system_tokens)
+
+        result = CompactionResult(compacted[start:], tokens_before, system_tokens + sum(tokens[start:]))
+        self._saved.inc(result.tokens_saved)
+        self._prompt_tokens.observe(result.tokens_after)
+        if result.tokens_saved:
+            logger.debug(f"[{self.label}] context {result.tokens_before} -> {result.tokens_after} tokens "
+                         f"({result.tokens_saved} saved)")
+        return result
+
+    # ---------- helpers ----------
+
+    @staticmethod
+    def _current_turn_start(messages: list[BaseMessage]) -> int:
+        for index in range(len(messages) - 1, -1, -1):
+            if isinstance(messages[index], HumanMessage):
+                return index
+        return 0
+
+    @staticmethod
+    def _stub_superseded(messages: list[BaseMessage]) -> list[BaseMessage]:
+        calls = {}
+        for message in messages:
+            if isinstance(message, AIMessage):
+                for call in message.tool_calls:
+                    calls[call["id"]] = (call["name"], json.dumps(call.get("args"), sort_keys=True, default=str))
+
+        # Walk backwards: a result is superseded by a later successful one of the same call, or, if it failed,
+        # of the same tool. A later failure supersedes nothing: the earlier result may be the only good one.
+        seen_calls, seen_tools = set(), set()
+        compacted = list(messages)
+        for index in range(len(messages) - 1, -1, -1):
+            message = messages[index]
+            if not isinstance(message, ToolMessage):
+                continue
+            call = calls.get(message.tool_call_id, (message.name, None))
+            superseded = (call[1] is not None and call in seen_calls) or \
+                (message.status == "error" and call[0] in seen_tools)
+            if superseded:
+                compacted[index] = message.model_copy(update={"content": f"[superseded by a later {call[0]} result]"})
+            if message.status == "success":
+                seen_calls.add(call)
+                seen_tools.add(call[0])
+        return compacted
+
+    def _summarize_old_observations(self, messages: list[BaseMessage], current_turn: int) -> list[BaseMessage]:
+        observations = [i for i, m in enumerate(messages[:current_turn]) if isinstance(m, ToolMessage)]
+        old = observations[:-self.keep_observations] if self.keep_observations else observations
+
+        compacted = list(messages)
+        for index in old:
+            content = str(compacted[index].content)
+            if count_text(content) > self.observation_tokens:
+                compacted[index] = compacted[index].model_copy(update={"content": self._summarize(content)})
+        return compacted
+
+    def _summarize(self, content: str) -> str:
+        """Short stand-in for a long observation: the shape of JSON results, else the beginning of the text."""
+        # ~4 characters per token is close enough for a cap; the budget step counts exactly.
+        max_chars = self.observation_tokens * 4
+        try:
+            value = json.loads(content)
+        except ValueError:
+            value = None
+
+        if isinstance(value, list):
+            head = json.dumps(value[:3], ensure_ascii=False, default=str)[:max_chars]
+            return f"[summarized: {len(value)} items, first ones: {head}]"
+        if isinstance(value, dict):
+            head = json.dumps(value, ensure_ascii=False, default=str)[:max_chars]
+            return f"[summarized: object with keys {', '.join(map(str, value))}: {head}...]"
+        return f"{content[:max_chars]}... [truncated {len(content) - max_chars} characters]"
+
+    def _budget_start(self, messages: list[BaseMessage], tokens: list[int], system_tokens: int) -> int:
+        """Index of the first message kept so the prompt fits the budget (`tokens` holds each message's count)."""
+        # Whole turns (a user message up to the next one) go together, so tool calls keep their results.
+        turn_starts = [i for i, m in enumerate(messages) if isinstance(m, HumanMessage)]
+        total = system_tokens + sum(tokens)
+        start = 0
+
+        for next_start in turn_starts[1:]:
+            if total <= self.max_tokens:
+                break
+            total -= sum(tokens[start:next_start])
+            start = next_start
+
+        return start
@@ -0,0 +1,81 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+import asyncio, time
+
+T = TypeVar("T")
+
+
+class RequestCancelled(Exception):
+    """The turn ran past its deadline; remaining work should be abandoned."""
+
+
+class RequestContext:
+    """Per-request deadline, visible to every node, LLM call and tool call of the turn."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout if timeout else None
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline is None: return None
+        return self.deadline - time.monotonic()
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def check(self) -> None:
+        if self.expired():
+            raise RequestCancelled(f"Request deadline exceeded after {time.monotonic() - self.started:.1f}s")
+
+
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar("current_request", default=None)
+
+
+def current_request() -> Optional[RequestContext]:
+    return _current_request.get()
+
+
+@contextmanager
+def request_scope(timeout: Optional[float] = None) -> Iterator[RequestContext]:
+    """
+    Bind a deadline to the current task. Tasks spawned inside the scope (LangGraph nodes)
+    copy the context and therefore inherit it.
+    """
+    ctx = RequestContext(timeout)
+    token = _current_request.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current_request.reset(token)
+
+
+def check_deadline() -> None:
+    ctx = _current_request.get()
+    if ctx is not None:
+        ctx.check()
+
+
+async def with_deadline(awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Await `awaitable`, cancelling it once the request deadline (or the tighter `timeout`) passes.
+    Cancellation aborts the in-flight HTTP/SSE call underneath.
+    """
+    ctx = _current_request.get()
+    remaining = ctx.remaining() if ctx is not None else None
+    if timeout is not None:
+        remaining = timeout if remaining is None else min(remaining, timeout)
+
+    if remaining is None:
+        return await awaitable
+
+    if remaining <= 0:
+        if asyncio.iscoroutine(awaitable): awaitable.close()
+        raise RequestCancelled("Request deadline exceeded")
+
+    try:
+        return await asyncio.wait_for(awaitable, remaining)
+    except asyncio.TimeoutError as e:
+        raise RequestCancelled("Request deadline exceeded") from e
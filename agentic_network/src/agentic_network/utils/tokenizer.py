@@ -1,7 +1,14 @@
+from functools import lru_cache
+import json
+
 import tiktoken
 from langchain_core.messages import BaseMessage
 
-ENC = tiktoken.get_encoding("o200k_base")
+
+@lru_cache(maxsize=1)
+def _encoding():
+    # Loaded on first count rather than at import (the first load may download the BPE file).
+    return tiktoken.get_encoding("o200k_base")
 
 
 def _msg_text(m: BaseMessage) -> str:
@@ -15,13 +22,23 @@ def _msg_text(m: BaseMessage) -> str:
                 parts.append(p)
             else:
                 parts.append(str(p))
-        return "\n".join(parts)
+        c = "\n".join(parts)
+
+    # Tool call arguments are sent to the model too.
+    tool_calls = getattr(m, "tool_calls", None)
+    if tool_calls:
+        c = (c or "") + "\n" + json.dumps([{"name": t["name"], "args": t.get("args")} for t in tool_calls],
+                                          ensure_ascii=False, default=str)
     return c or ""
 
 
 def count_text(s: str) -> int:
-    return len(ENC.encode(s or ""))
+    return len(_encoding().encode(s or ""))
+
+
+def count_message(m: BaseMessage) -> int:
+    return count_text(_msg_text(m))
 
 
 def count_messages(msgs: list[BaseMessage]) -> int:
-    return sum(count_text(_msg_text(m)) for m in msgs)
+    return sum(count_message(m) for m in msgs)
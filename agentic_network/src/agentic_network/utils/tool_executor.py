@@ -0,0 +1,110 @@
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, Callable, Iterable, Optional
+import asyncio, json, time
+
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool, ToolException
+from pydantic import ValidationError
+
+from agentic_network.utils.request_context import RequestCancelled, current_request, with_deadline
+from agentic_network.utils.tool_schema import ArgsValidator
+from monitoring.agent_metrics import mcp_tool_calls_total, mcp_tool_duration_seconds
+
+ErrorFormatter = Callable[[str, str, Any], str]
+
+
+def _default_error(tool_name: str, msg: str, args: Any) -> str:
+    return f"Tool Execution Error ({tool_name}): {msg}"
+
+
+class ToolExecutor:
+    """
+    Runs the tool calls of one model turn concurrently.
+
+    - independent calls are awaited together with asyncio.gather
+    - at most `per_tool_limit` calls of the same tool run at once
+    - each call is bounded by `call_timeout` (and always by the request deadline)
+    - arguments are checked by the tool's validator (if any) before the call leaves the process
+    - failures become error observations; results keep the order of the calls
+    """
+
+    def __init__(
+        self,
+        tools: Iterable[BaseTool],
+        per_tool_limit: int = 4,
+        call_timeout: Optional[float] = None,
+        format_error: ErrorFormatter = _default_error,
+        validators: Optional[dict[str, ArgsValidator]] = None,
+    ):
+        self.tools_by_name = {t.name: t for t in tools}
+        self.validators = validators or {}
+        self.call_timeout = call_timeout
+        self.format_error = format_error
+        self._limits: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(per_tool_limit))
+
+    # ---- Public API ----
+
+    def set_tools(self, tools: Iterable[BaseTool], validators: Optional[dict[str, ArgsValidator]] = None) -> None:
+        """Swap the toolset (e.g. after an MCP manifest refresh); per-tool limits are kept."""
+        self.tools_by_name = {t.name: t for t in tools}
+        self.validators = validators or {}
+
+    async def run(self, tool_calls: list[dict]) -> list[ToolMessage]:
+        """Execute `AIMessage.tool_calls`, returning one ToolMessage per call in the same order."""
+        results = await asyncio.gather(*(self.invoke(call["name"], call.get("args")) for call in tool_calls))
+
+        return [
+            ToolMessage(
+                content=observation,
+                tool_call_id=call["id"],
+                name=call["name"],
+                status="success" if ok else "error",
+            )
+            for call, (observation, ok) in zip(tool_calls, results)
+        ]
+
+    async def invoke(self, tool_name: str, args: Any) -> tuple[str, bool]:
+        """Run a single call; returns (observation, ok). Only an expired request deadline propagates."""
+        tool = self.tools_by_name.get(tool_name)
+        if tool is None:
+            return self.format_error(tool_name or "(missing)", "Tool not found.", args), False
+
+        validator = self.validators.get(tool_name)
+        problem = validator(args) if validator is not None else None
+        if problem:
+            # Rejected locally: no MCP round-trip for a call the server would refuse anyway.
+            mcp_tool_calls_total.labels(tool_name, "invalid").inc()
+            return self.format_error(tool_name, f"Invalid arguments: {problem}", args), False
+
+        async with self._limits[tool_name]:
+            outcome = "error"
+            started = time.perf_counter()
+            try:
+                result = await with_deadline(tool.ainvoke(args), self.call_timeout)
+                observation = result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
+                outcome = "ok"
+                return observation, True
+
+            except RequestCancelled:
+                request = current_request()
+                if request is not None and request.expired():
+                    # Abandon the turn instead of feeding a timeout back to the LLM.
+                    outcome = "cancelled"
+                    raise
+                outcome = "timeout"
+                return self.format_error(tool_name, f"Tool call timed out after {self.call_timeout}s", args), False
+
+            except ToolException as e:
+                return self.format_error(tool_name, str(e), args), False
+
+            except ValidationError as e:
+                # Common case: missing or wrong-typed args
+                return self.format_error(tool_name, f"ValidationError: {e}", args), False
+
+            except Exception as e:
+                return self.format_error(tool_name, f"{type(e).__name__}: {e}", args), False
+
+            finally:
+                mcp_tool_duration_seconds.labels(tool_name).observe(time.perf_counter() - started)
+                mcp_tool_calls_total.labels(tool_name, outcome).inc()
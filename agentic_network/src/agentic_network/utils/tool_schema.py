@@ -0,0 +1,148 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional
+
+# Returns None for valid arguments, otherwise a message the LLM can act on.
+ArgsValidator = Callable[[Any], Optional[str]]
+
+
+def _is_int(value) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, str) and value.strip().lstrip("+-").isdigit()
+
+
+def _is_number(value) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    if isinstance(value, str):
+        try:
+            float(value)
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+# The MCP servers validate with pydantic in lax mode ("5" is a valid integer), so the checks here
+# accept the same values: rejecting something the server would take costs an extra LLM step.
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": _is_int,
+    "number": _is_number,
+    "boolean": lambda v: isinstance(v, bool) or (isinstance(v, str) and v.lower() in ("true", "false")),
+    "array": lambda v: isinstance(v, (list, tuple)),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+# ---- Public API ----
+
+def tool_args_schema(tool) -> Optional[dict]:
+    """JSON schema of a tool's arguments: MCP proxies carry it as a dict, LangChain tools as a pydantic model."""
+    args_schema = getattr(tool, "args_schema", None)
+    if isinstance(args_schema, dict):
+        return args_schema
+    if args_schema is not None and hasattr(args_schema, "model_json_schema"):
+        return args_schema.model_json_schema()
+
+    input_schema = getattr(tool, "input_schema", None)
+    return input_schema if isinstance(input_schema, dict) else None
+
+
+def compile_validator(schema: Optional[dict]) -> ArgsValidator:
+    """
+    Check arguments against the schema's top level: required keys, unknown keys (when
+    additionalProperties is false), property types and enums. Nested objects and $refs are left to the server.
+    """
+    schema = schema or {}
+    required = tuple(schema.get("required") or ())
+    properties = schema.get("properties") or {}
+    allow_extra = schema.get("additionalProperties", True) is not False
+    checks = {name: check for name, meta in properties.items() if (check := _compile_property(meta)) is not None}
+
+    def validate(args: Any) -> Optional[str]:
+        if args is None:
+            args = {}
+        if not isinstance(args, dict):
+            return f"Tool input must be a JSON object (key/value), got {type(args).__name__}"
+
+        problems = []
+        missing = [name for name in required if name not in args]
+        if missing:
+            problems.append(f"missing required argument(s): {', '.join(missing)}")
+        if not allow_extra:
+            unknown = [name for name in args if name not in properties]
+            if unknown:
+                problems.append(f"unknown argument(s): {', '.join(unknown)}")
+        for name, value in args.items():
+            check = checks.get(name)
+            if check is not None and (problem := check(value)):
+                problems.append(f"'{name}' {problem}")
+        return "; ".join(problems) or None
+
+    return validate
+
+
+def summarize_schema(schema: Optional[dict]) -> str:
+    """One line per argument: "- name (type) [required]"."""
+    if not schema or not schema.get("properties"):
+        return "(no argument schema available)"
+
+    required = set(schema.get("required") or ())
+    return "\n".join(
+        f"- {name} ({_type_name(meta)}){' [required]' if name in required else ''}"
+        for name, meta in schema["properties"].items()
+    )
+
+
+# ---------- helpers ----------
+
+def _allowed_types(meta: dict) -> Optional[list[str]]:
+    """JSON types a property accepts, or None when the schema does not restrict them simply."""
+    if "type" in meta:
+        types = meta["type"] if isinstance(meta["type"], list) else [meta["type"]]
+        return types if all(t in _TYPE_CHECKS for t in types) else None
+
+    variants = meta.get("anyOf") or meta.get("oneOf")
+    if variants:
+        types = []
+        for variant in variants:
+            variant_types = _allowed_types(variant)
+            if variant_types is None:
+                return None
+            types.extend(variant_types)
+        return types
+    return None
+
+
+def _compile_property(meta: dict) -> Optional[Callable[[Any], Optional[str]]]:
+    types = _allowed_types(meta)
+    enum = meta.get("enum")
+    if types is None and enum is None:
+        return None
+
+    type_checks = [_TYPE_CHECKS[t] for t in types] if types else []
+    expected = " or ".join(types) if types else ""
+
+    def check(value) -> Optional[str]:
+        if type_checks and not any(type_check(value) for type_check in type_checks):
+            return f"must be {expected}, got {type(value).__name__}"
+        if enum is not None and value not in enum:
+            return f"must be one of {enum}"
+        return None
+
+    return check
+
+
+def _type_name(meta: dict) -> str:
+    types = _allowed_types(meta)
+    if types:
+        return " | ".join(types)
+    return meta.get("type") or "any"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Iterable, Optional, Sequence
+import re
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.tools import BaseTool
+
+from monitoring.agent_metrics import llm_bound_tools
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Same folding as the appointment store's search index (normalize_term): Python's str.lower() maps "İ" to
+# "i" + combining dot and "I" to "i", Turkish wants "i" and "ı"; then Turkish letters are folded to ASCII.
+_TURKISH_UPPER = str.maketrans({"İ": "i", "I": "ı"})
+_ASCII_FOLD = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+
+
+def fold_turkish(text: str) -> str:
+    """Turkish-aware lowercase, ASCII folded: "İLK", "ilk" and "Ilk" all give "ilk"."""
+    return text.translate(_TURKISH_UPPER).lower().translate(_ASCII_FOLD)
+
+
+class ToolSelector:
+    """
+    Binds only the tools relevant to the current step of a domain agent, instead of its whole toolset.
+
+    A tool is bound when the user's messages of the current and the previous `history_turns` turns hit
+    one of its keywords (the `keywords` given per tool, plus the parts of its name no other tool shares,
+    matched by prefix after Turkish case folding so suffixes still match), when it was already called in
+    this turn, when it is one of the `always` bound tools, or when a selected tool `requires` it, directly
+    or through other tools. If no keyword matches, every tool is bound. Models bound to a tool subset are
+    cached, so a subset is only bound once.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        model: BaseChatModel,
+        tools: Sequence[BaseTool],
+        keywords: Optional[dict[str, Iterable[str]]] = None,
+        requires: Optional[dict[str, Iterable[str]]] = None,
+        always: Iterable[str] = (),
+        history_turns: int = 1,
+        cache_size: int = 64,
+    ):
+        self.label = label
+        self.model = model
+        self.tools_by_name = {t.name: t for t in tools}
+        self.requires = {name: tuple(deps) for name, deps in (requires or {}).items()}
+        self.always = frozenset(always)
+        self.history_turns = history_turns
+        self.cache_size = cache_size
+        self._bound: OrderedDict[frozenset, object] = OrderedDict()
+        self._bound_tools = llm_bound_tools.labels(label)
+
+        keywords = keywords or {}
+        self._keywords = {
+            name: tuple(self._name_keywords(name) | {fold_turkish(k) for k in keywords.get(name, ())})
+            for name in self.tools_by_name
+        }
+
+    # ---- Public API ----
+
+    def select(self, messages: Sequence[BaseMessage]) -> frozenset:
+        """Names of the tools to bind for the next model call of this turn."""
+        turn = self._current_turn(messages)
+        words = [fold_turkish(w) for m in self._recent_user_messages(messages)
+                 for w in _WORD.findall(str(m.content))]
+
+        selected = {
+            name for name, keywords in self._keywords.items()
+            if any(word.startswith(keyword) for keyword in keywords for word in words)
+        }
+        if not selected:
+            return frozenset(self.tools_by_name)
+
+        selected |= {call["name"] for m in turn if isinstance(m, AIMessage) for call in m.tool_calls}
+        selected |= self.always
+        return frozenset(name for name in self._with_requirements(selected) if name in self.tools_by_name)
+
+    def model_for(self, messages: Sequence[BaseMessage]):
+        """The model bound to the tools selected for `messages`."""
+        names = self.select(messages)
+        self._bound_tools.observe(len(names))
+
+        model = self._bound.get(names)
+        if model is None:
+            model = self.model.bind_tools([self.tools_by_name[name] for name in sorted(names)])
+            self._bound[names] = model
+            if len(self._bound) > self.cache_size:
+                self._bound.popitem(last=False)
+        else:
+            self._bound.move_to_end(names)
+        return model
+
+    # ---------- helpers ----------
+
+    def _name_keywords(self, name: str) -> set[str]:
+        """Parts of a tool's name that no other tool's name shares ("appointment" would pick every write tool)."""
+        others = {fold_turkish(part) for other in self.tools_by_name if other != name for part in other.split("_")}
+        return {
+            part for part in (fold_turkish(p) for p in name.split("_") if len(p) > 3)
+            if not any(other.startswith(part) or part.startswith(other) for other in others if len(other) > 3)
+        }
+
+    def _with_requirements(self, selected: set[str]) -> set[str]:
+        """`selected` plus everything it requires, transitively."""
+        pending, closure = list(selected), set(selected)
+        while pending:
+            for dep in self.requires.get(pending.pop(), ()):
+                if dep not in closure:
+                    closure.add(dep)
+                    pending.append(dep)
+        return closure
+
+    def _recent_user_messages(self, messages: Sequence[BaseMessage]) -> list[BaseMessage]:
+        """The user's messages of the current turn and the `history_turns` before it (a reply like "yes" or
+        "Ankara Şehir Hastanesi olsun" continues the request of the previous turn)."""
+        user_messages = [m for m in messages if isinstance(m, HumanMessage)]
+        return user_messages[-(self.history_turns + 1):]
+
+    @staticmethod
+    def _current_turn(messages: Sequence[BaseMessage]) -> Sequence[BaseMessage]:
+        for index in range(len(messages) - 1, -1, -1):
+            if isinstance(messages[index], HumanMessage):
+                return messages[index:]
+        return messages
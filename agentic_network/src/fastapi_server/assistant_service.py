@@ -2,48 +2,77 @@ from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.agents import AgentFinish
 from fastapi import HTTPException
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+from collections import OrderedDict
 import uuid, asyncio
 
-from agentic_network.agent_graph import AgentGraph
 from agentic_network.core import AgentState
-from mcp_client.util import mcp_client
+from agentic_network.utils import RequestCancelled, request_scope, with_deadline
+from mcp_client import appointment_mcp, diagnosis_mcp
+from monitoring import EventLoopLagMonitor
+from monitoring.agent_metrics import session_cache_size, session_cache_evictions_total
 
 
 class AssistantService:
     """
     Encapsulates:
-      - MCP initialization
+      - MCP initialization (cached tool manifests, background discovery)
       - Graph building/compilation (with checkpointer)
       - Idempotency cache (dev)
       - Invoke + Stream operations
+      - Bounded session cache (least recently used threads are evicted)
+      - Per-request deadlines (abandoned turns never touch the cached session)
+
+    `graph_factory(checkpointer)` replaces the AgentGraph build, e.g. for load tests against stubbed backends.
     """
 
     def __init__(
         self,
         checkpointer_mode: str = "memory",  # "sqlite", "memory"
         sqlite_path: str = "checkpoints.db",
+        max_sessions: int = 10_000,
+        request_timeout: Optional[float] = 120.0,
+        graph_factory: Optional[Callable[[Any], Any]] = None,
     ):
         self.checkpointer_mode = checkpointer_mode
         self.sqlite_path = sqlite_path
+        self.max_sessions = max_sessions
+        self.request_timeout = request_timeout
+        self.graph_factory = graph_factory or self._build_agent_graph
 
         self.graph = None
         self.dialogs: Dict[str, Dict[str, Dict[str, Any]]] = {}  # cache: {thread_id: {client_turn_id: response}}
-        self.state_cache: Dict[str, AgentState] = {}  # cache: {thread_id: AgentState}
+        self.state_cache: OrderedDict[str, AgentState] = OrderedDict()  # LRU cache: {thread_id: AgentState}
         self.dialog_lock = asyncio.Lock()
         self.state_cache_lock = asyncio.Lock()
 
+        self.loop_monitor = EventLoopLagMonitor()
+        self._evictions = session_cache_evictions_total.labels()
+        session_cache_size.set_function(lambda: len(self.state_cache))
+
     # ---------- lifecycle ----------
 
     async def startup(self) -> None:
         """Initialize backends and build the graph once per process."""
 
-        print("[startup] Initializing MCP client…")
-        await mcp_client.initialize()
+        # Served from the cached tool manifests when present; discovery refreshes in the background.
+        print("[startup] Initializing MCP clients…")
+        await asyncio.gather(appointment_mcp.initialize(), diagnosis_mcp.initialize())
 
         print("[startup] Building/compiling LangGraph…")
         checkpointer = self._make_checkpointer()
-        self.graph = AgentGraph(checkpointer=checkpointer).get_graph()
+        self.graph = self.graph_factory(checkpointer)
+
+        self.loop_monitor.start()
+
+    async def shutdown(self) -> None:
+        await self.loop_monitor.stop()
+        await asyncio.gather(appointment_mcp.close(), diagnosis_mcp.close())
+
+    @staticmethod
+    def _build_agent_graph(checkpointer):
+        from agentic_network.agent_graph import AgentGraph
+        return AgentGraph(checkpointer=checkpointer).get_graph()
 
     def _make_checkpointer(self):
         """Chooses a checkpointer for state durability."""
@@ -56,6 +85,63 @@ class AssistantService:
 
     # ---------- helpers ----------
 
+    def _get_session(self, thread_id: str) -> AgentState:
+        """Return the cached state for a thread (creating it), marking it most recently used."""
+        agent_state = self.state_cache.get(thread_id)
+        if agent_state is None:
+            agent_state = AgentState(messages=[], intermediate_steps=[], agent_outcome=None)
+            self._put_session(thread_id, agent_state)
+        else:
+            self.state_cache.move_to_end(thread_id)
+        return agent_state
+
+    def _put_session(self, thread_id: str, agent_state: AgentState) -> None:
+        self.state_cache[thread_id] = agent_state
+        self.state_cache.move_to_end(thread_id)
+
+        while len(self.state_cache) > self.max_sessions:
+            evicted_thread_id, _ = self.state_cache.popitem(last=False)
+            self.dialogs.pop(evicted_thread_id, None)
+            self._evictions.inc()
+
+    def _request_deadline(self, timeout: Optional[float]) -> Optional[float]:
+        """
+        The client's timeout_s, capped at the server's request_timeout. A missing, non-positive or
+        non-numeric value falls back to request_timeout, so a client can shorten the deadline but not escape it.
+        """
+        try:
+            timeout = float(timeout) if timeout is not None else None
+        except (TypeError, ValueError):
+            timeout = None
+
+        if timeout is None or not timeout > 0:  # also rejects NaN
+            return self.request_timeout
+        return min(timeout, self.request_timeout) if self.request_timeout else timeout
+
+    @staticmethod
+    def _fork_state(agent_state: AgentState) -> AgentState:
+        """
+        Copy the containers a turn appends to, so the cached session only changes
+        when the turn completes. Message objects themselves are shared.
+        """
+        turn_state = dict(agent_state)
+        turn_state["messages"] = list(agent_state.get("messages") or [])
+        turn_state["intermediate_steps"] = []
+        turn_state["agent_outcome"] = None
+
+        topic_master_state = agent_state.get("topic_master_state")
+        if topic_master_state:
+            turn_state["topic_master_state"] = {
+                **topic_master_state,
+                "agentic_state": turn_state,
+                "topic_stack": [{**t, "messages": list(t.get("messages", []))}
+                                for t in topic_master_state.get("topic_stack") or []],
+                "disclosed_topics": [{**t, "messages": list(t.get("messages", []))}
+                                     for t in topic_master_state.get("disclosed_topics") or []],
+            }
+
+        return turn_state
+
     @staticmethod
     def _extract_user_text(payload: Dict[str, Any]) -> Optional[str]:
         """
@@ -94,6 +180,7 @@ class AssistantService:
         thread_id: str,
         input_payload: Dict[str, Any],
         client_turn_id: Optional[str],
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
 
         """Run a single turn (non-streaming); return full state (and a convenience final_text)."""
@@ -110,8 +197,7 @@ class AssistantService:
                 return self.dialogs[thread_id][turn_id]
 
         async with self.state_cache_lock:
-            self.state_cache.setdefault(thread_id, AgentState(messages=[], intermediate_steps=[], agent_outcome=None))
-            agent_state = self.state_cache[thread_id]
+            agent_state = self._fork_state(self._get_session(thread_id))
 
         user_text = self._extract_user_text(input_payload)
         if not user_text:
@@ -119,17 +205,20 @@ class AssistantService:
 
         config = {"configurable": {"thread_id": thread_id}}
         agent_state["messages"].append(HumanMessage(content=user_text))
-        agent_state["intermediate_steps"].clear()
-        agent_state["agent_outcome"] = None
 
         print("\n---USER MESSAGE---")
         print(user_text)
 
-        # Pass only the new user message.
-        result_state = await self.graph.ainvoke(
-            agent_state,
-            config=config,
-        )
+        # Cancellation (deadline or client disconnect) propagates through every await below;
+        # the cached session is only replaced once the turn finishes.
+        with request_scope(self._request_deadline(timeout)):
+            try:
+                result_state = await with_deadline(self.graph.ainvoke(
+                    agent_state,
+                    config=config,
+                ))
+            except RequestCancelled as e:
+                raise HTTPException(504, str(e))
 
         # Try to surface the final assistant text
         agent_finish: AgentFinish = result_state.get("agent_outcome", {})
@@ -138,25 +227,27 @@ class AssistantService:
 
         # Caching back
         async with self.state_cache_lock:
-            self.state_cache[thread_id] = result_state
+            self._put_session(thread_id, result_state)
         async with self.dialog_lock:
-            self.dialogs[thread_id][turn_id] = resp
+            self.dialogs.setdefault(thread_id, {})[turn_id] = resp
 
         return resp
 
-    async def stream(self, *, thread_id: str, user_text: str):
+    async def stream(self, *, thread_id: str, user_text: str, timeout: Optional[float] = None):
         """
         Async generator of LangGraph events for streaming.
         Yields dict events (LangGraph v2 schema), then ends.
+        Consume it with `contextlib.aclosing` so an abandoned stream is closed in the same task.
         """
         if self.graph is None:
             raise RuntimeError("Graph not initialized")
 
         config = {"configurable": {"thread_id": thread_id}}
 
-        async for event in self.graph.astream_events(
-            {"messages": [HumanMessage(content=user_text)]},
-            config=config,
-            version="v2",
-        ):
-            yield event
+        with request_scope(self._request_deadline(timeout)):
+            async for event in self.graph.astream_events(
+                {"messages": [HumanMessage(content=user_text)]},
+                config=config,
+                version="v2",
+            ):
+                yield event
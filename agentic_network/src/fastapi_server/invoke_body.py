@@ -8,7 +8,9 @@ class InvokeBody(BaseModel):
       - thread_id: stable per conversation (server loads/saves state here)
       - input: either {"message": "..."} or {"messages":[{"role":"user","content":"..."}]}
       - client_turn_id: unique per new client message to dedupe retries
+      - timeout_s: optional per-request deadline in seconds, capped at the server's (server default otherwise)
     """
     input: Dict[str, Any]
     thread_id: str
     client_turn_id: str
+    timeout_s: Optional[float] = None
@@ -1,5 +1,12 @@
-from typing import Optional
-from fastapi import FastAPI, WebSocket, Depends, Header, HTTPException
+from typing import Any, Awaitable, Optional
+from contextlib import aclosing
+from fastapi import FastAPI, WebSocket, Depends, Header, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import PlainTextResponse
+import asyncio, time
+
+from monitoring import registry
+from monitoring.agent_metrics import http_requests_total, http_request_duration_seconds
 from .assistant_service import AssistantService
 from .invoke_body import InvokeBody
 
@@ -16,6 +23,10 @@ class APIServer:
 
         # Lifecycle hooks
         self._app.add_event_handler("startup", self._on_startup)
+        self._app.add_event_handler("shutdown", self._on_shutdown)
+
+        # Request metrics
+        self._app.middleware("http")(self._record_request_metrics)
 
         # Routes
         self._define_routes()
@@ -30,6 +41,64 @@ class APIServer:
     async def _on_startup(self) -> None:
         await self._service.startup()
 
+    async def _on_shutdown(self) -> None:
+        await self._service.shutdown()
+
+    # ----- metrics -----
+
+    @staticmethod
+    async def _record_request_metrics(request: Request, call_next):
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            # Label by route template (not raw path) to keep cardinality bounded.
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            http_request_duration_seconds.labels(route, request.method).observe(time.perf_counter() - started)
+            http_requests_total.labels(route, request.method, status).inc()
+
+    # ----- cancellation -----
+
+    @staticmethod
+    async def _run_until_disconnect(work: Awaitable, disconnected: Awaitable) -> Optional[Any]:
+        """
+        Run `work`, cancelling it as soon as `disconnected` completes (the client went away).
+        Returns None if the work was abandoned.
+        """
+        work_task = asyncio.ensure_future(work)
+        watch_task = asyncio.ensure_future(disconnected)
+        try:
+            done, _ = await asyncio.wait({work_task, watch_task}, return_when=asyncio.FIRST_COMPLETED)
+            if work_task not in done and watch_task.exception() is not None:
+                # The disconnect probe itself failed; finish the work rather than dropping it.
+                return await work_task
+        finally:
+            watch_task.cancel()
+            if not work_task.done():
+                work_task.cancel()
+
+        if work_task in done:
+            return work_task.result()
+
+        try:
+            await work_task
+        except asyncio.CancelledError:
+            pass
+        return None
+
+    @staticmethod
+    async def _http_disconnected(request: Request) -> None:
+        while (await request.receive())["type"] != "http.disconnect":
+            pass
+
+    @staticmethod
+    async def _ws_disconnected(websocket: WebSocket) -> None:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
     # ----- auth dependency -----
 
     async def _auth(self, authorization: Optional[str] = Header(None)) -> None:
@@ -51,46 +120,78 @@ class APIServer:
         def healthz():
             return {"ok": True}
 
+        @app.get("/metrics")
+        def metrics():
+            """Prometheus text exposition of the process-wide registry."""
+            return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
         @app.post("/invoke")
-        async def invoke(body: InvokeBody, _=auth_dep):
+        async def invoke(body: InvokeBody, request: Request, _=auth_dep):
             """
             Conventional, non-streaming turn:
             - send only the new user message
             - include thread_id and client_turn_id
+            - the turn is cancelled if the client disconnects or timeout_s elapses
             """
-            return await service.invoke(
-                thread_id=body.thread_id,
-                input_payload=body.input,
-                client_turn_id=body.client_turn_id,
+            resp = await self._run_until_disconnect(
+                service.invoke(
+                    thread_id=body.thread_id,
+                    input_payload=body.input,
+                    client_turn_id=body.client_turn_id,
+                    timeout=body.timeout_s,
+                ),
+                self._http_disconnected(request),
             )
+            if resp is None:
+                raise HTTPException(499, "Client disconnected")
+            return resp
 
         @app.websocket("/stream")
         async def stream(websocket: WebSocket):
             """
             Streaming:
               - Client connects with ?token=API_KEY
-              - First frame: {"thread_id":"...", "input":{"message":"..."}}
+              - First frame: {"thread_id":"...", "input":{"message":"..."}, "timeout_s": optional}
+              - Closing the socket cancels the running turn
             """
             await websocket.accept()
             if websocket.query_params.get("token") != self._api_key:
                 await websocket.close(code=4403, reason="Authorization failed, invalid API key")
+                http_requests_total.labels("/stream", "WS", 4403).inc()
                 return
 
+            started = time.perf_counter()
+            status = 1000
+
             try:
                 first = await websocket.receive_json()
                 thread_id = first.get("thread_id")
                 user_text = (first.get("input") or {}).get("message")
                 if not thread_id or not user_text:
+                    status = 4400
                     await websocket.close(code=4400, reason="Missing thread_id or input.message")
                     return
 
-                async for event in service.stream(thread_id=thread_id, user_text=user_text):
-                    await websocket.send_json(event)
+                async def pump() -> bool:
+                    events = service.stream(thread_id=thread_id, user_text=user_text, timeout=first.get("timeout_s"))
+                    async with aclosing(events):
+                        async for event in events:
+                            # Events carry messages and state objects, which json.dumps cannot serialize.
+                            await websocket.send_json(jsonable_encoder(event))
+                    return True
+
+                if not await self._run_until_disconnect(pump(), self._ws_disconnected(websocket)):
+                    status = 1001
+                    return
 
                 await websocket.send_json({"event": "complete"})
 
             except Exception as e:
+                status = 1011
                 await websocket.send_json({"event": "error", "message": str(e)})
 
             finally:
-                await websocket.close()
+                http_request_duration_seconds.labels("/stream", "WS").observe(time.perf_counter() - started)
+                http_requests_total.labels("/stream", "WS", status).inc()
+                if status != 1001:
+                    await websocket.close()
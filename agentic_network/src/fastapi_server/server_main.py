@@ -6,6 +6,8 @@ Features:
 - thread_id (configurable -> thread-bound state).
 - client_turn_id (idempotency per turn).
 - HTTP /invoke (one-shot) and WS /stream (streaming) endpoints.
+- Prometheus-style /metrics endpoint.
+- Per-request deadlines; work for disconnected clients is cancelled.
 - MCP client initialization on startup.
 - No module-level global state (everything encapsulated in classes + app.state).
 """
@@ -26,10 +28,14 @@ def main() -> None:
     checkpointer_mode = os.getenv("CHECKPOINTER", "memory").strip()  # "sqlite" or "memory"
     # sqlite_path = os.getenv("SQLITE_PATH", "checkpoints.db")
     sqlite_path = "checkpoints.db"
+    max_sessions = int(os.getenv("AGENTIC_SERVER_MAX_SESSIONS", "10000").strip())
+    request_timeout = float(os.getenv("AGENTIC_SERVER_REQUEST_TIMEOUT", "120").strip())
 
     service = AssistantService(
         checkpointer_mode=checkpointer_mode,
         sqlite_path=sqlite_path,
+        max_sessions=max_sessions,
+        request_timeout=request_timeout,
     )
     server = APIServer(service=service, api_key=api_key)
 
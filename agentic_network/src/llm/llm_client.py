@@ -7,10 +7,19 @@ from llm.client_types import (
     get_llm_diagnosis,
     get_llm_appointment,
 )
+from llm.llm_metrics import LLMMetricsCallback, model_name_of
 from llm.models import LLMModel
+from llm.replay import replay_llm
 
 
 def get_llm(llm_type: LLMModel = LLMModel.GEMINI) -> BaseChatModel:
+    # LLM_REPLAY_MODE=record|replay swaps in the cassette model (see llm.replay).
+    llm = replay_llm(str(llm_type), lambda: _create_llm(llm_type))
+    llm.callbacks = list(llm.callbacks or []) + [LLMMetricsCallback(str(llm_type), model_name_of(llm))]
+    return llm
+
+
+def _create_llm(llm_type: LLMModel) -> BaseChatModel:
     if llm_type == LLMModel.TOPIC_MASTER:
         return get_llm_topic_master()
 
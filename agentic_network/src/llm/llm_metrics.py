@@ -0,0 +1,35 @@
+from typing import Any
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from monitoring.agent_metrics import llm_calls_total, llm_tokens_total
+
+
+class LLMMetricsCallback(BaseCallbackHandler):
+    """Counts calls and token usage for one configured chat model."""
+
+    # Run on the caller's loop instead of a thread pool; the handler only increments counters.
+    run_inline = True
+
+    def __init__(self, llm_label: str, model_name: str):
+        self._ok = llm_calls_total.labels(llm_label, model_name, "ok")
+        self._error = llm_calls_total.labels(llm_label, model_name, "error")
+        self._input_tokens = llm_tokens_total.labels(llm_label, model_name, "input")
+        self._output_tokens = llm_tokens_total.labels(llm_label, model_name, "output")
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self._ok.inc()
+
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if not usage: continue
+                self._input_tokens.inc(usage.get("input_tokens", 0))
+                self._output_tokens.inc(usage.get("output_tokens", 0))
+
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        self._error.inc()
+
+
+def model_name_of(llm) -> str:
+    return str(getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__)
@@ -0,0 +1,252 @@
+"""
+Record / replay stand-in for the chat models, so benchmarks and CI can run without network.
+
+    LLM_REPLAY_MODE=record   call the real model and append (prompt hash -> response, latency) to the cassette
+    LLM_REPLAY_MODE=replay   answer from the cassette only; a prompt that was never recorded is an error
+    LLM_REPLAY_CASSETTE      cassette file (JSONL), default llm_cassette.jsonl
+    LLM_REPLAY_LATENCY       replay only: sleep the recorded latency times this factor (default 0, no sleep)
+
+The whole AIMessage is recorded (content, tool calls, usage), so structured output (Provider or Tool
+strategy) and tool calling replay exactly. Identical prompts get the most recently recorded answer.
+
+UUIDs in a prompt (topic ids are uuid4) are keyed by order of first appearance, not by value, so a replayed
+run with fresh ids still finds its prompts; the same ids in the recorded answer are mapped back to the live ones.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from langchain_core.callbacks import (
+    AsyncCallbackManager,
+    AsyncCallbackManagerForLLMRun,
+    CallbackManager,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import ConfigDict, PrivateAttr
+
+REPLAY_MODES = ("off", "record", "replay")
+
+_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+_ID_PLACEHOLDER = re.compile(r"<id:(\d+)>")
+
+
+class Cassette:
+    """Append-only JSONL of {"key", "llm", "latency", "message"} records, indexed by key."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[dict]:
+        return self._entries.get(key)
+
+    def record(self, key: str, llm: str, message: AIMessage, latency: float, ids: Sequence[str] = ()) -> None:
+        entry = {"key": key, "llm": llm, "latency": round(latency, 4), "message": _hide_ids(message_to_dict(message), ids)}
+        with self._lock:
+            self._entries[key] = entry
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str) -> Cassette:
+    """One Cassette per file and process: every model created by get_llm shares it."""
+    path = os.path.abspath(path)
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+        return _cassettes[path]
+
+
+def prompt_key(llm: str, messages: Sequence[BaseMessage], kwargs: dict, ids: Optional[List[str]] = None) -> str:
+    """
+    Stable hash of what the model is asked: model label, messages and call options (tools, response format).
+    UUIDs are hashed as <id:n>, n their order of first appearance; `ids`, when given, receives them in that order.
+    """
+    payload = {
+        "llm": llm,
+        "messages": [
+            {
+                "type": m.type,
+                "content": m.content,
+                "name": getattr(m, "name", None),
+                "tool_calls": getattr(m, "tool_calls", None) or None,
+                "tool_call_id": getattr(m, "tool_call_id", None),
+            }
+            for m in messages
+        ],
+        "kwargs": kwargs,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+
+    seen: Dict[str, int] = {}
+
+    def placeholder(match: re.Match) -> str:
+        uid = match.group(0).lower()
+        if uid not in seen:
+            seen[uid] = len(seen)
+        return f"<id:{seen[uid]}>"
+
+    canonical = _UUID.sub(placeholder, canonical)
+    if ids is not None:
+        ids[:] = list(seen)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _child_callbacks(run_manager, manager_cls):
+    """Callbacks of a run nested under `run_manager`'s, so tracing and metrics see the inner model's call inside it."""
+    child = manager_cls(handlers=[], parent_run_id=run_manager.run_id)
+    child.set_handlers(run_manager.inheritable_handlers)
+    child.add_tags(run_manager.inheritable_tags)
+    child.add_metadata(run_manager.inheritable_metadata)
+    return child
+
+
+def _hide_ids(message: dict, ids: Sequence[str]) -> dict:
+    """The recorded answer with the prompt's ids replaced by their <id:n> placeholders."""
+    if not ids:
+        return message
+    index = {uid: n for n, uid in enumerate(ids)}
+    text = json.dumps(message, ensure_ascii=False, default=str)
+    text = _UUID.sub(lambda m: f"<id:{index[m.group(0).lower()]}>" if m.group(0).lower() in index else m.group(0), text)
+    return json.loads(text)
+
+
+def _restore_ids(message: dict, ids: Sequence[str]) -> dict:
+    """The recorded answer with its <id:n> placeholders replaced by the live prompt's ids."""
+    text = json.dumps(message, ensure_ascii=False)
+    if "<id:" not in text:
+        return message
+    text = _ID_PLACEHOLDER.sub(lambda m: ids[int(m.group(1))] if int(m.group(1)) < len(ids) else m.group(0), text)
+    return json.loads(text)
+
+
+class ReplayChatModel(BaseChatModel):
+    """
+    Chat model answering from a cassette. With `inner` set it records: every call goes to the inner
+    model and its answer and latency are appended to the cassette.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True, protected_namespaces=())
+
+    label: str
+    cassette_path: str
+    inner: Optional[BaseChatModel] = None
+    latency_scale: float = 0.0
+    model_name: str = "replay"
+
+    _cassette: Cassette = PrivateAttr()
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._cassette = get_cassette(self.cassette_path)
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        # Tools are kept as OpenAI-format dicts: hashable into the key, and accepted by every inner model's bind_tools.
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    # ---- Internal Methods --------------------------------------------------------
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        ids: List[str] = []
+        key = prompt_key(self.label, messages, kwargs, ids)
+
+        if self.inner is not None:
+            started = time.perf_counter()
+            config = {"callbacks": _child_callbacks(run_manager, CallbackManager)} if run_manager else None
+            message = self._bound_inner(kwargs).invoke(messages, config=config, stop=stop)
+            self._cassette.record(key, self.label, message, time.perf_counter() - started, ids)
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+        message, latency = self._replay(key, ids)
+        if latency:
+            time.sleep(latency)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        ids: List[str] = []
+        key = prompt_key(self.label, messages, kwargs, ids)
+
+        if self.inner is not None:
+            started = time.perf_counter()
+            config = {"callbacks": _child_callbacks(run_manager, AsyncCallbackManager)} if run_manager else None
+            message = await self._bound_inner(kwargs).ainvoke(messages, config=config, stop=stop)
+            self._cassette.record(key, self.label, message, time.perf_counter() - started, ids)
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+        message, latency = self._replay(key, ids)
+        if latency:
+            await asyncio.sleep(latency)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _bound_inner(self, kwargs: dict):
+        kwargs = dict(kwargs)
+        tools = kwargs.pop("tools", None)
+        if tools:
+            return self.inner.bind_tools(tools, **kwargs)
+        return self.inner.bind(**kwargs) if kwargs else self.inner
+
+    def _replay(self, key: str, ids: Sequence[str] = ()):
+        entry = self._cassette.get(key)
+        if entry is None:
+            raise LookupError(
+                f"[ReplayChatModel] No recorded answer for this {self.label} prompt (key {key[:12]}) "
+                f"in {self.cassette_path}; record it first with LLM_REPLAY_MODE=record."
+            )
+        message = messages_from_dict([_restore_ids(entry["message"], ids)])[0]
+        return message, entry["latency"] * self.latency_scale
+
+
+def replay_mode() -> str:
+    mode = os.getenv("LLM_REPLAY_MODE", "off").strip().lower() or "off"
+    if mode not in REPLAY_MODES:
+        raise ValueError(f"Unknown LLM_REPLAY_MODE '{mode}' (expected one of {', '.join(REPLAY_MODES)}).")
+    return mode
+
+
+def replay_llm(label: str, create: Callable[[], BaseChatModel]) -> BaseChatModel:
+    """
+    The model for `label` according to LLM_REPLAY_MODE: create() itself when off, wrapped to record,
+    or a pure replay model (create() is never called, so no keys or endpoints are needed).
+    """
+    mode = replay_mode()
+    if mode == "off":
+        return create()
+
+    cassette_path = os.getenv("LLM_REPLAY_CASSETTE", "llm_cassette.jsonl").strip()
+    latency_scale = float(os.getenv("LLM_REPLAY_LATENCY", "0").strip() or 0)
+
+    if mode == "record":
+        inner = create()
+        return ReplayChatModel(label=label, cassette_path=cassette_path, inner=inner,
+                               model_name=getattr(inner, "model_name", None) or getattr(inner, "model", None) or "replay")
+
+    return ReplayChatModel(label=label, cassette_path=cassette_path, latency_scale=latency_scale)
\ No newline at end of file
@@ -2,12 +2,26 @@ from dotenv import load_dotenv,find_dotenv
 from os import getenv
 import asyncio
 
-from mcp_client.util import MCPClient
+from mcp_client.util import MCPClient, read_only, mutating
 
 load_dotenv(find_dotenv())
 mcp_port = getenv("APPOINTMENT_SERVER_PORT", 8081)
 
-appointment_mcp = MCPClient(mcp_port, "appointment_server")
+# Reads are tagged by the entity they depend on; writes drop those tags.
+# cancel/update only know the appointment id, so they drop every cached schedule.
+cache_policies = {
+    "get_available_hospitals": read_only(ttl=600, tags=lambda a: ["hospitals"]),
+    "get_doctors_by_hospital_and_branch": read_only(ttl=600, tags=lambda a: ["doctors"]),
+    "get_available_slots": read_only(ttl=30, tags=lambda a: ["slots", f"slots:{a.get('doctor_id')}"]),
+    "find_earliest_slots": read_only(ttl=30, tags=lambda a: ["slots", "slots:earliest"]),
+    "get_patient_appointments": read_only(ttl=30, tags=lambda a: ["appointments", f"appointments:{a.get('patient_id')}"]),
+    "create_appointment": mutating(invalidates=lambda a: [
+        f"slots:{a.get('doctor_id')}", "slots:earliest", f"appointments:{a.get('patient_id')}"]),
+    "update_appointment": mutating(invalidates=lambda a: ["slots", "appointments"]),
+    "cancel_appointment": mutating(invalidates=lambda a: ["slots", "appointments"]),
+}
+
+appointment_mcp = MCPClient(mcp_port, "appointment_server", cache_policies=cache_policies)
 
 
 async def test():
@@ -2,12 +2,16 @@ import asyncio
 from dotenv import load_dotenv,find_dotenv
 from os import getenv
 
-from mcp_client.util import MCPClient
+from mcp_client.util import MCPClient, read_only
 
 load_dotenv(find_dotenv())
 mcp_port = getenv("DIAGNOSIS_SERVER_PORT", 8080)
 
-diagnosis_mcp = MCPClient(mcp_port, "diagnosis_server")
+cache_policies = {
+    "get_user_health_record": read_only(ttl=300, tags=lambda a: [f"health_record:{a.get('patient_id')}"]),
+}
+
+diagnosis_mcp = MCPClient(mcp_port, "diagnosis_server", cache_policies=cache_policies)
 
 
 async def test():
@@ -1 +1,3 @@
-from .mcp_client import MCPClient
\ No newline at end of file
+from .mcp_client import MCPClient
+from .session_pool import MCPSessionPool
+from .tool_cache import CachePolicy, ToolResultCache, read_only, mutating
@@ -1,18 +1,98 @@
-﻿import os
-from langchain_mcp_adapters.client import MultiServerMCPClient
+import os
+import json, hashlib, asyncio
+from pathlib import Path
+import httpx
+from langchain_core.tools import StructuredTool, ToolException
+from mcp.shared.exceptions import McpError
+from .session_pool import MCPSessionPool
+from .tool_cache import CachePolicy, ToolResultCache
 from loguru import logger
-from typing import Optional
+from typing import Any, Optional
 
 
 class MCPClient:
+    """
+    Tools of a single MCP server.
+
+    The toolset (names + JSON schemas) is kept in an on-disk manifest versioned by the server's
+    manifest hash, so startup never waits on the server: tools are served from the cache and
+    discovery refreshes in the background. A server that is down only leaves its own tools
+    failing (or empty, on a cold cache) instead of stopping the process. Agents compare
+    `manifest_hash` on every call and rebuild their tool bindings when the toolset was swapped.
+
+    Tool calls go through a pool of MCP sessions (see MCPSessionPool), configured by
+    MCP_POOL_SIZE, MCP_CALL_TIMEOUT, MCP_HEALTH_INTERVAL and {LABEL}_FALLBACK_ENDPOINTS.
+    Results of tools with a read-only `cache_policies` entry are cached (MCP_TOOL_CACHE_MAX_ENTRIES, 0 disables).
+    """
     toolset: Optional[list]
 
-    def __init__(self, port: str, label: str):
+    def __init__(self, port: str, label: str, cache_policies: Optional[dict[str, CachePolicy]] = None):
         self.port = port
         self.label = label
+        self.cache = ToolResultCache(
+            cache_policies or {},
+            max_entries=int(os.getenv("MCP_TOOL_CACHE_MAX_ENTRIES", "1024").strip()),
+        )
+
+        self.toolset = None
+        self.manifest_hash: Optional[str] = None
+        self.available = False
+
+        self._pool: Optional[MCPSessionPool] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    # ---- Public API ----
+
+    @property
+    def base_url(self) -> str:
+        return f"{os.getenv(f'{self.label.upper()}_ENDPOINT', '')}:{self.port}"
+
+    @property
+    def endpoints(self) -> list[str]:
+        """Primary endpoint followed by the comma separated {LABEL}_FALLBACK_ENDPOINTS (full base URLs)."""
+        fallbacks = os.getenv(f"{self.label.upper()}_FALLBACK_ENDPOINTS", "")
+        return [self.base_url] + [url.strip().rstrip("/") for url in fallbacks.split(",") if url.strip()]
+
+    @property
+    def manifest_path(self) -> Path:
+        return Path(os.getenv("MCP_MANIFEST_CACHE_DIR", ".mcp_cache")) / f"{self.label}.json"
 
     async def initialize(self):
-        await self._initialize_client()
+        """
+        Serve tools from the cached manifest if there is one and refresh in the background;
+        on a cold cache, discover once in the foreground.
+        """
+        manifest = self._load_manifest()
+        if manifest is not None:
+            self._apply_manifest(manifest)
+            logger.info(f"[{self.label}] Loaded {len(self.toolset)} tools from cached manifest {self.manifest_hash[:12]}")
+            self._schedule_refresh()
+            return
+
+        if not await self.refresh():
+            logger.warning(f"[{self.label}] Starting without tools; discovery continues in the background")
+            self._schedule_refresh()
+
+    async def refresh(self) -> bool:
+        """Fetch the server manifest and swap the toolset if its hash changed. Returns False if the server is unreachable."""
+        logger.info(f"[{self.label}] Fetching tool manifest from {self.base_url}")
+
+        try:
+            manifest = await self._fetch_manifest()
+        except Exception as e:
+            self.available = False
+            logger.warning(f"[{self.label}] MCP Client: Failed to connect or fetch tools: {e}")
+            return False
+
+        self.available = True
+        if manifest["hash"] != self.manifest_hash:
+            if self.manifest_hash is not None:
+                self.cache.clear()
+            self._apply_manifest(manifest)
+            self._save_manifest(manifest)
+            logger.info(f"[{self.label}] Successfully fetched a total of {len(self.toolset)} tools from server")
+
+        return True
 
     def get_tools(self) -> list:
         if self.toolset is None:
@@ -21,27 +101,143 @@ class MCPClient:
 
         return self.toolset
 
-    async def _initialize_client(self):
-        # TODO: Fallback url
-        mcp_server_endpoint = os.getenv(f"{self.label.upper()}_ENDPOINT", "")
-        mcp_server_endpoint += f":{self.port}/sse"
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> str:
+        return await self.cache.get_or_call(name, arguments, lambda: self._call_remote(name, arguments))
 
-        logger.info(f"[{self.label}] Connecting to MCP server on:", mcp_server_endpoint)
+    async def close(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
 
-        mcp_server_configs = {
-            "mcp_tools_server": {
-                "url": mcp_server_endpoint,
-                "transport": "sse"
-            }
-        }
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
 
+    # ---------- helpers ----------
+
+    async def _call_remote(self, name: str, arguments: dict[str, Any]) -> str:
         try:
-            client = MultiServerMCPClient(connections=mcp_server_configs)
+            result = await self._get_pool().call_tool(name, arguments)
 
-            self.toolset = await client.get_tools()
+        except asyncio.TimeoutError as e:
+            raise ToolException(f"MCP tool '{name}' timed out") from e
 
-            logger.info(f"[{self.label}] Successfully fetched a total of {len(self.toolset)} tools from server")
+        except McpError as e:
+            raise ToolException(str(e)) from e
 
         except Exception as e:
-            logger.error(f"[{self.label}] MCP Client: Failed to connect or fetch tools: {e}")
-            exit(1)
+            self.available = False
+            self._schedule_refresh()
+            raise ToolException(f"MCP server '{self.label}' is unavailable: {e}") from e
+
+        text = "\n".join(getattr(block, "text", None) or str(block) for block in result.content)
+        if result.isError:
+            raise ToolException(text)
+
+        return text
+
+    def _get_pool(self) -> MCPSessionPool:
+        if self._pool is None:
+            self._pool = MCPSessionPool(
+                self.label,
+                self.endpoints,
+                size=int(os.getenv("MCP_POOL_SIZE", "4").strip()),
+                call_timeout=float(os.getenv("MCP_CALL_TIMEOUT", "30").strip()),
+                health_interval=float(os.getenv("MCP_HEALTH_INTERVAL", "30").strip()),
+            )
+
+        return self._pool
+
+    def _schedule_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_until_available())
+
+    async def _refresh_until_available(self):
+        delay = 1.0
+        while not await self.refresh():
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+    async def _fetch_manifest(self) -> dict:
+        last_error: Optional[Exception] = None
+
+        async with httpx.AsyncClient(timeout=10.0) as http:
+            for endpoint in self.endpoints:
+                try:
+                    response = await http.get(f"{endpoint}/manifest")
+                except httpx.HTTPError as e:
+                    last_error = e
+                    continue
+
+                if response.status_code == 404:
+                    # Server predates /manifest: list the tools over MCP and hash them ourselves.
+                    return await self._discover_manifest()
+
+                if response.is_server_error:
+                    # A proxy in front of a dead server answers 502/503: try the fallbacks like for a refused connection.
+                    last_error = httpx.HTTPStatusError(f"{response.status_code} from {endpoint}/manifest",
+                                                       request=response.request, response=response)
+                    continue
+
+                response.raise_for_status()
+                return response.json()
+
+        raise ConnectionError(f"No reachable endpoint: {last_error}")
+
+    async def _discover_manifest(self) -> dict:
+        tools = await self._get_pool().list_tools()
+        specs = sorted(
+            (
+                {
+                    "name": tool.name,
+                    "description": tool.description or "",
+                    "input_schema": tool.inputSchema,
+                }
+                for tool in tools
+            ),
+            key=lambda spec: spec["name"],
+        )
+        canonical = json.dumps(specs, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return {"server": self.label, "hash": hashlib.sha256(canonical).hexdigest(), "tools": specs}
+
+    def _apply_manifest(self, manifest: dict):
+        self.toolset = [self._make_tool(spec) for spec in manifest["tools"]]
+        self.manifest_hash = manifest["hash"]
+
+    def _make_tool(self, spec: dict) -> StructuredTool:
+        """Proxy tool built from a manifest entry; borrows a pooled MCP session only when called."""
+        name = spec["name"]
+
+        async def call(**kwargs):
+            return await self.call_tool(name, kwargs)
+
+        return StructuredTool(
+            name=name,
+            description=spec.get("description") or "",
+            args_schema=spec.get("input_schema") or {"type": "object", "properties": {}},
+            coroutine=call,
+        )
+
+    def _load_manifest(self) -> Optional[dict]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            return manifest if manifest.get("hash") and isinstance(manifest.get("tools"), list) else None
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, ValueError) as e:
+            logger.warning(f"[{self.label}] Ignoring unreadable tool manifest {self.manifest_path}: {e}")
+            return None
+
+    def _save_manifest(self, manifest: dict):
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+
+        except OSError as e:
+            logger.warning(f"[{self.label}] Could not persist tool manifest: {e}")
@@ -0,0 +1,219 @@
+from typing import Any, Optional
+import asyncio, random
+
+from langchain_mcp_adapters.sessions import create_session
+from loguru import logger
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+
+from monitoring.agent_metrics import (
+    mcp_pool_sessions,
+    mcp_pool_in_use,
+    mcp_pool_reconnects_total,
+    mcp_pool_connect_failures_total,
+)
+
+
+class _PooledSession:
+    """
+    One MCP session over SSE. The session's transport is entered and exited by a dedicated task,
+    so it can be opened and closed from any caller.
+    """
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.session: Optional[ClientSession] = None
+        self.error: Optional[BaseException] = None
+
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def open(self, timeout: float) -> None:
+        self._task = asyncio.create_task(self._run())
+        ready = asyncio.create_task(self._ready.wait())
+        try:
+            await asyncio.wait({self._task, ready}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            ready.cancel()
+
+        if not self.alive:
+            await self.close()
+            raise ConnectionError(f"Could not open MCP session on {self.endpoint}: {self.error or 'timed out'}")
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is None: return
+
+        try:
+            await asyncio.wait_for(self._task, 5.0)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        try:
+            async with create_session({"url": f"{self.endpoint}/sse", "transport": "sse"}) as session:
+                await session.initialize()
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+
+        except Exception as e:
+            self.error = e
+
+        finally:
+            self.session = None
+
+
+class MCPSessionPool:
+    """
+    Bounded pool of MCP sessions to one server.
+
+    - up to `size` concurrent sessions, opened on demand and reused
+    - idle sessions are pinged every `health_interval` seconds; dead ones are dropped
+    - connections try the primary endpoint, then the fallbacks, backing off exponentially between rounds
+    - every call is bounded by `call_timeout`
+    """
+
+    def __init__(
+        self,
+        label: str,
+        endpoints: list[str],
+        size: int = 4,
+        call_timeout: float = 30.0,
+        connect_timeout: float = 10.0,
+        health_interval: float = 30.0,
+        max_backoff: float = 30.0,
+        connect_rounds: int = 3,
+    ):
+        self.label = label
+        self.endpoints = endpoints
+        self.size = size
+        self.call_timeout = call_timeout
+        self.connect_timeout = connect_timeout
+        self.health_interval = health_interval
+        self.max_backoff = max_backoff
+        self.connect_rounds = connect_rounds
+
+        self._sessions: list[_PooledSession] = []
+        self._idle: list[_PooledSession] = []
+        self._slots = asyncio.Semaphore(size)
+        self._lost = 0
+        self._health_task: Optional[asyncio.Task] = None
+
+        self._in_use = mcp_pool_in_use.labels(label)
+        self._reconnects = mcp_pool_reconnects_total.labels(label)
+        mcp_pool_sessions.labels(label).set_function(lambda: len(self._sessions))
+
+    # ---- Public API ----
+
+    async def call_tool(self, name: str, arguments: dict[str, Any], timeout: Optional[float] = None):
+        """Run a tool on a pooled session. Transport failures drop the session; the next call reconnects."""
+        async with self._slots:
+            pooled = await self._acquire()
+            self._in_use.inc()
+            try:
+                return await asyncio.wait_for(pooled.session.call_tool(name, arguments), timeout or self.call_timeout)
+
+            except (asyncio.TimeoutError, McpError):
+                # A slow tool or a JSON-RPC error reply is not a broken transport; keep the session.
+                raise
+
+            except Exception:
+                await self._drop(pooled)
+                raise
+
+            finally:
+                self._in_use.dec()
+                if pooled.alive and pooled in self._sessions:
+                    self._idle.append(pooled)
+
+    async def list_tools(self) -> list:
+        async with self._slots:
+            pooled = await self._acquire()
+            try:
+                result = await asyncio.wait_for(pooled.session.list_tools(), self.call_timeout)
+            except Exception:
+                await self._drop(pooled)
+                raise
+
+            self._idle.append(pooled)
+            return result.tools
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+
+        sessions, self._sessions, self._idle = self._sessions, [], []
+        await asyncio.gather(*(pooled.close() for pooled in sessions), return_exceptions=True)
+
+    # ---------- helpers ----------
+
+    async def _acquire(self) -> _PooledSession:
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.alive:
+                return pooled
+            await self._drop(pooled)
+
+        pooled = await self._connect()
+        self._sessions.append(pooled)
+        self._start_health_checks()
+        return pooled
+
+    async def _connect(self) -> _PooledSession:
+        delay = 0.5
+        last_error: Optional[BaseException] = None
+
+        for attempt in range(self.connect_rounds):
+            if attempt:
+                await asyncio.sleep(delay + random.uniform(0, delay / 2))
+                delay = min(delay * 2, self.max_backoff)
+
+            for endpoint in self.endpoints:
+                pooled = _PooledSession(endpoint)
+                try:
+                    await pooled.open(self.connect_timeout)
+                except ConnectionError as e:
+                    last_error = e
+                    mcp_pool_connect_failures_total.labels(self.label, endpoint).inc()
+                    logger.warning(f"[{self.label}] {e}")
+                    continue
+
+                if self._lost:
+                    self._lost -= 1
+                    self._reconnects.inc()
+                return pooled
+
+        raise ConnectionError(f"MCP server '{self.label}' unreachable on {', '.join(self.endpoints)}: {last_error}")
+
+    async def _drop(self, pooled: _PooledSession) -> None:
+        if pooled in self._sessions:
+            self._sessions.remove(pooled)
+            self._lost += 1
+        if pooled in self._idle:
+            self._idle.remove(pooled)
+        await pooled.close()
+
+    def _start_health_checks(self) -> None:
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self) -> None:
+        while self._sessions:
+            await asyncio.sleep(self.health_interval)
+
+            for pooled in list(self._idle):
+                try:
+                    if not pooled.alive:
+                        raise ConnectionError("session closed")
+                    await asyncio.wait_for(pooled.session.send_ping(), self.connect_timeout)
+
+                except Exception as e:
+                    logger.warning(f"[{self.label}] Dropping unhealthy MCP session on {pooled.endpoint}: {e}")
+                    await self._drop(pooled)
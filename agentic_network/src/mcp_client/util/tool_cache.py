@@ -0,0 +1,178 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Optional
+import json, time
+
+from monitoring.agent_metrics import (
+    mcp_tool_cache_requests_total,
+    mcp_tool_cache_hit_ratio,
+    mcp_tool_cache_invalidations_total,
+)
+
+Tags = Callable[[dict], Iterable[str]]
+
+
+def _no_tags(args: dict) -> Iterable[str]:
+    return ()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    How results of one tool are cached.
+
+    Read-only tools are cached for `ttl` seconds and labelled with `tags` (e.g. "slots:<doctor_id>").
+    Mutating tools are never cached; after each call every entry carrying one of `invalidates`
+    is dropped. A bare family tag ("slots") is attached to every entry of that family, so it drops them all.
+    """
+    read_only: bool
+    ttl: float = 60.0
+    tags: Tags = _no_tags
+    invalidates: Tags = _no_tags
+
+
+def read_only(ttl: float, tags: Tags = _no_tags) -> CachePolicy:
+    return CachePolicy(read_only=True, ttl=ttl, tags=tags)
+
+
+def mutating(invalidates: Tags) -> CachePolicy:
+    return CachePolicy(read_only=False, invalidates=invalidates)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires: float
+    tags: tuple = field(default_factory=tuple)
+
+
+@dataclass
+class _Stats:
+    hits: int = 0
+    misses: int = 0
+
+    def ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ToolResultCache:
+    """
+    Client-side read-through cache for MCP tool results, keyed by tool name and canonicalised arguments.
+    Tools without a policy pass straight through. Bounded; least recently used entries are evicted first.
+    """
+
+    def __init__(self, policies: dict[str, CachePolicy], max_entries: int = 1024):
+        self.policies = policies
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._by_tag: dict[str, set[str]] = {}
+        self._generation = 0
+        self._stats: dict[str, _Stats] = {}
+
+    # ---- Public API ----
+
+    async def get_or_call(self, tool: str, args: dict, call: Callable[[], Awaitable[Any]]) -> Any:
+        policy = self.policies.get(tool)
+        if policy is None or self.max_entries <= 0:
+            return await call()
+
+        if not policy.read_only:
+            try:
+                return await call()
+            finally:
+                self.invalidate(tool, policy.invalidates(args))
+
+        key = self._key(tool, args)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires > time.monotonic():
+            self._entries.move_to_end(key)
+            self._record(tool, hit=True)
+            return entry.value
+
+        self._record(tool, hit=False)
+        generation = self._generation
+        value = await call()
+
+        # Skip the write if a mutation ran while this call was in flight; the result may be stale.
+        if generation == self._generation and self._cacheable(value):
+            self._put(key, _Entry(value, time.monotonic() + policy.ttl, tuple(policy.tags(args))))
+
+        return value
+
+    def invalidate(self, tool: str, tags: Iterable[str]) -> int:
+        self._generation += 1
+
+        dropped = 0
+        for tag in tags:
+            for key in self._by_tag.pop(tag, ()):
+                if self._drop(key):
+                    dropped += 1
+
+        if dropped:
+            mcp_tool_cache_invalidations_total.labels(tool).inc(dropped)
+        return dropped
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._by_tag.clear()
+
+    def hit_ratio(self, tool: str) -> float:
+        return self._stats.get(tool, _Stats()).ratio()
+
+    # ---------- helpers ----------
+
+    @staticmethod
+    def _key(tool: str, args: dict) -> str:
+        """Same call, same key: argument order, surrounding whitespace and omitted defaults don't matter."""
+        canonical = {
+            name: value.strip() if isinstance(value, str) else value
+            for name, value in (args or {}).items()
+            if value is not None
+        }
+        return f"{tool}:{json.dumps(canonical, sort_keys=True, ensure_ascii=False, default=str)}"
+
+    @staticmethod
+    def _cacheable(value: Any) -> bool:
+        """Tools report failures as {"error": ...}; those must not be served again."""
+        try:
+            payload = json.loads(value) if isinstance(value, str) else value
+        except ValueError:
+            return True
+        return not (isinstance(payload, dict) and "error" in payload)
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        self._drop(key)
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+        return True
+
+    def _record(self, tool: str, hit: bool) -> None:
+        stats = self._stats.get(tool)
+        if stats is None:
+            stats = self._stats[tool] = _Stats()
+            mcp_tool_cache_hit_ratio.labels(tool).set_function(stats.ratio)
+
+        if hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+        mcp_tool_cache_requests_total.labels(tool, "hit" if hit else "miss").inc()
@@ -0,0 +1,3 @@
+from .metrics import MetricsRegistry, Counter, Gauge, Histogram
+from .agent_metrics import registry, instrument_node
+from .event_loop_monitor import EventLoopLagMonitor
@@ -0,0 +1,100 @@
+from typing import Any, Callable
+import asyncio, inspect, time
+
+from monitoring.metrics import MetricsRegistry
+
+registry = MetricsRegistry()
+
+# ---- HTTP / WebSocket ------------------------------------------------------------
+http_requests_total = registry.counter(
+    "agentic_http_requests_total", "Requests handled by the API server.", ("route", "method", "status"))
+http_request_duration_seconds = registry.histogram(
+    "agentic_http_request_duration_seconds", "Request latency per route.", ("route", "method"))
+
+# ---- Graph ------------------------------------------------------------------------
+graph_node_duration_seconds = registry.histogram(
+    "agentic_graph_node_duration_seconds", "Latency of a single graph node execution.", ("node",))
+graph_node_errors_total = registry.counter(
+    "agentic_graph_node_errors_total", "Graph node executions that raised.", ("node",))
+
+# ---- LLM --------------------------------------------------------------------------
+llm_calls_total = registry.counter(
+    "agentic_llm_calls_total", "LLM calls per model.", ("llm", "model", "outcome"))
+llm_tokens_total = registry.counter(
+    "agentic_llm_tokens_total", "LLM tokens per model.", ("llm", "model", "kind"))
+
+# ---- Context compaction ------------------------------------------------------------
+context_tokens_saved_total = registry.counter(
+    "agentic_context_tokens_saved_total", "Prompt tokens removed by context compaction, per agent.", ("agent",))
+context_prompt_tokens = registry.histogram(
+    "agentic_context_prompt_tokens", "Prompt tokens sent per model call after compaction, per agent.", ("agent",),
+    buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000))
+
+# ---- Tool selection ----------------------------------------------------------------
+llm_bound_tools = registry.histogram(
+    "agentic_llm_bound_tools", "Tools bound to a domain agent's model call, per agent.", ("agent",),
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34))
+
+# ---- Topics -----------------------------------------------------------------------
+topic_stack_depth = registry.histogram(
+    "agentic_topic_stack_depth", "Open topics on a session's topic stack at the end of a turn.",
+    buckets=(1, 2, 3, 4, 5, 8, 13, 21))
+topic_disclosed_count = registry.histogram(
+    "agentic_topic_disclosed_count", "Disclosed topics kept by a session at the end of a turn.",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100))
+topic_transitions_total = registry.counter(
+    "agentic_topic_transitions_total", "Topics leaving the stack or the session, per reason.", ("reason",))
+
+# ---- MCP tools --------------------------------------------------------------------
+mcp_tool_calls_total = registry.counter(
+    "agentic_mcp_tool_calls_total", "MCP tool calls per tool.", ("tool", "outcome"))
+mcp_tool_duration_seconds = registry.histogram(
+    "agentic_mcp_tool_duration_seconds", "MCP tool call latency per tool.", ("tool",))
+mcp_tool_cache_requests_total = registry.counter(
+    "agentic_mcp_tool_cache_requests_total", "Tool result cache lookups per read-only tool.", ("tool", "result"))
+mcp_tool_cache_hit_ratio = registry.gauge(
+    "agentic_mcp_tool_cache_hit_ratio", "Share of lookups served from the tool result cache, per tool.", ("tool",))
+mcp_tool_cache_invalidations_total = registry.counter(
+    "agentic_mcp_tool_cache_invalidations_total", "Cached tool results dropped by mutating tools.", ("tool",))
+mcp_pool_sessions = registry.gauge(
+    "agentic_mcp_pool_sessions", "Open MCP sessions per server.", ("server",))
+mcp_pool_in_use = registry.gauge(
+    "agentic_mcp_pool_in_use", "MCP sessions currently serving a call, per server.", ("server",))
+mcp_pool_reconnects_total = registry.counter(
+    "agentic_mcp_pool_reconnects_total", "MCP sessions reopened after a dropped or unhealthy one.", ("server",))
+mcp_pool_connect_failures_total = registry.counter(
+    "agentic_mcp_pool_connect_failures_total", "Failed MCP connection attempts per endpoint.", ("server", "endpoint"))
+
+# ---- Sessions ---------------------------------------------------------------------
+session_cache_size = registry.gauge(
+    "agentic_session_cache_size", "Conversations held in the session state cache.")
+session_cache_evictions_total = registry.counter(
+    "agentic_session_cache_evictions_total", "Conversations evicted from the session state cache.")
+
+# ---- Event loop -------------------------------------------------------------------
+event_loop_lag_seconds = registry.histogram(
+    "agentic_event_loop_lag_seconds", "Delay between a scheduled wake-up and the actual one.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+
+
+def instrument_node(name: str, node: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a graph node so each execution is timed under `name`."""
+    duration = graph_node_duration_seconds.labels(str(name))
+    errors = graph_node_errors_total.labels(str(name))
+
+    async def timed_node(state):
+        started = time.perf_counter()
+        try:
+            result = node(state)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            errors.inc()
+            raise
+        finally:
+            duration.observe(time.perf_counter() - started)
+
+    return timed_node
@@ -0,0 +1,33 @@
+from typing import Optional
+import asyncio, time
+
+from monitoring.agent_metrics import event_loop_lag_seconds
+
+
+class EventLoopLagMonitor:
+    """Periodically sleeps on the loop and records how late each wake-up is."""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._lag = event_loop_lag_seconds.labels()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None: return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self._lag.observe(max(0.0, time.perf_counter() - expected))
@@ -1,2 +1,9 @@
-from .dataset_prep import read_dataset
-from .intent_data import intent_list, intent_literal, dataset
\ No newline at end of file
+from .dataset_prep import LazyDataset, iter_dataset, iter_dialogues, iter_json_array, load_intents, read_dataset
+
+
+def __getattr__(name):
+    # intent_list / intent_literal / dataset resolve lazily (see intent_data).
+    if name in ("intent_list", "intent_literal", "dataset"):
+        from . import intent_data
+        return getattr(intent_data, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,74 +2,198 @@ import json
 import os
 from loguru import logger
 
-def reformat_dialogues(input_paths, output_path):
+JSON_CHUNK_SIZE = 1 << 16
 
-    processed_dialogues = []
 
-    for input_path in input_paths:
-        if not os.path.exists(input_path):
-            logger.warning(f"Input file not found: {input_path}")
-            continue
+def iter_json_array(file_path, chunk_size=JSON_CHUNK_SIZE):
+    """
+    Yields the elements of a top-level JSON array one at a time, reading the file in chunks,
+    so only the element being decoded (plus one chunk) is ever in memory.
+    """
+    decoder = json.JSONDecoder()
 
-        try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buffer, eof, started = "", False, False
+
+        while True:
+            buffer = buffer.lstrip(" \t\r\n," if started else " \t\r\n")
+
+            if not buffer:
+                if eof:
+                    raise json.JSONDecodeError("Unexpected end of file", "", 0)
+                buffer = f.read(chunk_size)
+                eof = not buffer
+                continue
+
+            if not started:
+                if buffer[0] != "[":
+                    raise json.JSONDecodeError("Expected a JSON array", buffer, 0)
+                buffer, started = buffer[1:], True
+                continue
+
+            if buffer[0] == "]":
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer)
+                # "6." may be the start of "6.5e3": only trust an element once its delimiter has been read.
+                complete = eof or (end < len(buffer) and buffer[end] in " \t\r\n,]")
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+
+            if not complete:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
 
-            for dialogue in raw_data:
-                dialogue_id = dialogue.get('dialogue_id')
-                raw_messages = dialogue.get('turns', [])
+            yield item
+            buffer = buffer[end:]
 
-                structured_messages = []
 
-                for turn in raw_messages:
-                    speaker = turn.get('speaker')
-                    text = turn.get('utterance')
+def structure_dialogue(dialogue):
+    """Converts one raw SGD dialogue into {"dialogue_id", "length", "messages"}."""
+    structured_messages = []
 
-                    if speaker == "USER":
-                        frames = turn.get('frames', [])
-                        active_intent = "NONE"
+    for turn in dialogue.get('turns', []):
+        speaker = turn.get('speaker')
+        text = turn.get('utterance')
 
-                        if frames:
-                            state = frames[0].get('state', {})
-                            active_intent = state.get('active_intent', "NONE")
+        if speaker == "USER":
+            frames = turn.get('frames', [])
+            active_intent = "NONE"
 
-                        structured_messages.append({"role": "user", "message": text, "intent": active_intent})
+            if frames:
+                state = frames[0].get('state', {})
+                active_intent = state.get('active_intent', "NONE")
 
-                    elif speaker == "SYSTEM":
-                        structured_messages.append({"role": "ai", "message": text})
+            structured_messages.append({"role": "user", "message": text, "intent": active_intent})
 
-                dialogue_len = len(structured_messages)
+        elif speaker == "SYSTEM":
+            structured_messages.append({"role": "ai", "message": text})
 
-                processed_dialogues.append({"dialogue_id": dialogue_id, "length": dialogue_len,
-                    "messages": structured_messages})
+    return {"dialogue_id": dialogue.get('dialogue_id'), "length": len(structured_messages),
+            "messages": structured_messages}
+
+
+def iter_dialogues(input_paths):
+    """Structured dialogues of the raw dialogues_NNN.json files, streamed one at a time."""
+    for input_path in input_paths:
+        if not os.path.exists(input_path):
+            logger.warning(f"Input file not found: {input_path}")
+            continue
+
+        try:
+            for dialogue in iter_json_array(input_path):
+                yield structure_dialogue(dialogue)
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error in {input_path}: {e}")
         except IOError as e:
             logger.error(f"File I/O error for {input_path}: {e}")
 
-    if processed_dialogues:
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(processed_dialogues, f, indent=2, ensure_ascii=False)
-            logger.info(f"Successfully saved {len(processed_dialogues)} dialogues to {output_path}")
-        except IOError as e:
-            logger.error(f"Error saving output file: {e}")
-    else:
+
+def intents_path_for(dataset_path):
+    """The intent label sidecar of a dataset file: dataset.jsonl -> dataset.intents.txt"""
+    return os.path.splitext(dataset_path)[0] + ".intents.txt"
+
+
+def reformat_dialogues(input_paths, output_path):
+    """
+    Writes the structured dialogues as JSONL (one dialogue per line) and their sorted intent labels
+    to the sidecar next to it. Dialogues are streamed straight to disk, never collected in a list.
+    """
+    intents = set()
+    count = 0
+    tmp_path = f"{output_path}.tmp"
+
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for dialogue in iter_dialogues(input_paths):
+                f.write(json.dumps(dialogue, ensure_ascii=False) + "\n")
+                intents.update(m["intent"] for m in dialogue["messages"] if m.get("intent"))
+                count += 1
+    except IOError as e:
+        logger.error(f"Error saving output file: {e}")
+        return
+
+    if not count:
+        os.remove(tmp_path)
         logger.warning("No dialogues processed; output file not created.")
+        return
+
+    os.replace(tmp_path, output_path)
+    _write_labels(sorted(intents), intents_path_for(output_path))
+    logger.info(f"Successfully saved {count} dialogues to {output_path}")
+
+
+def iter_dataset(file_path):
+    """Dialogues of a dataset file, one at a time: JSONL (one per line) or a legacy JSON array."""
+    if file_path.endswith(".jsonl"):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from iter_json_array(file_path)
+
+
+class LazyDataset:
+    """Re-iterable view of a dataset file; every iteration streams it from disk again."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._length = None
+
+    def __iter__(self):
+        if not os.path.exists(self.file_path):
+            logger.error(f"Dataset not found: {self.file_path}")
+            return iter(())
+        return iter_dataset(self.file_path)
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+        return self._length
 
 
 def read_dataset(file_path):
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
+        return list(iter_dataset(file_path))
     except Exception as e:
         logger.error(f"Error reading file: {e}")
         return []
 
 
+def load_intents(dataset_path):
+    """
+    Sorted intent labels of a dataset, from its sidecar when that is up to date;
+    otherwise one streaming pass over the dataset, and the sidecar is (re)written.
+    """
+    intents_path = intents_path_for(dataset_path)
+    if os.path.exists(intents_path) and (
+            not os.path.exists(dataset_path) or os.path.getmtime(intents_path) >= os.path.getmtime(dataset_path)):
+        with open(intents_path, 'r', encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+
+    if not os.path.exists(dataset_path):
+        logger.error(f"Dataset not found: {dataset_path}")
+        return []
+
+    intents = extract_intents_from_dataset(iter_dataset(dataset_path))
+    _write_labels(intents, intents_path)
+    return intents
+
+
+def _write_labels(labels, path):
+    # Same format as intent_label.save_labels_to_file: one label per line.
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(f"{label}\n" for label in labels)
+
+
 def extract_intents_from_dataset(data):
     unique_intents = set()
 
@@ -98,19 +222,22 @@ if __name__ == "__main__":
 
     input_files = [os.path.join(INPUT_DIR, f"dialogues_{i:03d}.json") for i in range(1, N_FILES + 1)]
 
-    output_file = os.path.join(OUTPUT_DIR, 'dataset.json')
+    output_file = os.path.join(OUTPUT_DIR, 'dataset.jsonl')
 
     reformat_dialogues(input_files, output_file)
 
-    dataset = read_dataset(output_file)
+    dataset = LazyDataset(output_file)
 
-    logger.info(f"Number of dialogues: {len(dataset)}")
+    n_dialogues, n_messages, first_dialogue = 0, 0, None
+    for dialogue in dataset:
+        n_dialogues += 1
+        n_messages += dialogue["length"]
+        first_dialogue = first_dialogue or dialogue
 
-    n_messages = sum(dialogue["length"] for dialogue in dataset)
+    logger.info(f"Number of dialogues: {n_dialogues}")
     logger.info(f"Total messages across all dialogues: {n_messages}")
 
-    if dataset:
-        first_dialogue = dataset[0]
+    if first_dialogue:
         dialogue_id = first_dialogue.get('dialogue_id')
         messages = first_dialogue.get('messages', [])
 
@@ -126,6 +253,6 @@ if __name__ == "__main__":
 
             logger.info(log_msg)
 
-        extract_intents_from_dataset(dataset)
+        logger.info(f"Intent labels: {len(load_intents(output_file))}")
     else:
-        logger.warning("No data found to verify.")
\ No newline at end of file
+        logger.warning("No data found to verify.")
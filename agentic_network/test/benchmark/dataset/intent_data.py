@@ -1,15 +1,42 @@
 import os
 from typing import Literal
 
-from benchmark.dataset import read_dataset
-from benchmark.dataset.dataset_prep import extract_intents_from_dataset
+from benchmark.dataset.dataset_prep import LazyDataset, load_intents
 
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
-dataset_path = os.path.normpath(os.path.join(script_dir, "../io/output_files/dataset.json"))
+output_dir = os.path.normpath(os.path.join(script_dir, "../io/output_files"))
 
-dataset = read_dataset(dataset_path)
+# dataset.jsonl is written by dataset_prep; an older dataset.json (one JSON array) is still read, streamed.
+dataset_path = os.path.join(output_dir, "dataset.jsonl")
+if not os.path.exists(dataset_path) and os.path.exists(os.path.join(output_dir, "dataset.json")):
+    dataset_path = os.path.join(output_dir, "dataset.json")
 
-intent_list = extract_intents_from_dataset(dataset)
-intent_tuple = tuple(intent_list)
-intent_literal = Literal[*intent_tuple]
\ No newline at end of file
+
+def _intent_list():
+    return load_intents(dataset_path)
+
+
+def _intent_literal():
+    return Literal[*_lazy("intent_tuple")]
+
+
+# Built on first access, so importing the benchmark package does not touch the dataset.
+_FACTORIES = {
+    "dataset": lambda: LazyDataset(dataset_path),
+    "intent_list": _intent_list,
+    "intent_tuple": lambda: tuple(_lazy("intent_list")),
+    "intent_literal": _intent_literal,
+}
+
+
+def _lazy(name):
+    if name not in globals():
+        globals()[name] = _FACTORIES[name]()
+    return globals()[name]
+
+
+def __getattr__(name):
+    if name in _FACTORIES:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import os
 from dotenv import load_dotenv, find_dotenv
@@ -7,11 +8,27 @@ from benchmark.core import ResultInfo
 
 from benchmark.dataset import dataset
 from benchmark.util import BenchmarkTemplate
+from benchmark.util.checkpoint import parse_shard
 from benchmark.util.topic_master_benchmark_template import TopicMasterBenchmarkTemplate
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Intent classification benchmark over the SGD dialogues.")
+    parser.add_argument("--shard", default=None,
+                        help="Run only shard i of N (e.g. 0/4); start one process per shard, on any machine.")
+    parser.add_argument("--checkpoint", default=None,
+                        help="JSONL of finished dialogues; a rerun skips them "
+                             "(default: io/output_files/checkpoints/<benchmark>_<config hash>_shard<i>of<N>.jsonl, "
+                             "so a changed model or prompt starts a fresh one).")
+    parser.add_argument("--merge", nargs="+", metavar="CHECKPOINT",
+                        help="Write the final report over these shard checkpoints instead of running.")
+    return parser.parse_args()
+
+
 async def main():
     load_dotenv(find_dotenv())
+    args = parse_args()
+    shard = parse_shard(args.shard)
 
     PROVIDER = os.getenv("BENCHMARK_LLM_PROVIDER").lower()
     MODEL = os.getenv("BENCHMARK_LLM_MODEL")
@@ -27,13 +44,19 @@ async def main():
     #     result_schema=ResultInfo,
     #     endpoint=ENDPOINT,
     #     concurrency=5,
-    #     strategy_type=STRATEGY
+    #     strategy_type=STRATEGY,
+    #     shard=shard,
     # )
     tester = TopicMasterBenchmarkTemplate(
         concurrency=5,
+        shard=shard,
     )
+    tester.checkpoint_path = args.checkpoint or tester.default_checkpoint_path()
 
-    await tester.run(dataset)
+    if args.merge:
+        tester.merge(args.merge)
+    else:
+        await tester.run(dataset)
 
 if __name__ == "__main__":
     try:
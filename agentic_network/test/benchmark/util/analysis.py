@@ -0,0 +1,158 @@
+"""
+Analytics over the per-turn records of a Topic Master benchmark run:
+
+    confusion matrix over AgentData.agent_list, per-intent precision / recall / F1,
+    and latency, accuracy and tokens per checker branch (which stage selected the topic).
+
+    python -m benchmark.util.analysis io/output_files/topic_master_<...>.turns.jsonl [checkpoint.jsonl ...]
+
+Accepts turn-record files and benchmark checkpoints (whose records carry a "turns" list).
+"""
+import json
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from agentic_network.agents import AgentData
+
+# Row / column for labels outside AgentData.agent_list (e.g. "UNKNOWN" when parsing failed).
+OTHER_LABEL = "OTHER"
+PERCENTILES = (50, 95, 99)
+
+
+# ---- Public API ----
+
+def confusion_matrix(truths: Sequence[str], preds: Sequence[str],
+                     labels: Sequence[str] = AgentData.agent_list) -> Tuple[np.ndarray, List[str]]:
+    """(matrix[truth, pred] counts, labels + OTHER); labels are matched case-insensitively, like the benchmark."""
+    labels = list(labels) + [OTHER_LABEL]
+    index = {label.lower(): i for i, label in enumerate(labels)}
+    other = len(labels) - 1
+
+    truth_index = np.fromiter((index.get(t.strip().lower(), other) for t in truths), dtype=np.int64, count=len(truths))
+    pred_index = np.fromiter((index.get(p.strip().lower(), other) for p in preds), dtype=np.int64, count=len(preds))
+
+    n = len(labels)
+    matrix = np.bincount(truth_index * n + pred_index, minlength=n * n).reshape(n, n)
+    return matrix, labels
+
+
+def per_intent_scores(matrix: np.ndarray, labels: Sequence[str]) -> Dict[str, dict]:
+    """precision / recall / F1 / support per label; labels never seen nor predicted are left out."""
+    true_positives = np.diag(matrix).astype(float)
+    predicted = matrix.sum(axis=0).astype(float)
+    support = matrix.sum(axis=1).astype(float)
+
+    precision = np.divide(true_positives, predicted, out=np.zeros_like(true_positives), where=predicted > 0)
+    recall = np.divide(true_positives, support, out=np.zeros_like(true_positives), where=support > 0)
+    denominator = precision + recall
+    f1 = np.divide(2 * precision * recall, denominator, out=np.zeros_like(denominator), where=denominator > 0)
+
+    return {
+        label: {
+            "precision": round(float(precision[i]), 4),
+            "recall": round(float(recall[i]), 4),
+            "f1": round(float(f1[i]), 4),
+            "support": int(support[i]),
+            "predicted": int(predicted[i]),
+        }
+        for i, label in enumerate(labels) if support[i] or predicted[i]
+    }
+
+
+def branch_breakdown(records: Sequence[dict]) -> Dict[str, dict]:
+    """Per checker branch: turns, accuracy, latency distribution (s), mean stage latency and tokens."""
+    groups: Dict[str, List[dict]] = {}
+    for record in records:
+        groups.setdefault(record.get("branch") or "unknown", []).append(record)
+
+    breakdown = {}
+    for branch, group in sorted(groups.items()):
+        latency = np.array([r["latency"] for r in group], dtype=float)
+        correct = np.array([r["correct"] for r in group], dtype=bool)
+        stages = sorted({stage for r in group for stage in r.get("stage_latency", {})})
+        stage_latency = np.array([[r.get("stage_latency", {}).get(s, 0.0) for s in stages] for r in group], dtype=float)
+        tokens = np.array([_total_tokens(r) for r in group], dtype=float)
+
+        breakdown[branch] = {
+            "turns": len(group),
+            "accuracy": round(float(correct.mean()), 4),
+            "latency": _distribution(latency),
+            "latency_when_wrong": _distribution(latency[~correct]) if (~correct).any() else None,
+            "stage_latency_mean": {s: round(float(v), 4) for s, v in zip(stages, stage_latency.mean(axis=0))} if stages else {},
+            "tokens_mean": round(float(tokens.mean()), 1),
+        }
+    return breakdown
+
+
+def analyze(records: Sequence[dict], labels: Sequence[str] = AgentData.agent_list) -> dict:
+    matrix, labels = confusion_matrix([r["truth"] for r in records], [r["pred"] for r in records], labels)
+    turns = len(records)
+    return {
+        "turns": turns,
+        "accuracy": round(float(np.trace(matrix) / turns), 4) if turns else 0.0,
+        "labels": labels,
+        "confusion_matrix": matrix.tolist(),
+        "per_intent": per_intent_scores(matrix, labels),
+        "branches": branch_breakdown(records),
+    }
+
+
+def format_report(analysis: dict) -> str:
+    lines = [f"Turns: {analysis['turns']}  Accuracy: {analysis['accuracy']:.4f}", "", "Per intent:"]
+    lines.append(f"  {'intent':<26}{'prec':>8}{'recall':>8}{'f1':>8}{'support':>9}")
+    for label, s in analysis["per_intent"].items():
+        lines.append(f"  {label:<26}{s['precision']:>8.3f}{s['recall']:>8.3f}{s['f1']:>8.3f}{s['support']:>9}")
+
+    lines += ["", "Per checker branch (latency in s):"]
+    lines.append(f"  {'branch':<28}{'turns':>7}{'acc':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'tokens':>9}")
+    for branch, b in analysis["branches"].items():
+        lat = b["latency"]
+        lines.append(f"  {branch:<28}{b['turns']:>7}{b['accuracy']:>8.3f}"
+                     f"{lat['p50']:>8.2f}{lat['p95']:>8.2f}{lat['p99']:>8.2f}{b['tokens_mean']:>9.0f}")
+
+    lines += ["", "Most frequent confusions (truth -> pred):"]
+    matrix = np.array(analysis["confusion_matrix"])
+    errors = matrix.copy()
+    np.fill_diagonal(errors, 0)
+    for flat in np.argsort(errors, axis=None)[::-1][:10]:
+        truth, pred = np.unravel_index(flat, errors.shape)
+        if not errors[truth, pred]: break
+        lines.append(f"  {analysis['labels'][truth]} -> {analysis['labels'][pred]}: {int(errors[truth, pred])}")
+    return "\n".join(lines)
+
+
+def read_turn_records(paths: Iterable[str]) -> List[dict]:
+    """Turn records from .turns.jsonl files and from checkpoints (records with a "turns" list)."""
+    records = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip(): continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                records.extend(record["turns"] if "turns" in record else [record] if "truth" in record else [])
+    return records
+
+
+# ---------- helpers ----------
+
+def _distribution(values: np.ndarray) -> Optional[dict]:
+    if not values.size:
+        return None
+    p50, p95, p99 = np.percentile(values, PERCENTILES)
+    return {"mean": round(float(values.mean()), 4), "p50": round(float(p50), 4),
+            "p95": round(float(p95), 4), "p99": round(float(p99), 4), "max": round(float(values.max()), 4)}
+
+
+def _total_tokens(record: dict) -> int:
+    return sum(t.get("input", 0) + t.get("output", 0) for t in (record.get("tokens") or {}).values())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: python -m benchmark.util.analysis <turns.jsonl | checkpoint.jsonl> ...")
+    print(format_report(analyze(read_turn_records(sys.argv[1:]))))
@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from benchmark.util.checkpoint import BenchmarkCheckpoint, iter_pending, merge_checkpoints
+
+
+class BenchmarkRunner(ABC):
+    """
+    What every benchmark template shares: this shard's dialogues pulled by a fixed pool of workers,
+    the resumable checkpoint and the final report.
+
+    A template describes its run in `config` (provider, model, prompt...). Checkpoints are tied to
+    the hash of that config: the default checkpoint path contains it, every record carries it, and
+    resuming or merging records of another configuration is refused.
+    """
+    GREEN, RED, CYAN, YELLOW, RESET = "\033[92m", "\033[91m", "\033[96m", "\033[93m", "\033[0m"
+
+    # Short name of the benchmark, used in file names.
+    name: str = "benchmark"
+
+    def __init__(self, concurrency: int = 5, checkpoint_path: Optional[str] = None, shard: Tuple[int, int] = (0, 1)):
+        self.concurrency = concurrency
+        self.checkpoint_path = checkpoint_path
+        self.shard = shard
+        self.checkpoint: Optional[BenchmarkCheckpoint] = None
+
+        self.logs = []
+        self.turn_records = []
+        self.print_lock = asyncio.Lock()
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+
+    # ---- Public API ----
+
+    @property
+    @abstractmethod
+    def config(self) -> Dict[str, Any]:
+        """Everything that changes the results of a run; secrets excluded."""
+
+    @property
+    def title(self) -> str:
+        return self.name
+
+    def config_hash(self) -> str:
+        canonical = json.dumps(self.config, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+    def default_checkpoint_path(self) -> str:
+        index, count = self.shard
+        return f"io/output_files/checkpoints/{self.name}_{self.config_hash()}_shard{index}of{count}.jsonl"
+
+    async def run(self, dataset: Iterable[Dict]):
+        index, count = self.shard
+        print(f"{self.CYAN}--- Test Started | {self.title} | Config: {self.config_hash()} | Shard: {index}/{count} ---{self.RESET}")
+
+        self.checkpoint = BenchmarkCheckpoint(self.checkpoint_path, self.config_hash()) if self.checkpoint_path else None
+        pending = iter_pending(dataset, self.shard, self.checkpoint)
+        results = []
+
+        # A fixed pool of workers pulls dialogues as it goes, instead of one task per dialogue up front.
+        async def worker():
+            for dialog in pending:
+                results.append(await self._process_dialogue(dialog))
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+        if self.checkpoint:
+            self.checkpoint.close()
+            accuracy, records = merge_checkpoints([self.checkpoint_path], self.config_hash())
+            logs = [line for record in records for line in record["log"]]
+            turns = [turn for record in records for turn in record.get("turns", [])]
+        else:
+            total_correct = sum(r[0] for r in results)
+            total_msgs = sum(r[1] for r in results)
+            accuracy = total_correct / total_msgs if total_msgs else 0
+            logs, turns = self.logs, self.turn_records
+
+        self._save_to_file(accuracy, logs, suffix=f"_shard{index}of{count}" if count > 1 else "", turns=turns)
+
+        failed = sum(1 for r in results if r[2])
+        print(f"\n{self.CYAN}{'=' * 50}{self.RESET}")
+        if failed:
+            print(f"{self.YELLOW}{failed} dialogues failed; run again to retry them.{self.RESET}")
+        print(f"{self.GREEN if accuracy > 0.8 else self.RED}FINAL ACCURACY: {accuracy:.4f}{self.RESET}")
+        return accuracy
+
+    def merge(self, checkpoint_paths: List[str]):
+        """Final report over the checkpoints of every shard (all written with this configuration)."""
+        accuracy, records = merge_checkpoints(checkpoint_paths, self.config_hash())
+        self._save_to_file(accuracy, [line for record in records for line in record["log"]],
+                           turns=[turn for record in records for turn in record.get("turns", [])])
+        print(f"{self.CYAN}Merged {len(records)} dialogues from {len(checkpoint_paths)} checkpoints{self.RESET}")
+        print(f"{self.GREEN if accuracy > 0.8 else self.RED}FINAL ACCURACY: {accuracy:.4f}{self.RESET}")
+        return accuracy
+
+    # ---------- helpers ----------
+
+    async def _finish_dialogue(self, dialog_id, correct: int, total: int, terminal_output: List[str], failed: bool,
+                               turn_records: Optional[List[Dict]] = None) -> None:
+        """Print a dialogue's output in one piece and checkpoint it."""
+        async with self.print_lock:
+            for line in terminal_output: print(line)
+            self.logs.extend(terminal_output)
+            self.turn_records.extend(turn_records or [])
+            # Failed dialogues are not checkpointed, so a resumed run retries them.
+            if self.checkpoint and not failed:
+                self.checkpoint.append(dialog_id, correct, total, terminal_output, turn_records)
+
+    @abstractmethod
+    async def _process_dialogue(self, dialog: Dict) -> Tuple[int, int, bool]:
+        """(correct, user turns, failed) of one dialogue."""
+
+    @abstractmethod
+    def _save_to_file(self, accuracy: float, logs: List[str], suffix: str = "", turns: Optional[List[Dict]] = None):
+        ...
@@ -1,17 +1,20 @@
-import asyncio
+import hashlib
 import os
 import re
 from datetime import datetime
-from typing import Optional, Literal, List, Dict, Any
+from typing import Optional, Literal, List, Dict, Any, Tuple
 
 from langchain.agents import create_agent
 from langchain.agents.structured_output import ProviderStrategy, ToolStrategy
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from llm.replay import replay_llm
+from benchmark.util.benchmark_runner import BenchmarkRunner
 
-class BenchmarkTemplate:
-    GREEN, RED, CYAN, YELLOW, RESET = "\033[92m", "\033[91m", "\033[96m", "\033[93m", "\033[0m"
+
+class BenchmarkTemplate(BenchmarkRunner):
+    name = "intent"
 
     def __init__(
             self,
@@ -23,14 +26,17 @@ class BenchmarkTemplate:
             endpoint: Optional[str] = None,
             concurrency: int = 5,
             strategy_type: Literal["tool", "provider"] = "provider",
+            checkpoint_path: Optional[str] = None,
+            shard: Tuple[int, int] = (0, 1),
     ):
+        super().__init__(concurrency=concurrency, checkpoint_path=checkpoint_path, shard=shard)
         self.llm_type = llm_type
         self.model_name = model_name
         self.api_key = api_key
         self.system_prompt = system_prompt
         self.result_schema = result_schema
         self.endpoint = endpoint
-        self.concurrency = concurrency
+        self.strategy_type = strategy_type
 
         if strategy_type == "tool":
             self.strategy = ToolStrategy(self.result_schema)
@@ -46,11 +52,26 @@ class BenchmarkTemplate:
             system_prompt=self.system_prompt
         )
 
-        self.logs = []
-        self.print_lock = asyncio.Lock()
-        self.semaphore = asyncio.Semaphore(self.concurrency)
+    @property
+    def config(self) -> Dict[str, Any]:
+        return {
+            "benchmark": self.name,
+            "provider": self.llm_type,
+            "model": self.model_name,
+            "endpoint": self.endpoint,
+            "strategy": self.strategy_type,
+            "system_prompt": hashlib.sha256(str(self.system_prompt).encode("utf-8")).hexdigest()[:12],
+        }
+
+    @property
+    def title(self) -> str:
+        return f"Model: {self.model_name} | Tip: {self.llm_type}"
 
     def _setup_llm(self):
+        # LLM_REPLAY_MODE=record|replay runs the benchmark against a cassette (see llm.replay).
+        return replay_llm(f"benchmark:{self.llm_type}:{self.model_name}", self._create_llm)
+
+    def _create_llm(self):
         if self.llm_type == "openai":
             return ChatOpenAI(model=self.model_name, api_key=self.api_key, base_url=self.endpoint, temperature=0)
         elif self.llm_type == "google":
@@ -64,7 +85,7 @@ class BenchmarkTemplate:
 
     async def _process_dialogue(self, dialog: Dict):
         async with self.semaphore:
-            chat_history, correct_count, user_msg_count = [], 0, 0
+            chat_history, correct_count, user_msg_count, failed = [], 0, 0, False
             terminal_output = []
             dialog_id = dialog['dialogue_id']
 
@@ -96,38 +117,21 @@ class BenchmarkTemplate:
 
             except Exception as e:
                 terminal_output.append(f"{self.RED}Error in Dialogue {dialog_id}: {e}{self.RESET}")
+                failed = True
 
-            async with self.print_lock:
-                for line in terminal_output: print(line)
-                self.logs.extend(terminal_output)
-
-            return correct_count, user_msg_count
-
-    async def run(self, dataset: List[Dict]):
-        print(f"{self.CYAN}--- Test Started | Model: {self.model_name} | Tip: {self.llm_type} ---{self.RESET}")
-
-        tasks = [self._process_dialogue(d) for d in dataset]
-        results = await asyncio.gather(*tasks)
-
-        total_correct = sum(r[0] for r in results)
-        total_msgs = sum(r[1] for r in results)
-        accuracy = total_correct / total_msgs if total_msgs else 0
-
-        self._save_to_file(accuracy)
+            await self._finish_dialogue(dialog_id, correct_count, user_msg_count, terminal_output, failed)
 
-        print(f"\n{self.CYAN}{'=' * 50}{self.RESET}")
-        print(f"{self.GREEN if accuracy > 0.8 else self.RED}FINAL ACCURACY: {accuracy:.4f}{self.RESET}")
-        return accuracy
+            return correct_count, user_msg_count, failed
 
-    def _save_to_file(self, accuracy: float):
+    def _save_to_file(self, accuracy: float, logs: List[str], suffix: str = "", turns: Optional[List[Dict]] = None):
         safe_name = self.model_name.replace(":", "_").replace("/", "_")
         os.makedirs("io/output_files", exist_ok=True)
-        path = f"io/output_files/{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        path = f"io/output_files/{safe_name}{suffix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 
         ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
         with open(path, "w", encoding="utf-8") as f:
-            f.write(f"Model: {self.model_name}\nType: {self.llm_type}\nAccuracy: {accuracy:.4f}\n\n")
-            for entry in self.logs:
+            f.write(f"Model: {self.model_name}\nType: {self.llm_type}\nConfig: {self.config_hash()}\nAccuracy: {accuracy:.4f}\n\n")
+            for entry in logs:
                 f.write(ansi_escape.sub('', entry) + "\n")
         print(f"{self.CYAN}Saved at:{self.RESET} {path}")
\ No newline at end of file
@@ -0,0 +1,118 @@
+import json
+import os
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+
+def parse_shard(spec: Optional[str]) -> Tuple[int, int]:
+    """"i/N" -> (i, N) with 0 <= i < N; None or "" means the whole corpus (0, 1)."""
+    if not spec:
+        return 0, 1
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N (e.g. 0/4).")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{spec}': need 0 <= i < N.")
+    return index, count
+
+
+def in_shard(dialogue_id, shard: Tuple[int, int]) -> bool:
+    # crc32 rather than hash(): every process and machine must agree on the split.
+    index, count = shard
+    return count == 1 or zlib.crc32(str(dialogue_id).encode("utf-8")) % count == index
+
+
+def iter_pending(dataset: Iterable[dict], shard: Tuple[int, int], checkpoint: Optional["BenchmarkCheckpoint"]) -> Iterator[dict]:
+    """Dialogues of this shard that the checkpoint has not seen yet, pulled lazily from the dataset."""
+    for dialogue in dataset:
+        dialogue_id = dialogue["dialogue_id"]
+        if in_shard(dialogue_id, shard) and not (checkpoint and checkpoint.is_done(dialogue_id)):
+            yield dialogue
+
+
+class BenchmarkCheckpoint:
+    """
+    Append-only JSONL of finished dialogues: {"dialogue_id", "config", "correct", "total", "log"} and,
+    when the run records them, "turns" (one structured record per user turn, see benchmark.util.analysis).
+    Each record is flushed as soon as the dialogue ends, so a restart only redoes unfinished ones.
+
+    "config" is the hash of the run configuration (see BenchmarkRunner.config); a checkpoint written
+    with another configuration is refused instead of being resumed.
+    """
+
+    def __init__(self, path: str, config: Optional[str] = None):
+        self.path = path
+        self.config = config
+        self.records: Dict[str, dict] = {r["dialogue_id"]: r for r in read_checkpoint(path)}
+        check_config(path, self.records.values(), config)
+        if self.records:
+            logger.info(f"Resuming from {path}: {len(self.records)} dialogues already done.")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a+", encoding="utf-8")
+        # After a crash mid-write the last line is torn: start a fresh line so the next record stays readable.
+        if self._file.tell():
+            self._file.seek(self._file.tell() - 1)
+            if self._file.read(1) != "\n":
+                self._file.write("\n")
+
+    def is_done(self, dialogue_id) -> bool:
+        return str(dialogue_id) in self.records
+
+    def append(self, dialogue_id, correct: int, total: int, log: List[str], turns: Optional[List[dict]] = None) -> None:
+        record = {"dialogue_id": str(dialogue_id), "config": self.config, "correct": correct, "total": total, "log": log}
+        if turns is not None:
+            record["turns"] = turns
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.records[record["dialogue_id"]] = record
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_checkpoint(path: str) -> Iterator[dict]:
+    """Records of a checkpoint; a torn last line (crash mid-write) is skipped."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable line {line_number} of {path}")
+
+
+def check_config(path: str, records: Iterable[dict], config: Optional[str]) -> None:
+    """Raise if any record was written with another configuration than `config` (None skips the check)."""
+    if config is None:
+        return
+    others = {record.get("config") for record in records} - {config}
+    if others:
+        raise ValueError(
+            f"Checkpoint {path} was written with configuration {', '.join(map(str, others))}, not {config}: "
+            f"its results do not belong to this run. Use another --checkpoint or remove the file."
+        )
+
+
+def merge_checkpoints(paths: Iterable[str], config: Optional[str] = None) -> Tuple[float, List[dict]]:
+    """
+    (accuracy, records) over the checkpoints of every shard; a dialogue counted twice keeps its last record.
+    With `config`, every checkpoint must have been written with that configuration.
+    """
+    records: Dict[str, dict] = {}
+    for path in paths:
+        path_records = list(read_checkpoint(path))
+        check_config(path, path_records, config)
+        for record in path_records:
+            records[record["dialogue_id"]] = record
+
+    merged = list(records.values())
+    total = sum(r["total"] for r in merged)
+    accuracy = sum(r["correct"] for r in merged) / total if total else 0
+    return accuracy, merged
\ No newline at end of file
@@ -1,24 +1,34 @@
-import asyncio
+import json
 import os
 import re
+import time
 from datetime import datetime
-from typing import Optional, Literal, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
+from benchmark.util.analysis import analyze, format_report
+from benchmark.util.benchmark_runner import BenchmarkRunner
 from benchmark.util.topic_master_benchmark_wrapper import TopicMasterBenchmarkWrapper
 
 
-class TopicMasterBenchmarkTemplate:
-    GREEN, RED, CYAN, YELLOW, RESET = "\033[92m", "\033[91m", "\033[96m", "\033[93m", "\033[0m"
+class TopicMasterBenchmarkTemplate(BenchmarkRunner):
+    name = "topic_master"
+    title = "Model: 👑Topic Master"
 
     def __init__(
             self,
             concurrency: int = 5,
+            checkpoint_path: Optional[str] = None,
+            shard: Tuple[int, int] = (0, 1),
     ):
-        self.concurrency = concurrency
+        super().__init__(concurrency=concurrency, checkpoint_path=checkpoint_path, shard=shard)
 
-        self.logs = []
-        self.print_lock = asyncio.Lock()
-        self.semaphore = asyncio.Semaphore(self.concurrency)
+    @property
+    def config(self) -> Dict[str, Any]:
+        # The topic master's LLM (TOPIC_MASTER_LLM_*) and its tuning (TOPIC_CANDIDATES, TOPIC_IDLE_TURNS...)
+        return {
+            "benchmark": self.name,
+            **{k: v for k, v in sorted(os.environ.items()) if k.startswith("TOPIC_") and not k.endswith("API_KEY")},
+        }
 
     @staticmethod
     def _parse_intent(resp: Dict) -> str:
@@ -27,8 +37,8 @@ class TopicMasterBenchmarkTemplate:
 
     async def _process_dialogue(self, dialog: Dict):
         async with self.semaphore:
-            chat_history, correct_count, user_msg_count = [], 0, 0
-            terminal_output = []
+            chat_history, correct_count, user_msg_count, failed = [], 0, 0, False
+            terminal_output, turn_records = [], []
             dialog_id = dialog['dialogue_id']
 
             terminal_output.append(f"{self.CYAN}\n{'=' * 20} DIALOGUE {dialog_id} {'=' * 20}{self.RESET}")
@@ -43,13 +53,17 @@ class TopicMasterBenchmarkTemplate:
                     if msg["role"] == "user":
                         user_msg_count += 1
 
-                        result = agent.invoke(message=current_msg["content"])
+                        started = time.perf_counter()
+                        result = await agent.invoke(message=current_msg["content"])
+                        latency = time.perf_counter() - started
 
                         pred = self._parse_intent(result)
                         truth = msg["intent"].strip()
                         is_correct = pred.lower() == truth.lower()
 
                         if is_correct: correct_count += 1
+                        turn_records.append(self._turn_record(dialog_id, user_msg_count - 1, truth, pred,
+                                                              is_correct, latency, result))
 
                         color = self.GREEN if is_correct else self.RED
                         terminal_output.append(f"{self.YELLOW}User:{self.RESET} {msg['message']}")
@@ -64,37 +78,48 @@ class TopicMasterBenchmarkTemplate:
 
             except Exception as e:
                 terminal_output.append(f"{self.RED}Error in Dialogue {dialog_id}: {e}{self.RESET}")
+                failed = True
 
-            async with self.print_lock:
-                for line in terminal_output: print(line)
-                self.logs.extend(terminal_output)
+            await self._finish_dialogue(dialog_id, correct_count, user_msg_count, terminal_output, failed, turn_records)
 
-            return correct_count, user_msg_count
+            return correct_count, user_msg_count, failed
 
-    async def run(self, dataset: List[Dict]):
-        print(f"{self.CYAN}--- Test Started | Model: 👑Topic Master ---{self.RESET}")
-
-        tasks = [self._process_dialogue(d) for d in dataset]
-        results = await asyncio.gather(*tasks)
-
-        total_correct = sum(r[0] for r in results)
-        total_msgs = sum(r[1] for r in results)
-        accuracy = total_correct / total_msgs if total_msgs else 0
-
-        self._save_to_file(accuracy)
-
-        print(f"\n{self.CYAN}{'=' * 50}{self.RESET}")
-        print(f"{self.GREEN if accuracy > 0.8 else self.RED}FINAL ACCURACY: {accuracy:.4f}{self.RESET}")
-        return accuracy
-
-    def _save_to_file(self, accuracy: float):
+    @staticmethod
+    def _turn_record(dialog_id, turn: int, truth: str, pred: str, correct: bool, latency: float, result: Dict) -> Dict:
+        tracer = result.get("trace")
+        return {
+            "dialogue_id": str(dialog_id),
+            "turn": turn,
+            "truth": truth,
+            "pred": pred,
+            "correct": correct,
+            "stack_depth": result.get("stack_depth"),
+            "branch": tracer.branch if tracer else None,
+            "latency": round(latency, 4),
+            "stage_latency": {k: round(v, 4) for k, v in tracer.stage_latency.items()} if tracer else {},
+            "tokens": tracer.stage_tokens if tracer else {},
+        }
+
+    def _save_to_file(self, accuracy: float, logs: List[str], suffix: str = "", turns: Optional[List[Dict]] = None):
         os.makedirs("io/output_files", exist_ok=True)
-        path = f"io/output_files/topic_master_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        base = f"io/output_files/topic_master{suffix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        path = f"{base}.txt"
 
         ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
         with open(path, "w", encoding="utf-8") as f:
-            f.write(f"Model: 👑Topic Master\nAccuracy: {accuracy:.4f}\n\n")
-            for entry in self.logs:
+            f.write(f"Model: 👑Topic Master\nConfig: {self.config_hash()}\nAccuracy: {accuracy:.4f}\n\n")
+            for entry in logs:
                 f.write(ansi_escape.sub('', entry) + "\n")
-        print(f"{self.CYAN}Saved at:{self.RESET} {path}")
\ No newline at end of file
+        print(f"{self.CYAN}Saved at:{self.RESET} {path}")
+
+        if not turns: return
+        with open(f"{base}.turns.jsonl", "w", encoding="utf-8") as f:
+            for turn in turns:
+                f.write(json.dumps(turn, ensure_ascii=False) + "\n")
+
+        analysis = analyze(turns)
+        with open(f"{base}.analysis.json", "w", encoding="utf-8") as f:
+            json.dump(analysis, f, ensure_ascii=False, indent=2)
+        print(format_report(analysis))
+        print(f"{self.CYAN}Turn records and analysis at:{self.RESET} {base}.turns.jsonl, {base}.analysis.json")
\ No newline at end of file
@@ -6,6 +6,7 @@ from agentic_network.agents.topic_manager_cluster.utils.topic_manager_util impor
     embed_topic_id_to_message
 from agentic_network.core import AgentState
 from benchmark.core import ResultInfo
+from benchmark.util.turn_tracer import trace_turn
 
 
 class TopicMasterBenchmarkWrapper:
@@ -27,18 +28,21 @@ class TopicMasterBenchmarkWrapper:
         )
         self.graph_state["topic_master_state"] = self.topic_master_state
 
-    def invoke(self, message: str):
+    async def invoke(self, message: str):
         topic_master_cluster = TopicManagerCluster()
         self.topic_master_state["current_message"] = HumanMessage(message)
 
-        self.graph_state = topic_master_cluster(self.graph_state)
+        with trace_turn() as tracer:
+            self.graph_state = await topic_master_cluster(self.graph_state)
         self.topic_master_state = self.graph_state.get("topic_master_state")
         self.topic_master_state["agentic_state"] = self.graph_state
 
         current_agent = self.graph_state.get("active_agent")
         print(f"selected_intent: {current_agent}")
         return {
-            "structured_response": ResultInfo(extracted_intent=current_agent)
+            "structured_response": ResultInfo(extracted_intent=current_agent),
+            "trace": tracer,
+            "stack_depth": len(self.topic_master_state.get("topic_stack") or []),
         }
 
     def add_ai_message(self, message: str):
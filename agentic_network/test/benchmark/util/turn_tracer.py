@@ -0,0 +1,104 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.tracers.context import register_configure_hook
+
+from agentic_network.agents.topic_manager_cluster.core import TopicManagerRoutes
+
+STAGES = tuple(str(route) for route in TopicManagerRoutes
+               if route not in (TopicManagerRoutes.START, TopicManagerRoutes.NEXT, TopicManagerRoutes.END))
+# The checker that selected the topic is the last of these to run in a turn.
+BRANCHES = (
+    str(TopicManagerRoutes.TOPIC_CHANGE_CHECKER_AGENT),
+    str(TopicManagerRoutes.PRE_TOPICS_AGENT),
+    str(TopicManagerRoutes.NEW_TOPIC_AGENT),
+)
+
+_active_tracer: ContextVar[Optional["TurnTracer"]] = ContextVar("benchmark_turn_tracer", default=None)
+# Every callback manager configured while the variable is set picks the tracer up, so the cluster's
+# graph and the agents inside it report to it without being handed a config.
+register_configure_hook(_active_tracer, inheritable=True)
+
+
+class TurnTracer(BaseCallbackHandler):
+    """Latency and token usage of each topic-master stage during one user turn."""
+
+    run_inline = True
+
+    def __init__(self):
+        self.stages: List[str] = []
+        self.stage_latency: Dict[str, float] = {}
+        self.stage_tokens: Dict[str, Dict[str, int]] = {}
+        self._parents: Dict[UUID, Optional[UUID]] = {}
+        self._stage_runs: Dict[UUID, tuple] = {}
+
+    @property
+    def branch(self) -> Optional[str]:
+        fired = [stage for stage in self.stages if stage in BRANCHES]
+        return fired[-1] if fired else None
+
+    def on_chain_start(self, serialized: Optional[Dict[str, Any]], inputs: Any, *, run_id: UUID,
+                       parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self._parents[run_id] = parent_run_id
+        name = kwargs.get("name")
+        # Stage nodes are named after their route; nested agents have their own graphs with other node names.
+        if name in STAGES and self._stage_of(parent_run_id) is None:
+            self._stage_runs[run_id] = (name, time.perf_counter())
+            self.stages.append(name)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_stage(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_stage(run_id)
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: Any, *, run_id: UUID,
+                            parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self._parents[run_id] = parent_run_id
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID,
+                     parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self._parents[run_id] = parent_run_id
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        stage = self._stage_of(run_id) or "other"
+        tokens = self.stage_tokens.setdefault(stage, {"input": 0, "output": 0})
+
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if not usage: continue
+                tokens["input"] += usage.get("input_tokens", 0)
+                tokens["output"] += usage.get("output_tokens", 0)
+
+    # ---- Internal Methods ----
+
+    def _stage_of(self, run_id: Optional[UUID]) -> Optional[str]:
+        """Stage whose run encloses `run_id` (itself included), following parent links."""
+        while run_id is not None:
+            if run_id in self._stage_runs:
+                return self._stage_runs[run_id][0]
+            run_id = self._parents.get(run_id)
+        return None
+
+    def _finish_stage(self, run_id: UUID) -> None:
+        stage = self._stage_runs.get(run_id)
+        if stage is None: return
+        name, started = stage
+        self.stage_latency[name] = self.stage_latency.get(name, 0.0) + time.perf_counter() - started
+
+
+@contextmanager
+def trace_turn() -> Iterator[TurnTracer]:
+    """Collect stage timings and tokens of everything run in this context."""
+    tracer = TurnTracer()
+    token = _active_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _active_tracer.reset(token)
@@ -0,0 +1,3 @@
+from .pipeline import LoadTestState, NodeOverheadRecorder, build_pipeline_graph
+from .runner import LoadDriver, summarize
+from .stubs import StubChatModel, StubMCPBackend
\ No newline at end of file
@@ -0,0 +1,149 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import uuid
+
+from loguru import logger
+
+import llm.llm_client
+from fastapi_server import APIServer, AssistantService
+from load.pipeline import NodeOverheadRecorder, build_pipeline_graph
+from load.runner import LoadDriver
+from load.stubs import StubChatModel, StubMCPBackend
+from mcp_client import appointment_mcp, diagnosis_mcp
+
+API_KEY = "load-test-key"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test of the agentic server against stubbed LLM / MCP backends.")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 100, 1000],
+                        help="Concurrency levels: conversations running at the same time.")
+    parser.add_argument("--turns", type=int, default=4, help="User turns per conversation.")
+    parser.add_argument("--transport", choices=["invoke", "stream", "both"], default="both")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds every stub LLM call takes.")
+    parser.add_argument("--mcp-latency", type=float, default=0.01, help="Seconds every stub MCP tool call takes.")
+    parser.add_argument("--tool-rounds", type=int, default=1, help="Tool calls the stub model makes per turn.")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Also measure Python allocations with tracemalloc (slower, exact per-session growth).")
+    parser.add_argument("--output", default="io/output_files/load",
+                        help="Directory for the result file (load_<run id>.json) and history.jsonl.")
+    parser.add_argument("--baseline", default=None,
+                        help="Earlier result file to compare with; regressions beyond --max-regression fail the run.")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Allowed relative drop in throughput / rise in p95 latency against the baseline.")
+    parser.add_argument("--verbose", action="store_true", help="Keep the agents' console output.")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+
+    # Stubs go in before anything builds a model or lists tools.
+    stub_llm = StubChatModel(latency=args.llm_latency, tool_rounds=args.tool_rounds)
+    llm.llm_client._create_llm = lambda llm_type: stub_llm
+    mcp_backend = StubMCPBackend(latency=args.mcp_latency)
+    mcp_backend.install(appointment_mcp, diagnosis_mcp)
+
+    recorder = NodeOverheadRecorder()
+    total_sessions = sum(args.sessions) * (2 if args.transport == "both" else 1)
+    service = AssistantService(
+        max_sessions=max(10_000, total_sessions),
+        request_timeout=None,
+        graph_factory=lambda checkpointer: build_pipeline_graph(recorder),
+    )
+    server = APIServer(service=service, api_key=API_KEY)
+    await service.startup()
+
+    driver = LoadDriver(server.app, service, API_KEY, recorder, trace_memory=args.trace_memory, quiet=not args.verbose)
+    transports = ["invoke", "stream"] if args.transport == "both" else [args.transport]
+
+    levels = []
+    try:
+        for transport in transports:
+            for sessions in args.sessions:
+                logger.info(f"{transport}: {sessions} concurrent sessions x {args.turns} turns")
+                level = (await driver.run_level(transport, sessions, args.turns)).to_dict()
+                levels.append(level)
+                logger.info(
+                    f"  {level['throughput_turns_per_s']} turns/s, p50 {level['latency_ms'].get('p50')} ms, "
+                    f"p99 {level['latency_ms'].get('p99')} ms, errors {level['errors']}, "
+                    f"loop lag max {level['event_loop_lag_ms'].get('max')} ms"
+                )
+    finally:
+        await service.shutdown()
+
+    report = {
+        "run_id": f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}",
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "baseline", "verbose")},
+        "levels": levels,
+    }
+    path = _save_report(report, args.output)
+    logger.info(f"Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(json.load(f), report, args.max_regression)
+        for line in regressions:
+            logger.error(line)
+        if regressions:
+            sys.exit(1)
+        logger.info(f"No regression beyond {args.max_regression:.0%} against {args.baseline}")
+
+
+def compare(baseline: dict, report: dict, max_regression: float) -> list:
+    """Levels (same transport and concurrency) whose throughput or p95 latency got worse than allowed."""
+    previous = {(level["transport"], level["sessions"]): level for level in baseline.get("levels", [])}
+    regressions = []
+
+    for level in report["levels"]:
+        before = previous.get((level["transport"], level["sessions"]))
+        if before is None:
+            continue
+        name = f"{level['transport']}@{level['sessions']}"
+
+        if before["throughput_turns_per_s"] and \
+                level["throughput_turns_per_s"] < before["throughput_turns_per_s"] * (1 - max_regression):
+            regressions.append(f"{name}: throughput {before['throughput_turns_per_s']} -> "
+                               f"{level['throughput_turns_per_s']} turns/s")
+
+        p95_before, p95_now = before["latency_ms"].get("p95"), level["latency_ms"].get("p95")
+        if p95_before and p95_now and p95_now > p95_before * (1 + max_regression):
+            regressions.append(f"{name}: p95 latency {p95_before} -> {p95_now} ms")
+
+        if level["errors"] > before["errors"]:
+            regressions.append(f"{name}: errors {before['errors']} -> {level['errors']}")
+
+    return regressions
+
+
+def _save_report(report: dict, directory: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"load_{report['run_id']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    # One line per run, to follow the numbers across releases without opening every file.
+    with open(os.path.join(directory, "history.jsonl"), "a", encoding="utf-8") as f:
+        f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    return path
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+"""
+The agent graph the load test serves: AgentGraph's topology (pre-processing -> assistant <-> tools ->
+post-processing) built from the production nodes, with the appointment agent as the assistant.
+"""
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.agents import AgentFinish
+from langgraph.graph import StateGraph
+
+from agentic_network.agents import AppointmentAgent, PostProcessingAgent, PreProcessingAgent, ToolsAgent
+from agentic_network.core import AgentState, Routes
+from agentic_network.routing import decide_tools
+from agentic_network.utils import BaseAgent
+from load.stubs import backend_wait
+from monitoring import instrument_node
+
+
+class LoadTestState(AgentState):
+    # AssistantService.invoke reads the answer from agent_outcome, so the graph state has to carry it.
+    intermediate_steps: list
+    agent_outcome: Optional[Any]
+
+
+class OutcomeAssistantAgent(BaseAgent):
+    """Runs the appointment agent and turns its reply into the agent_outcome decide_tools routes on."""
+
+    def __init__(self):
+        self.agent = AppointmentAgent()
+
+    async def _get_node(self, agent_state: LoadTestState) -> dict:
+        result = await self.agent(agent_state)
+        reply = result["messages"][-1]
+        if reply.tool_calls:
+            return {**result, "agent_outcome": None}
+        return {**result, "agent_outcome": AgentFinish({"output": str(reply.content)}, str(reply.content))}
+
+
+class NodeOverheadRecorder:
+    """Per node: wall time of every execution, and that time minus what the node waited on the stubs."""
+
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = {}
+        self.overheads: Dict[str, List[float]] = {}
+
+    def wrap(self, name: str, node):
+        durations = self.durations.setdefault(name, [])
+        overheads = self.overheads.setdefault(name, [])
+
+        async def recorded_node(state):
+            wait = [0.0]
+            token = backend_wait.set(wait)
+            started = time.perf_counter()
+            try:
+                return await node(state)
+            finally:
+                elapsed = time.perf_counter() - started
+                backend_wait.reset(token)
+                durations.append(elapsed)
+                overheads.append(max(0.0, elapsed - wait[0]))
+
+        return recorded_node
+
+    def reset(self) -> None:
+        for samples in (*self.durations.values(), *self.overheads.values()):
+            samples.clear()
+
+
+def build_pipeline_graph(recorder: NodeOverheadRecorder):
+    """Compiled graph for AssistantService(graph_factory=...); call after the MCP clients are initialized."""
+    graph_builder = StateGraph(LoadTestState)
+
+    # ---------------------- Nodes -----------------------------------------------
+    # instrument_node keeps the production metrics; the recorder adds the backend-free overhead.
+    for route, agent in (
+        (Routes.PRE_PROCESSING, PreProcessingAgent()),
+        (Routes.ASSISTANT, OutcomeAssistantAgent()),
+        (Routes.TOOLS, ToolsAgent()),
+        (Routes.POST_PROCESSING, PostProcessingAgent()),
+    ):
+        graph_builder.add_node(route, recorder.wrap(str(route), instrument_node(route, agent)))
+
+    # ---------------------- Lineer Edges ----------------------------------------
+    graph_builder.add_edge(Routes.START, Routes.PRE_PROCESSING)
+    graph_builder.add_edge(Routes.PRE_PROCESSING, Routes.ASSISTANT)
+    graph_builder.add_edge(Routes.TOOLS, Routes.ASSISTANT)
+    graph_builder.add_edge(Routes.POST_PROCESSING, Routes.END)
+
+    # ---------------------- Conditional Edges -----------------------------------
+    graph_builder.add_conditional_edges(Routes.ASSISTANT, decide_tools, path_map={
+        "tools": Routes.TOOLS,
+        "end": Routes.POST_PROCESSING
+    })
+
+    # ---------------------- Compile ---------------------------------------------
+    return graph_builder.compile()
@@ -0,0 +1,244 @@
+"""
+Drives an APIServer in process (no sockets) with concurrent synthetic conversations and measures it.
+
+/invoke goes through httpx's ASGI transport; /stream through a minimal in-memory ASGI WebSocket
+client, since that transport speaks HTTP only. Both exercise the full app: middleware, auth, the
+service, the graph and the stubbed backends.
+"""
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import os
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+USER_MESSAGES = [
+    "Merhaba, {city} için kardiyoloji randevusu almak istiyorum.",
+    "Hangi hastanelerde uygun doktor var?",
+    "Doktor {doctor} için en erken boş saat ne zaman?",
+    "Salı günü öğleden sonra olur mu?",
+    "Tamam, o saate randevu oluştur lütfen.",
+    "Randevularımı listeler misin?",
+]
+CITIES = ["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya"]
+
+
+@dataclass
+class TurnResult:
+    latency: float
+    ok: bool
+    first_event: Optional[float] = None
+
+
+@dataclass
+class LevelResult:
+    transport: str
+    sessions: int
+    turns_per_session: int
+    duration: float = 0.0
+    turns: List[TurnResult] = field(default_factory=list)
+    loop_lags: List[float] = field(default_factory=list)
+    rss_growth: int = 0
+    traced_growth: Optional[int] = None
+    sessions_cached: int = 0
+    nodes: Dict[str, dict] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        latencies = [t.latency for t in self.turns if t.ok]
+        first_events = [t.first_event for t in self.turns if t.ok and t.first_event is not None]
+        completed = len(latencies)
+
+        result = {
+            "transport": self.transport,
+            "sessions": self.sessions,
+            "turns_per_session": self.turns_per_session,
+            "turns": len(self.turns),
+            "errors": len(self.turns) - completed,
+            "duration_s": round(self.duration, 4),
+            "throughput_turns_per_s": round(completed / self.duration, 2) if self.duration else 0.0,
+            "latency_ms": summarize(latencies),
+            "nodes": self.nodes,
+            "memory": {
+                "rss_growth_bytes": self.rss_growth,
+                "rss_growth_per_session_bytes": self.rss_growth // self.sessions,
+                "sessions_cached": self.sessions_cached,
+            },
+            "event_loop_lag_ms": summarize(self.loop_lags),
+        }
+        if first_events:
+            result["first_event_ms"] = summarize(first_events)
+        if self.traced_growth is not None:
+            result["memory"]["traced_growth_per_session_bytes"] = self.traced_growth // self.sessions
+        return result
+
+
+# ---- Public API ----
+
+def summarize(samples: List[float]) -> dict:
+    """Seconds -> {count, mean, p50, p95, p99, max} in milliseconds (nearest-rank percentiles)."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def rank(q: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+    return {
+        "count": len(ordered),
+        "mean": round(1000 * sum(ordered) / len(ordered), 3),
+        "p50": round(1000 * rank(0.50), 3),
+        "p95": round(1000 * rank(0.95), 3),
+        "p99": round(1000 * rank(0.99), 3),
+        "max": round(1000 * ordered[-1], 3),
+    }
+
+
+def user_message(session: int, turn: int) -> str:
+    template = USER_MESSAGES[turn % len(USER_MESSAGES)]
+    return template.format(city=CITIES[session % len(CITIES)], doctor=f"D{session % 40:03d}")
+
+
+class LoadDriver:
+    """Runs levels of N concurrent sessions, each a multi-turn conversation, against one app."""
+
+    def __init__(self, app, service, api_key: str, recorder, trace_memory: bool = False,
+                 lag_interval: float = 0.01, quiet: bool = True):
+        self.app = app
+        self.service = service
+        self.api_key = api_key
+        self.recorder = recorder
+        self.trace_memory = trace_memory
+        self.lag_interval = lag_interval
+        self.quiet = quiet
+
+    async def run_level(self, transport: str, sessions: int, turns: int) -> LevelResult:
+        level = LevelResult(transport=transport, sessions=sessions, turns_per_session=turns)
+        turn = self._invoke_turn if transport == "invoke" else self._stream_turn
+
+        gc.collect()
+        self.recorder.reset()
+        rss_before = _rss_bytes()
+        if self.trace_memory:
+            tracemalloc.start()
+        traced_before = tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+
+        lag_task = asyncio.create_task(self._sample_loop_lag(level.loop_lags))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url="http://load",
+                                     timeout=None) as http:
+            conversations = [self._conversation(http, turn, session, turns, level.turns) for session in range(sessions)]
+            output = io.StringIO() if self.quiet else None
+            # The agents print every turn; at a thousand sessions the terminal would dominate the timings.
+            with contextlib.redirect_stdout(output) if output is not None else contextlib.nullcontext():
+                started = time.perf_counter()
+                await asyncio.gather(*conversations)
+                level.duration = time.perf_counter() - started
+        lag_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await lag_task
+
+        gc.collect()
+        level.rss_growth = max(0, _rss_bytes() - rss_before)
+        if self.trace_memory:
+            level.traced_growth = max(0, tracemalloc.get_traced_memory()[0] - traced_before)
+            tracemalloc.stop()
+        level.sessions_cached = len(self.service.state_cache)
+        level.nodes = {
+            name: {
+                "executions": len(durations),
+                "duration_ms": summarize(durations),
+                "overhead_ms": summarize(self.recorder.overheads[name]),
+            }
+            for name, durations in self.recorder.durations.items() if durations
+        }
+        return level
+
+    # ---------- helpers ----------
+
+    async def _conversation(self, http: httpx.AsyncClient, turn, session: int, turns: int, results: List[TurnResult]):
+        thread_id = str(uuid.uuid4())
+        for index in range(turns):
+            results.append(await turn(http, thread_id, user_message(session, index)))
+
+    async def _invoke_turn(self, http: httpx.AsyncClient, thread_id: str, message: str) -> TurnResult:
+        started = time.perf_counter()
+        try:
+            response = await http.post(
+                "/invoke",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                json={"thread_id": thread_id, "client_turn_id": str(uuid.uuid4()), "input": {"message": message}},
+            )
+            ok = response.status_code == 200
+        except Exception:
+            ok = False
+        return TurnResult(latency=time.perf_counter() - started, ok=ok)
+
+    async def _stream_turn(self, http: httpx.AsyncClient, thread_id: str, message: str) -> TurnResult:
+        started = time.perf_counter()
+        first_event = None
+        ok = False
+
+        receive_queue: asyncio.Queue = asyncio.Queue()
+        send_queue: asyncio.Queue = asyncio.Queue()
+        scope = {
+            "type": "websocket", "asgi": {"version": "3.0"}, "scheme": "ws", "http_version": "1.1",
+            "path": "/stream", "raw_path": b"/stream", "root_path": "",
+            "query_string": f"token={self.api_key}".encode(), "headers": [(b"host", b"load")],
+            "client": ("127.0.0.1", 0), "server": ("load", 80), "subprotocols": [],
+        }
+        await receive_queue.put({"type": "websocket.connect"})
+        await receive_queue.put({"type": "websocket.receive",
+                                 "text": json.dumps({"thread_id": thread_id, "input": {"message": message}})})
+        app_task = asyncio.create_task(self.app(scope, receive_queue.get, send_queue.put))
+
+        try:
+            while True:
+                sent = await _next_message(send_queue, app_task)
+                if sent is None or sent["type"] == "websocket.close":
+                    break
+                if sent["type"] != "websocket.send":
+                    continue
+                if first_event is None:
+                    first_event = time.perf_counter() - started
+                event = json.loads(sent.get("text") or sent.get("bytes") or "{}")
+                if event.get("event") in ("complete", "error"):
+                    ok = event["event"] == "complete"
+                    break
+        finally:
+            await receive_queue.put({"type": "websocket.disconnect", "code": 1000})
+            with contextlib.suppress(Exception):
+                await app_task
+
+        return TurnResult(latency=time.perf_counter() - started, ok=ok, first_event=first_event)
+
+    async def _sample_loop_lag(self, lags: List[float]) -> None:
+        while True:
+            expected = time.perf_counter() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def _next_message(send_queue: asyncio.Queue, app_task: asyncio.Task) -> Optional[dict]:
+    """Next ASGI message the app sent, or None once the app has returned without sending more."""
+    getter = asyncio.ensure_future(send_queue.get())
+    done, _ = await asyncio.wait({getter, app_task}, return_when=asyncio.FIRST_COMPLETED)
+    if getter in done:
+        return getter.result()
+    getter.cancel()
+    return None if send_queue.empty() else send_queue.get_nowait()
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (Linux); falls back to the peak on other platforms."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
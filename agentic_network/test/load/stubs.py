@@ -0,0 +1,183 @@
+"""
+Stand-ins for the LLM and MCP backends, so a load test measures the server and not the providers.
+
+Both sleep a configurable latency on the event loop (as a remote call would) and answer
+deterministically, so two runs of the suite do the same work.
+"""
+import asyncio
+import json
+import time
+import uuid
+import zlib
+from contextvars import ContextVar
+from typing import Any, List, Optional, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import ConfigDict
+
+# The appointment server's read tools plus one write, so the client-side result cache sees both hits and invalidations.
+STUB_TOOL_SPECS = [
+    {
+        "name": "get_available_hospitals",
+        "description": "List hospitals in a city, optionally filtered by district.",
+        "input_schema": {"type": "object", "properties": {"city": {"type": "string"}, "district": {"type": "string"}},
+                         "required": ["city"]},
+    },
+    {
+        "name": "get_doctors_by_hospital_and_branch",
+        "description": "List the doctors of a hospital branch.",
+        "input_schema": {"type": "object", "properties": {"hospital_id": {"type": "string"}, "branch": {"type": "string"}},
+                         "required": ["hospital_id", "branch"]},
+    },
+    {
+        "name": "get_available_slots",
+        "description": "Free slots of a doctor.",
+        "input_schema": {"type": "object", "properties": {"doctor_id": {"type": "string"}}, "required": ["doctor_id"]},
+    },
+    {
+        "name": "create_appointment",
+        "description": "Book a slot for a patient.",
+        "input_schema": {"type": "object",
+                         "properties": {"doctor_id": {"type": "string"}, "patient_id": {"type": "string"},
+                                        "date_str": {"type": "string"}, "time_str": {"type": "string"}},
+                         "required": ["doctor_id", "patient_id", "date_str", "time_str"]},
+    },
+]
+
+# Seconds the current graph node spent waiting on a stubbed backend; set per node by the pipeline
+# (a one-element list, so waits in tasks the node spawns are added to the same total).
+backend_wait: ContextVar[Optional[list]] = ContextVar("backend_wait", default=None)
+
+# How many distinct argument values the stub model draws from: low enough for realistic tool-cache hits.
+ARGUMENT_VARIETY = 50
+
+
+class StubChatModel(BaseChatModel):
+    """
+    Chat model that answers after `latency` seconds. With tools bound it first asks for `tool_rounds`
+    tool calls (cycling through the bound tools, arguments filled from their schemas), then answers in text.
+    """
+    model_config = ConfigDict(protected_namespaces=())
+
+    latency: float = 0.0
+    tool_rounds: int = 1
+    model_name: str = "stub"
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    # ---- Internal Methods --------------------------------------------------------
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+            _add_wait(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._answer(messages, kwargs.get("tools")))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+            _add_wait(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._answer(messages, kwargs.get("tools")))])
+
+    def _answer(self, messages: List[BaseMessage], tools: Optional[list]) -> AIMessage:
+        turn = _current_turn(messages)
+        user_text = str(turn[0].content) if turn else ""
+        rounds_done = sum(isinstance(m, ToolMessage) for m in turn)
+        usage = {"input_tokens": sum(len(str(m.content)) // 4 for m in messages), "output_tokens": 16}
+
+        if tools and rounds_done < self.tool_rounds:
+            function = tools[rounds_done % len(tools)]["function"]
+            return AIMessage(
+                content="",
+                tool_calls=[{"name": function["name"], "args": _fill_arguments(function.get("parameters") or {}, user_text),
+                             "id": f"call_{uuid.uuid4().hex[:12]}"}],
+                usage_metadata={**usage, "total_tokens": usage["input_tokens"] + usage["output_tokens"]},
+            )
+
+        return AIMessage(
+            content=f"Stub answer to: {user_text[:80]}",
+            usage_metadata={**usage, "total_tokens": usage["input_tokens"] + usage["output_tokens"]},
+        )
+
+
+class StubMCPBackend:
+    """
+    Replaces the network side of MCPClient instances: tools come from STUB_TOOL_SPECS and each call
+    sleeps `latency` seconds before returning a small JSON payload. The client's own code (tool proxies,
+    result cache, metrics) still runs.
+    """
+
+    def __init__(self, latency: float = 0.0, tool_specs: Optional[list] = None):
+        self.latency = latency
+        self.tool_specs = tool_specs or STUB_TOOL_SPECS
+        self.calls = 0
+
+    def install(self, *clients) -> None:
+        for client in clients:
+            client.initialize = self._initializer(client)
+            client._call_remote = self._call_remote
+            client.close = self._close
+
+    # ---------- helpers ----------
+
+    def _initializer(self, client):
+        manifest = {"server": client.label, "hash": f"stub-{client.label}", "tools": self.tool_specs}
+
+        async def initialize():
+            client._apply_manifest(manifest)
+            client.available = True
+
+        return initialize
+
+    async def _call_remote(self, name: str, arguments: dict) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+            _add_wait(self.latency)
+        return json.dumps({"tool": name, "arguments": arguments, "ok": True}, ensure_ascii=False)
+
+    @staticmethod
+    async def _close():
+        return None
+
+
+def _add_wait(seconds: float) -> None:
+    wait = backend_wait.get()
+    if wait is not None:
+        wait[0] += seconds
+
+
+def _current_turn(messages: List[BaseMessage]) -> List[BaseMessage]:
+    """Messages from the last user message on: what the model has done for this turn so far."""
+    for index in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[index], HumanMessage):
+            return messages[index:]
+    return []
+
+
+def _fill_arguments(parameters: dict, seed_text: str) -> dict:
+    # crc32 rather than hash(): the same conversation must produce the same calls in every run.
+    variant = zlib.crc32(seed_text.encode("utf-8")) % ARGUMENT_VARIETY
+    arguments = {}
+    for name, meta in (parameters.get("properties") or {}).items():
+        if name not in parameters.get("required", []):
+            continue
+        kind = meta.get("type", "string")
+        if kind in ("integer", "number"):
+            arguments[name] = variant
+        elif kind == "boolean":
+            arguments[name] = True
+        else:
+            arguments[name] = f"{name}-{variant}"
+    return arguments
@@ -1,3 +1,4 @@
+import asyncio
 from dotenv import load_dotenv, find_dotenv
 from agentic_network.agents.topic_manager_cluster.agents.new_topic_agent import NewTopicAgent
 from langchain_core.messages import HumanMessage, AIMessage
@@ -19,7 +20,7 @@ def main():
         disclosed_topics = [],
         topic_selected = False
     )
-    state.update(agent(state))
+    state.update(asyncio.run(agent(state)))
     # ai_message: AIMessage = state.get("messages")[-1]
 
     for key, value in state.items():
@@ -0,0 +1,67 @@
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import StructuredTool
+
+from agentic_network.agents.appointment.tool_keywords import tool_keywords, tool_requires, tool_always
+from agentic_network.utils.tool_selector import ToolSelector, fold_turkish
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+LOOKUPS = {"get_available_hospitals", "get_doctors_by_hospital_and_branch", "get_available_slots", "find_earliest_slots"}
+
+
+def _selector() -> ToolSelector:
+    # The appointment MCP server's tools, by name only: selection never calls them.
+    tools = [StructuredTool.from_function(lambda: None, name=name, description=name) for name in tool_keywords]
+    return ToolSelector("appointment_test", model=None, tools=tools,
+                        keywords=tool_keywords, requires=tool_requires, always=tool_always)
+
+
+def _select(*user_messages: str) -> set:
+    messages = []
+    for text in user_messages:
+        messages += [HumanMessage(text), AIMessage("...")]
+    return set(_selector().select(messages[:-1]))
+
+
+def test_fold_turkish():
+    assert fold_turkish("İLK") == fold_turkish("ilk") == "ilk"
+    assert fold_turkish("İptal") == "iptal"
+    assert fold_turkish("ŞEHİR") == fold_turkish("şehir") == "sehir"
+
+
+def test_turkish_openers():
+    assert _select("Merhaba, kardiyoloji randevusu almak istiyorum.") == LOOKUPS | {"create_appointment"}
+    assert _select("İlk boş saate yaz") == LOOKUPS | {"create_appointment"}
+    assert _select("Randevumu iptal etmek istiyorum") == LOOKUPS | {"cancel_appointment", "get_patient_appointments"}
+    assert _select("Yarınki randevumu ertele") == LOOKUPS | {"update_appointment", "get_patient_appointments"}
+
+
+def test_follow_up_keeps_the_request():
+    assert _select("Ankara Şehir Hastanesi olsun") == LOOKUPS
+    assert _select("Kardiyoloji randevusu almak istiyorum", "Ankara Şehir Hastanesi olsun") == LOOKUPS | {"create_appointment"}
+
+
+def test_english_openers():
+    assert _select("I'd like to book an appointment with a cardiologist.") == LOOKUPS | {"create_appointment"}
+    assert _select("Please cancel my appointment") == LOOKUPS | {"cancel_appointment", "get_patient_appointments"}
+    assert _select("Can I reschedule the appointment to Friday?") == LOOKUPS | {"update_appointment", "get_patient_appointments"}
+
+
+def test_no_keyword_binds_everything():
+    assert _select("Merhaba") == set(tool_keywords)
+
+
+def main():
+    for test in (test_fold_turkish, test_turkish_openers, test_follow_up_keeps_the_request,
+                 test_english_openers, test_no_keyword_binds_everything):
+        try:
+            test()
+            print(f"{GREEN}PASS{RESET} {test.__name__}")
+        except AssertionError as e:
+            print(f"{RED}FAIL{RESET} {test.__name__} {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import asyncio
 from dotenv import load_dotenv, find_dotenv
 from mcp.server.fastmcp.prompts.base import UserMessage
 
@@ -38,7 +39,7 @@ def main():
         disclosed_topics = [],
         topic_selected = False
     )
-    state.update(agent(state))
+    state.update(asyncio.run(agent(state)))
     # ai_message: AIMessage = state.get("messages")[-1]
 
     for key, value in state.items():
@@ -1,3 +1,4 @@
+import asyncio
 from langchain_core.messages import HumanMessage
 
 from agentic_network.agents.topic_manager_cluster.core import TopicManagerState
@@ -25,7 +26,7 @@ def main():
         topic_master_cluster = TopicManagerCluster()
         topic_master_state["current_message"] = HumanMessage(message)
 
-        agent_state = topic_master_cluster(agent_state)
+        agent_state = asyncio.run(topic_master_cluster(agent_state))
         topic_master_state = agent_state.get("topic_master_state")
         topic_master_state["agentic_state"] = agent_state
 
@@ -2,62 +2,96 @@ from datetime import datetime, timedelta
 import uuid
 from typing import List
 
-from appointment.util.data import MOCK_DATA
 from appointment.util.core.models import *
+from appointment.util.store import AppointmentRepository, SearchIndex, create_repository
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 50
+DEFAULT_EARLIEST_SLOTS = 5
 
 
 class AppointmentManager:
     """ Manages medical appointments including creation and updates."""
 
-    def __init__(self):
-        self.hospitals = MOCK_DATA["hospitals"]
-        self.doctors = MOCK_DATA["doctors"]
-        self.appointments = MOCK_DATA["appointments"]
-        self.availability_map = MOCK_DATA["availability_map"]
-        self.patients = MOCK_DATA["patients"]
-
-        self.appointments_by_id = {app.id: app for app in self.appointments}
-
+    def __init__(self, data: dict = None, repository: AppointmentRepository = None):
+        # Backend from APPOINTMENT_BACKEND ("memory" | "sqlite") unless one is passed in.
+        self.repository = repository if repository is not None else create_repository(data)
+        # Hospitals and doctors are reference data (never written by tools), so the index is built once.
+        self.search_index = SearchIndex(self.repository.list_hospitals(), self.repository.list_doctors())
 
     # HELPER FUNCTIONS
 
     def _get_appointment_by_id(self, appointment_id: str):
         """Internal helper to safely retrieve an appointment object."""
-        return self.appointments_by_id.get(appointment_id)
+        return self.repository.get_appointment(appointment_id)
 
     def _is_slot_booked(self, doctor_id: str, target_dt: datetime) -> bool:
         """Internal helper to check if a specific slot is already taken in the database."""
-        for app in self.appointments:
-            if (app.doctor_id == doctor_id and
-                    app.status == AppointmentStatus.BOOKED and
-                    app.start_time == target_dt):
-                return True
-        return False
-
-    def _filter_doctors(self, hospital_id: str = None, branch: str = None) -> List:
-        """Internal helper to filter doctors based on hospital and branch."""
-        filtered_docs = self.doctors
-        if hospital_id:
-            filtered_docs = [d for d in filtered_docs if d.hospital_id == hospital_id]
-        if branch:
-            filtered_docs = [d for d in filtered_docs if d.branch == branch]
-        return filtered_docs
+        return self.repository.is_booked(doctor_id, target_dt)
+
+    @staticmethod
+    def _parse_slot(date_str: str, time_str: str):
+        """Internal helper to parse a requested slot; None if the date or time is malformed."""
+        try:
+            return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+        except (TypeError, ValueError):
+            return None
+
+    def _new_appointment(self, doctor_id: str, patient_id: str, date_str: str, time_str: str) -> Appointment:
+        """Internal helper to validate a requested slot and build (not store) the appointment."""
+        doctor = self.repository.get_doctor(doctor_id)
+        if not doctor:
+            raise ValueError(f"Doctor with ID {doctor_id} not found.")
+
+        patient = self.repository.get_patient(patient_id)
+        if not patient:
+            raise ValueError(f"Patient with ID {patient_id} not found.")
+
+        target_dt = self._parse_slot(date_str, time_str)
+        if target_dt is None or not self.repository.has_slot(doctor_id, target_dt):
+            raise ValueError(f"Doctor {doctor.name} is not available at {date_str} {time_str}.")
+
+        if self.repository.is_booked(doctor_id, target_dt):
+            raise ValueError(f"The slot {date_str} {time_str} is already booked.")
+
+        return Appointment(
+            id=str(uuid.uuid4()),
+            doctor_id=doctor.id,
+            patient_id=patient.id,
+            start_time=target_dt,
+            status=AppointmentStatus.BOOKED,
+            end_time=target_dt + timedelta(minutes=30),
+            hospital_id=doctor.hospital_id
+        )
+
+    @staticmethod
+    def _page_info(page: int, page_size: int, total: int) -> dict:
+        """Internal helper for the paging fields of search results."""
+        return {"total": total, "page": page, "page_size": page_size, "has_more": page * page_size < total}
+
+    @staticmethod
+    def _clamp_paging(page: int, page_size: int):
+        """Internal helper to keep paging arguments in range."""
+        return max(1, int(page or 1)), min(MAX_PAGE_SIZE, max(1, int(page_size or DEFAULT_PAGE_SIZE)))
 
     # FUNCTIONS
 
-    def get_available_hospitals(self, city, district: str = None):
+    def get_available_hospitals(self, city, district: str = None, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE):
         """
-        Retrieves a list of active hospitals.
+        Retrieves a page of active hospitals.
 
         This tool allows filtering by location (City and District).
         Even if the user does not provide a location, this tool should be called to list all options.
+        Names are matched case-insensitively (Turkish İ/ı aware), by prefix, and tolerate small typos.
 
         Args:
             city (str, Optional): The city name extracted from user query (e.g., "İstanbul", "Ankara").
             district (str, Optional): The district/county name (e.g., "Kadıköy", "Çankaya").
+            page (int): 1-based page number.
+            page_size (int): Hospitals per page (at most MAX_PAGE_SIZE).
 
         Returns:
-            list: A list of dictionaries containing hospital ID and name.
+            dict: {"hospitals": [{"id", "name", "district"}, ...], "total", "page", "page_size", "has_more"}
 
         Example Usage:
             # User: "Hospitals in Kadıköy"
@@ -66,49 +100,79 @@ class AppointmentManager:
             # User: "Show me all hospitals"
             get_available_hospitals()
         """
-        return [
-            {"id": h["id"], "name": h["name"]}
-            for h in self.hospitals
-        ]
+        page, page_size = self._clamp_paging(page, page_size)
+        hospitals, total = self.search_index.search_hospitals(city, district, page=page, page_size=page_size)
 
-    def get_available_slots(self, doctor_id: str):
+        return {
+            "hospitals": [{"id": h.id, "name": h.name, "district": h.district} for h in hospitals],
+            **self._page_info(page, page_size, total)
+        }
+
+    def get_available_slots(self, doctor_id: str, start_date: str = None, end_date: str = None):
         """
         Retrieves ALL available time slots for a SPECIFIC doctor.
+        Optionally limited to days between start_date and end_date ("YYYY-MM-DD", inclusive).
         """
-        doctor = next((d for d in self.doctors if d.id == doctor_id), None)
+        doctor = self.repository.get_doctor(doctor_id)
         if not doctor:
             return []
 
-        results = []
-
-        schedule = self.availability_map.get(doctor.id, {})
+        schedule = self.repository.free_slots(doctor.id, start_date=start_date, end_date=end_date)
+        if not schedule:
+            return []
 
-        doctor_availability = {
+        return [{
             "doctor_name": doctor.name,
             "doctor_id": doctor.id,
             "branch": doctor.branch,
-            "schedule": []
-        }
+            "schedule": schedule
+        }]
 
-        for day, slots in schedule.items():
-
-            free_slots = []
-            for time_s in slots:
-                dt_check = datetime.strptime(f"{day} {time_s}", "%Y-%m-%d %H:%M")
-
-                if not self._is_slot_booked(doctor.id, dt_check):
-                    free_slots.append(time_s)
+    def find_earliest_slots(self, branch: str = None, city: str = None, district: str = None,
+                            hospital_id: str = None, start_date: str = None, end_date: str = None,
+                            limit: int = DEFAULT_EARLIEST_SLOTS):
+        """
+        Finds the earliest free slots across every doctor matching the filters, in one call.
 
-            if free_slots:
-                doctor_availability["schedule"].append({
-                    "date": day,
-                    "slots": free_slots
-                })
+        Replaces listing doctors and then fetching each doctor's schedule when the user
+        only wants "the first available appointment" (e.g., earliest cardiology slot in Ankara).
 
-        if doctor_availability["schedule"]:
-            results.append(doctor_availability)
+        Args:
+            branch (str, Optional): Medical branch (e.g., "Kardiyoloji").
+            city / district (str, Optional): Location of the hospitals to consider.
+            hospital_id (str, Optional): A single hospital; overrides city/district.
+            start_date / end_date (str, Optional): Inclusive day range, "YYYY-MM-DD".
+            limit (int): How many slots to return (at most MAX_PAGE_SIZE).
 
-        return results
+        Returns:
+            dict: {"slots": [{"date", "time", "doctor_id", "doctor_name", "branch", "hospital_id", "hospital_name"}, ...],
+                   "doctors_considered": int}
+        """
+        after = self._parse_slot(start_date, "00:00") if start_date else None
+        if start_date and after is None:
+            raise ValueError(f"Invalid start_date '{start_date}', expected YYYY-MM-DD.")
+        if end_date and self._parse_slot(end_date, "00:00") is None:
+            raise ValueError(f"Invalid end_date '{end_date}', expected YYYY-MM-DD.")
+
+        doctors = self.search_index.find_doctors(branch=branch, city=city, district=district, hospital_id=hospital_id)
+        doctors_by_id = {d.id: d for d in doctors}
+        limit = min(MAX_PAGE_SIZE, max(1, int(limit or DEFAULT_EARLIEST_SLOTS)))
+
+        slots = []
+        for doctor_id, start in self.repository.earliest_free_slots(list(doctors_by_id), limit, after=after, end_date=end_date):
+            doctor = doctors_by_id[doctor_id]
+            hospital = self.repository.get_hospital(doctor.hospital_id)
+            slots.append({
+                "date": start.strftime("%Y-%m-%d"),
+                "time": start.strftime("%H:%M"),
+                "doctor_id": doctor.id,
+                "doctor_name": doctor.name,
+                "branch": doctor.branch,
+                "hospital_id": doctor.hospital_id,
+                "hospital_name": hospital.name if hospital else "Unknown Hospital"
+            })
+
+        return {"slots": slots, "doctors_considered": len(doctors)}
 
     def get_patient_appointments(self, patient_id: str):
         """
@@ -128,22 +192,20 @@ class AppointmentManager:
         """
         patient_apps = []
 
-        for app in self.appointments:
-            if app.patient_id == patient_id:
-
-                doc = next((d for d in self.doctors if d.id == app.doctor_id), None)
-                hosp = next((h for h in self.hospitals if h['id'] == app.hospital_id), None)
+        for app in self.repository.patient_appointments(patient_id):
+            doc = self.repository.get_doctor(app.doctor_id)
+            hosp = self.repository.get_hospital(app.hospital_id)
 
-                patient_apps.append({
-                    "appointment_id": app.id,
-                    "date": app.start_time.strftime("%Y-%m-%d"),
-                    "time": app.start_time.strftime("%H:%M"),
+            patient_apps.append({
+                "appointment_id": app.id,
+                "date": app.start_time.strftime("%Y-%m-%d"),
+                "time": app.start_time.strftime("%H:%M"),
 
-                    "doctor": doc.name if doc else "Unknown Doctor",
-                    "hospital": hosp['name'] if hosp else "Unknown Hospital",
+                "doctor": doc.name if doc else "Unknown Doctor",
+                "hospital": hosp.name if hosp else "Unknown Hospital",
 
-                    "status": app.status.value
-                })
+                "status": app.status.value
+            })
 
         return patient_apps
 
@@ -173,7 +235,7 @@ class AppointmentManager:
         if app.status == AppointmentStatus.CANCELLED:
             return {"message": "Appointment is already cancelled.", "status": "ALREADY_CANCELLED"}
 
-        app.status = AppointmentStatus.CANCELLED
+        self.repository.cancel(appointment_id)
         print(f"Appointment {appointment_id} cancelled successfully.")
 
         return {
@@ -182,27 +244,27 @@ class AppointmentManager:
             "status": "CANCELLED"
         }
 
-    def get_doctors_by_hospital_and_branch(self, hospital_id:str, branch:str):
+    def get_doctors_by_hospital_and_branch(self, hospital_id: str, branch: str, page: int = 1,
+                                           page_size: int = DEFAULT_PAGE_SIZE):
         """
-        Retrieves the list of doctors associated with a specific hospital and branch.
+        Retrieves a page of doctors associated with a specific hospital and branch.
 
         Args:
             hospital_id (str): The unique identifier of the hospital.
-            branch (str): The medical branch or specialization.
+            branch (str): The medical branch or specialization (case-insensitive, prefix and typo tolerant).
+            page (int): 1-based page number.
+            page_size (int): Doctors per page (at most MAX_PAGE_SIZE).
 
         Returns:
-            list: A list of objects containing doctor IDs and names.
+            dict: {"doctors": [{"id", "name", "branch"}, ...], "total", "page", "page_size", "has_more"}
         """
+        page, page_size = self._clamp_paging(page, page_size)
+        doctors, total = self.search_index.search_doctors(hospital_id, branch, page=page, page_size=page_size)
 
-        result = []
-        for doc in self.doctors:
-            doc_obj = {
-                "id": doc.id,
-                "name": doc.name
-            }
-            result.append(doc_obj)
-
-        return result
+        return {
+            "doctors": [{"id": d.id, "name": d.name, "branch": d.branch} for d in doctors],
+            **self._page_info(page, page_size, total)
+        }
 
     def create_appointment(self, doctor_id: str, patient_id: str, date_str: str, time_str: str):
         """
@@ -227,43 +289,10 @@ class AppointmentManager:
         - Raises ValueError: If the slot is unavailable, doctor not found, or invalid format.
         """
 
-        doctor = next((d for d in self.doctors if d.id == doctor_id), None)
-        if not doctor:
-            raise ValueError(f"Doctor with ID {doctor_id} not found.")
-
-        patient = next((p for p in self.patients if p.id == patient_id), None)
-        if not patient:
-            raise ValueError(f"Patient with ID {patient_id} not found.")
-
-        doc_slots = self.availability_map.get(doctor_id, {}).get(date_str, [])
-        if time_str not in doc_slots:
-            raise ValueError(f"Doctor {doctor.name} is not available at {date_str} {time_str}.")
-
-        target_dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-
-        for app in self.appointments:
-            if (app.doctor_id == doctor_id and
-                    app.status == AppointmentStatus.BOOKED and
-                    app.start_time == target_dt):
-                raise ValueError(f"The slot {date_str} {time_str} is already booked.")
-
-        new_id = str(uuid.uuid4())
-        new_appointment = Appointment(
-            id=new_id,
-            doctor_id=doctor_id,
-            patient_id=patient_id,
-            start_time=target_dt,
-            status=AppointmentStatus.BOOKED,
-            end_time=target_dt + timedelta(minutes=30),
-            hospital_id=doctor.hospital_id
-        )
-
-        self.appointments.append(new_appointment)
-        self.appointments_by_id[new_id] = new_appointment
-
-        return new_appointment
-
+        new_appointment = self._new_appointment(doctor_id, patient_id, date_str, time_str)
 
+        # The backend re-checks the slot atomically (unique index / booked index).
+        return self.repository.book(new_appointment)
 
     def update_appointment(self, appointment_id: str, new_doctor_id: str = None, new_date_str: str = None, new_time_str: str = None) -> Appointment:
         """
@@ -297,7 +326,7 @@ class AppointmentManager:
             update_appointment(appointment_id="uuid-123...", new_doctor_id="doc-99", new_date_str="2025-08-20")
         """
 
-        old_appointment = self.appointments_by_id.get(appointment_id)
+        old_appointment = self.repository.get_appointment(appointment_id)
 
         if not old_appointment:
             raise ValueError("id can not found.")
@@ -319,35 +348,23 @@ class AppointmentManager:
             print("ℹ️ No changes detected.")
             return old_appointment
 
-        available_slots = self.availability_map.get(target_doctor_id, {}).get(target_date_str, [])
-        if target_time_str not in available_slots:
+        target_start_dt = self._parse_slot(target_date_str, target_time_str)
+        if target_start_dt is None or not self.repository.has_slot(target_doctor_id, target_start_dt):
             raise ValueError(f"Doctor is not working at {target_date_str} {target_time_str}.")
 
-        target_start_dt = datetime.strptime(f"{target_date_str} {target_time_str}", "%Y-%m-%d %H:%M")
+        holder_id = self.repository.booked_appointment_id(target_doctor_id, target_start_dt)
+        if holder_id is not None and holder_id != old_appointment.id:
+            raise ValueError("Seçilen yeni tarih/saat maalesef dolu.")
 
-        for app in self.appointments:
-            if (app.doctor_id == target_doctor_id and
-                    app.status == AppointmentStatus.BOOKED and
-                    app.start_time == target_start_dt):
-
-                if app.id != old_appointment.id:
-                    raise ValueError("Seçilen yeni tarih/saat maalesef dolu.")
+        new_appointment = self._new_appointment(
+            doctor_id=target_doctor_id,
+            patient_id=old_appointment.patient_id,
+            date_str=target_date_str,
+            time_str=target_time_str
+        )
 
         print(f"Randevu güncelleniyor: {appointment_id}...")
 
-
-        old_appointment.status = AppointmentStatus.CANCELLED
-
-        try:
-            new_appointment = self.create_appointment(
-                doctor_id=target_doctor_id,
-                patient_id=old_appointment.patient_id,
-                date_str=target_date_str,
-                time_str=target_time_str
-            )
-            return new_appointment
-
-        except Exception as e:
-            old_appointment.status = AppointmentStatus.BOOKED
-            raise e
+        # Cancel + book in one unit of work: if booking fails the old appointment stays BOOKED.
+        return self.repository.reschedule(old_appointment.id, new_appointment)
 
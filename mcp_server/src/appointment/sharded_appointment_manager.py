@@ -0,0 +1,176 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional
+import threading
+
+from appointment.appointment_manager import AppointmentManager, DEFAULT_EARLIEST_SLOTS, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from appointment.util.core.models import Appointment, AppointmentStatus
+from appointment.util.shard import ShardClient, shard_of
+from appointment.util.store import AppointmentStore
+
+DEFAULT_CALL_TIMEOUT = 30.0
+MAX_KNOWN_OWNERS = 100_000
+
+
+class ShardedAppointmentManager:
+    """
+    AppointmentManager API over N shard processes, each owning the doctors with shard_of(doctor_id) == i
+    together with their availability and appointments. Tools can use it in place of AppointmentManager.
+
+    - doctor-keyed calls (slots, create) go to the doctor's shard;
+    - appointment-keyed calls (cancel, update) go to the shard holding the appointment;
+    - patient history and earliest-slot searches fan out to every shard in parallel and are merged;
+    - hospital / doctor listings are answered here: the reference tables are the same on every
+      shard and never change, so a copy is indexed once at startup instead of asking each shard.
+    """
+
+    def __init__(self, shard_count: int, data: dict = None, call_timeout: float = DEFAULT_CALL_TIMEOUT):
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1.")
+        self.shard_count = shard_count
+        self.call_timeout = call_timeout
+        self.shards = [ShardClient(i, shard_count, data=data) for i in range(shard_count)]
+        # appointment_id -> shard index, learned from creates and listings; ids never move between shards.
+        # Least recently used ids are forgotten past MAX_KNOWN_OWNERS (they fall back to a fan-out).
+        self._owners: OrderedDict[str, int] = OrderedDict()
+        self._owners_lock = threading.Lock()
+
+        hospitals, doctors = None, []
+        for shard_hospitals, shard_doctors in self._fan_out("reference_data"):
+            hospitals = hospitals or shard_hospitals
+            doctors.extend(shard_doctors)
+        self.reference = AppointmentManager(repository=AppointmentStore(hospitals or [], doctors, [], [], {}))
+
+    # HELPER FUNCTIONS
+
+    def _wait(self, future: Future):
+        return future.result(timeout=self.call_timeout)
+
+    def _call(self, shard: int, method: str, **kwargs):
+        return self._wait(self.shards[shard].call(method, **kwargs))
+
+    def _fan_out(self, method: str, **kwargs) -> list:
+        """Send the call to every shard first, then collect: shards work on it in parallel."""
+        futures = [shard.call(method, **kwargs) for shard in self.shards]
+        return [self._wait(future) for future in futures]
+
+    def _remember(self, appointment_id: str, shard: int) -> None:
+        with self._owners_lock:
+            self._owners[appointment_id] = shard
+            self._owners.move_to_end(appointment_id)
+            while len(self._owners) > MAX_KNOWN_OWNERS:
+                self._owners.popitem(last=False)
+
+    def _owner(self, appointment_id: str) -> Optional[int]:
+        with self._owners_lock:
+            shard = self._owners.get(appointment_id)
+            if shard is not None:
+                self._owners.move_to_end(appointment_id)
+            return shard
+
+    def _locate(self, appointment_id: str) -> Optional[tuple]:
+        """(shard index, Appointment) or None; asks every shard when the owner is not known yet."""
+        shard = self._owner(appointment_id)
+        if shard is not None:
+            app = self._call(shard, "get_appointment", appointment_id=appointment_id)
+            if app is not None:
+                return shard, app
+
+        for shard, app in enumerate(self._fan_out("get_appointment", appointment_id=appointment_id)):
+            if app is not None:
+                self._remember(appointment_id, shard)
+                return shard, app
+        return None
+
+    def _get_appointment_by_id(self, appointment_id: str):
+        """Internal helper to safely retrieve an appointment object."""
+        located = self._locate(appointment_id)
+        return located[1] if located else None
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.close()
+
+    # FUNCTIONS
+
+    def get_available_hospitals(self, city, district: str = None, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE):
+        return self.reference.get_available_hospitals(city, district, page=page, page_size=page_size)
+
+    def get_doctors_by_hospital_and_branch(self, hospital_id: str, branch: str, page: int = 1,
+                                           page_size: int = DEFAULT_PAGE_SIZE):
+        return self.reference.get_doctors_by_hospital_and_branch(hospital_id, branch, page=page, page_size=page_size)
+
+    def get_available_slots(self, doctor_id: str, start_date: str = None, end_date: str = None):
+        return self._call(shard_of(doctor_id, self.shard_count), "get_available_slots",
+                          doctor_id=doctor_id, start_date=start_date, end_date=end_date)
+
+    def find_earliest_slots(self, branch: str = None, city: str = None, district: str = None,
+                            hospital_id: str = None, start_date: str = None, end_date: str = None,
+                            limit: int = DEFAULT_EARLIEST_SLOTS):
+        # Each shard returns its own `limit` earliest slots, so the overall earliest are among them.
+        results = self._fan_out("find_earliest_slots", branch=branch, city=city, district=district,
+                                hospital_id=hospital_id, start_date=start_date, end_date=end_date, limit=limit)
+        limit = min(MAX_PAGE_SIZE, max(1, int(limit or DEFAULT_EARLIEST_SLOTS)))
+        slots = sorted((s for r in results for s in r["slots"]), key=lambda s: (s["date"], s["time"], s["doctor_id"]))
+        return {"slots": slots[:limit], "doctors_considered": sum(r["doctors_considered"] for r in results)}
+
+    def get_patient_appointments(self, patient_id: str):
+        patient_apps = []
+        for shard, apps in enumerate(self._fan_out("get_patient_appointments", patient_id=patient_id)):
+            for app in apps:
+                self._remember(app["appointment_id"], shard)
+            patient_apps.extend(apps)
+        return sorted(patient_apps, key=lambda a: (a["date"], a["time"]))
+
+    def cancel_appointment(self, appointment_id: str):
+        located = self._locate(appointment_id)
+        if not located:
+            raise ValueError(f"Appointment with ID {appointment_id} not found.")
+        return self._call(located[0], "cancel_appointment", appointment_id=appointment_id)
+
+    def create_appointment(self, doctor_id: str, patient_id: str, date_str: str, time_str: str):
+        shard = shard_of(doctor_id, self.shard_count)
+        app = self._call(shard, "create_appointment",
+                         doctor_id=doctor_id, patient_id=patient_id, date_str=date_str, time_str=time_str)
+        self._remember(app.id, shard)
+        return app
+
+    def update_appointment(self, appointment_id: str, new_doctor_id: str = None, new_date_str: str = None,
+                           new_time_str: str = None) -> Appointment:
+        located = self._locate(appointment_id)
+        if not located:
+            raise ValueError("id can not found.")
+        source, old_appointment = located
+
+        target = shard_of(new_doctor_id, self.shard_count) if new_doctor_id else source
+        if target == source:
+            app = self._call(source, "update_appointment", appointment_id=appointment_id, new_doctor_id=new_doctor_id,
+                             new_date_str=new_date_str, new_time_str=new_time_str)
+            self._remember(app.id, source)
+            return app
+
+        # Moving to a doctor on another shard: book there first, so a full slot leaves the old
+        # appointment untouched, then cancel the old one and undo the booking if that fails.
+        if old_appointment.status == AppointmentStatus.CANCELLED:
+            raise ValueError("this appointment already cancelled.")
+
+        new_appointment = self._call(
+            target, "create_appointment",
+            doctor_id=new_doctor_id,
+            patient_id=old_appointment.patient_id,
+            date_str=new_date_str or old_appointment.start_time.strftime("%Y-%m-%d"),
+            time_str=new_time_str or old_appointment.start_time.strftime("%H:%M"),
+        )
+        try:
+            cancelled = self._call(source, "cancel_appointment", appointment_id=appointment_id)
+        except Exception:
+            self._call(target, "cancel_appointment", appointment_id=new_appointment.id)
+            raise
+        if cancelled["status"] != "CANCELLED":
+            # Cancelled or moved by someone else in the meantime.
+            self._call(target, "cancel_appointment", appointment_id=new_appointment.id)
+            raise ValueError("this appointment already cancelled.")
+
+        print(f"Appointment {appointment_id} moved from shard {source} to shard {target}.")
+        self._remember(new_appointment.id, target)
+        return new_appointment
@@ -0,0 +1,171 @@
+"""
+Benchmark for the indexed AppointmentStore on synthetic data.
+
+    python -m appointment.test.appointment_store_benchmark --doctors 100000 --appointments 10000000
+    python -m appointment.test.appointment_store_benchmark --backend sqlite --sqlite-path /tmp/bench.db
+
+The linear scan that AppointmentManager used before the store is timed on a few samples for comparison.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import resource
+import time
+from datetime import datetime, timedelta
+
+from appointment.appointment_manager import AppointmentManager
+from appointment.util.core.models import Appointment, AppointmentStatus, Doctor, Hospital, Patient
+from appointment.util.store import AppointmentStore, SQLiteAppointmentRepository
+
+BASE_DAY = datetime(2025, 9, 1, 8, 0)
+SLOT = timedelta(minutes=30)
+SLOTS_PER_DAY = 16
+LOCATIONS = [("Ankara", "Çankaya"), ("İstanbul", "Kadıköy"), ("İzmir", "Bornova"), ("Yozgat", "Sorgun"), ("Iğdır", "Aralık")]
+
+
+def slot_time(index: int) -> datetime:
+    day, slot = divmod(index, SLOTS_PER_DAY)
+    return BASE_DAY + timedelta(days=day) + slot * SLOT
+
+
+def build_data(n_doctors: int, n_appointments: int, n_patients: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    n_hospitals = max(1, n_doctors // 100)
+    branches = ["Kardiyoloji", "KBB", "Nöroloji", "Dahiliye", "Göz Hastalıkları"]
+
+    hospitals = [
+        Hospital(id=f"h{i}", name=f"Hospital {i}", city=LOCATIONS[i % len(LOCATIONS)][0],
+                 district=f"{LOCATIONS[i % len(LOCATIONS)][1]} {i % 7}")
+        for i in range(n_hospitals)
+    ]
+    doctors = [
+        Doctor(id=f"d{i}", hospital_id=f"h{i % n_hospitals}", name=f"Dr. {i}", branch=branches[i % len(branches)])
+        for i in range(n_doctors)
+    ]
+    patients = [Patient(id=f"p{i}", name=f"Patient {i}", age=20 + i % 60) for i in range(n_patients)]
+
+    # Appointment i goes to doctor i % D in that doctor's (i // D)-th slot, so BOOKED slots never collide.
+    appointments = []
+    for i in range(n_appointments):
+        doctor = doctors[i % n_doctors]
+        start = slot_time(i // n_doctors)
+        appointments.append(Appointment(
+            id=f"a{i}",
+            doctor_id=doctor.id,
+            patient_id=f"p{rng.randrange(n_patients)}",
+            start_time=start,
+            end_time=start + SLOT,
+            status=AppointmentStatus.CANCELLED if rng.random() < 0.1 else AppointmentStatus.BOOKED,
+            hospital_id=doctor.hospital_id,
+        ))
+
+    # Free day for the create/cancel benchmark, after every pre-booked slot.
+    free_day = slot_time((n_appointments // n_doctors + SLOTS_PER_DAY) // SLOTS_PER_DAY * SLOTS_PER_DAY)
+    free_slots = [(free_day + k * SLOT).strftime("%H:%M") for k in range(SLOTS_PER_DAY)]
+    availability_map = {d.id: {free_day.strftime("%Y-%m-%d"): free_slots} for d in doctors[:1000]}
+
+    return {
+        "hospitals": hospitals,
+        "doctors": doctors,
+        "patients": patients,
+        "appointments": appointments,
+        "availability_map": availability_map,
+    }
+
+
+def linear_is_booked(appointments, doctor_id: str, target_dt: datetime) -> bool:
+    for app in appointments:
+        if app.doctor_id == doctor_id and app.status == AppointmentStatus.BOOKED and app.start_time == target_dt:
+            return True
+    return False
+
+
+def timed(label: str, ops: int, fn):
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # manager methods print a line per call
+        result = fn()
+    elapsed = time.perf_counter() - started
+    per_op = elapsed / ops * 1e6 if ops else 0.0
+    print(f"{label:<38} {ops:>10,} ops {elapsed:>9.3f}s {per_op:>12.2f} µs/op")
+    return result
+
+
+def max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--doctors", type=int, default=100_000)
+    parser.add_argument("--appointments", type=int, default=10_000_000)
+    parser.add_argument("--patients", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--writes", type=int, default=10_000)
+    parser.add_argument("--linear-samples", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--backend", choices=("memory", "sqlite"), default="memory")
+    parser.add_argument("--sqlite-path", default="appointment_benchmark.db")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"doctors={args.doctors:,} appointments={args.appointments:,} patients={args.patients:,}\n")
+
+    data = timed("generate synthetic data", args.appointments,
+                 lambda: build_data(args.doctors, args.appointments, args.patients, args.seed))
+    if args.backend == "sqlite":
+        if os.path.exists(args.sqlite_path):
+            os.remove(args.sqlite_path)
+        repository = SQLiteAppointmentRepository(args.sqlite_path)
+        timed("seed SQLite database", args.appointments, lambda: repository.seed(data))
+    else:
+        repository = timed("build indexes (AppointmentStore)", args.appointments, lambda: AppointmentStore.from_data(data))
+    manager = timed("build search index (AppointmentManager)", args.doctors,
+                    lambda: AppointmentManager(repository=repository))
+    print(f"max RSS: {max_rss_mb():,.0f} MB\n")
+
+    slots_per_doctor = max(1, args.appointments // args.doctors)
+    probes = [(f"d{rng.randrange(args.doctors)}", slot_time(rng.randrange(slots_per_doctor)))
+              for _ in range(args.lookups)]
+    patient_ids = [f"p{rng.randrange(args.patients)}" for _ in range(args.lookups)]
+
+    timed("is_slot_booked (indexed)", len(probes),
+          lambda: sum(manager._is_slot_booked(d, t) for d, t in probes))
+    timed("is_slot_booked (linear scan)", args.linear_samples,
+          lambda: sum(linear_is_booked(data["appointments"], d, t) for d, t in probes[:args.linear_samples]))
+    timed("get_patient_appointments", len(patient_ids),
+          lambda: sum(len(manager.get_patient_appointments(p)) for p in patient_ids))
+
+    queries = [("istanbul", None), ("IĞDIR", None), ("Ankara", "cankaya 3"), ("izmi", None), ("Istambul", "kadıkoy")]
+    timed("get_available_hospitals (search)", args.lookups,
+          lambda: [manager.get_available_hospitals(*queries[i % len(queries)]) for i in range(args.lookups)])
+    branches = ["Kardiyoloji", "kbb", "noro", "Dahliye", "göz"]
+    n_hospitals = len(data["hospitals"])
+    timed("get_doctors_by_hospital_and_branch", args.lookups,
+          lambda: [manager.get_doctors_by_hospital_and_branch(f"h{rng.randrange(n_hospitals)}", branches[i % len(branches)])
+                   for i in range(args.lookups)])
+
+    timed("find_earliest_slots (k-way merge)", args.lookups // 10,
+          lambda: [manager.find_earliest_slots(branch=branches[i % len(branches)], limit=5)
+                   for i in range(args.lookups // 10)])
+
+    free_doctors = list(data["availability_map"])
+    timed("get_available_slots", args.lookups,
+          lambda: [manager.get_available_slots(free_doctors[i % len(free_doctors)]) for i in range(args.lookups)])
+
+    writes = []
+    for i in range(args.writes):
+        doctor_id = free_doctors[i % len(free_doctors)]
+        (day, times), = data["availability_map"][doctor_id].items()
+        writes.append((doctor_id, day, times[(i // len(free_doctors)) % len(times)]))
+
+    created = timed("create_appointment", len(writes),
+                    lambda: [manager.create_appointment(d, "p0", day, t).id for d, day, t in dict.fromkeys(writes)])
+    timed("cancel_appointment", len(created), lambda: [manager.cancel_appointment(a) for a in created])
+
+    print(f"\nmax RSS: {max_rss_mb():,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
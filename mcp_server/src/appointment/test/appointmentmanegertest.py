@@ -47,7 +47,7 @@ if app_to_cancel:
         cancel_response = service.cancel_appointment(app_to_cancel.id)
         logger.info(f"Operation Result: {cancel_response}")
 
-        cancelled_app = service.appointments_by_id.get(app_to_cancel.id)
+        cancelled_app = service._get_appointment_by_id(app_to_cancel.id)
 
         if cancelled_app is not None and cancelled_app.status.name == "CANCELLED":
             logger.info("✅ VERIFICATION SUCCESSFUL: Appointment exists and status is 'CANCELLED'.")
@@ -62,7 +62,7 @@ else:
 
 print("\n--- TEST 5: Retrieve Available Hospitals (get_available_hospitals) ---")
 try:
-    hospitals = service.get_available_hospitals(city="Yozgat", district="Sorgun")
+    hospitals = service.get_available_hospitals(city="Yozgat", district="Sorgun")["hospitals"]
 
     for h in hospitals:
         print(f"Hospital: {h['name']} (ID: {h['id']})")
@@ -78,7 +78,8 @@ try:
 
     slots_result = service.get_available_slots(
         doctor_id=test_doctor_id,
-        date_str=test_date
+        start_date=test_date,
+        end_date=test_date
     )
 
     found_1030 = False
@@ -0,0 +1,178 @@
+"""
+Stress test for concurrent booking: many async clients hammer the same few slots with
+create / update / cancel, then the final state is checked for double bookings and index drift.
+
+    python -m appointment.test.booking_stress_test --clients 64 --rounds 200
+    python -m appointment.test.booking_stress_test --backend sqlite --sqlite-path /tmp/stress.db
+    python -m appointment.test.booking_stress_test --shards 4 --doctors 8
+
+--shards N runs the same clients through ShardedAppointmentManager (N memory-backed shard processes),
+so updates that move an appointment to a doctor on another shard are exercised too.
+
+Each client call runs on a worker thread, the way FastMCP runs synchronous tools.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from appointment.appointment_manager import AppointmentManager
+from appointment.sharded_appointment_manager import ShardedAppointmentManager
+from appointment.util.core.models import AppointmentStatus, Doctor, Hospital, Patient
+from appointment.util.store import AppointmentStore, SQLiteAppointmentRepository
+
+DAY = "2025-09-01"
+
+
+def build_data(n_doctors: int, n_slots: int, n_patients: int) -> dict:
+    times = [f"{9 + k // 2:02d}:{30 * (k % 2):02d}" for k in range(n_slots)]
+    return {
+        "hospitals": [Hospital(id="h1", name="Stress Hospital", city="Ankara", district="Çankaya")],
+        "doctors": [Doctor(id=f"d{i}", hospital_id="h1", name=f"Dr. {i}", branch="Dahiliye") for i in range(n_doctors)],
+        "patients": [Patient(id=f"p{i}", name=f"Patient {i}", age=30) for i in range(n_patients)],
+        "appointments": [],
+        "availability_map": {f"d{i}": {DAY: list(times)} for i in range(n_doctors)},
+    }
+
+
+def widen_race_window(repository) -> None:
+    """Yield the GIL between "is the slot free?" and the write that follows, so a missing lock shows up."""
+    is_booked = repository.is_booked
+
+    def yielding_is_booked(doctor_id, start_time):
+        result = is_booked(doctor_id, start_time)
+        time.sleep(0)
+        return result
+
+    repository.is_booked = yielding_is_booked
+
+
+class Stats:
+    def __init__(self):
+        self.ops = Counter()
+        self.appointment_ids = set()
+
+
+async def client(manager: AppointmentManager, data: dict, client_id: int, rounds: int, stats: Stats, seed: int):
+    rng = random.Random(seed + client_id)
+    patient_id = f"p{client_id % len(data['patients'])}"
+    doctors = list(data["availability_map"])
+    times = data["availability_map"][doctors[0]][DAY]
+    mine = []
+
+    for _ in range(rounds):
+        # Without an appointment of its own the client can only create; count that as a create.
+        op = rng.choice(("create", "create", "update", "cancel")) if mine else "create"
+        try:
+            if op == "create":
+                app = await asyncio.to_thread(
+                    manager.create_appointment, rng.choice(doctors), patient_id, DAY, rng.choice(times))
+                mine.append(app.id)
+                stats.appointment_ids.add(app.id)
+                stats.ops["create_ok"] += 1
+
+            elif op == "update":
+                old_id = rng.choice(mine)
+                app = await asyncio.to_thread(
+                    manager.update_appointment, old_id, new_doctor_id=rng.choice(doctors), new_time_str=rng.choice(times))
+                if app.id != old_id:
+                    mine[mine.index(old_id)] = app.id
+                    stats.appointment_ids.add(app.id)
+                stats.ops["update_ok"] += 1
+
+            else:
+                app_id = mine.pop(rng.randrange(len(mine)))
+                result = await asyncio.to_thread(manager.cancel_appointment, app_id)
+                stats.ops["cancel_ok" if result["status"] == "CANCELLED" else "cancel_noop"] += 1
+
+        except ValueError:
+            stats.ops[f"{op}_rejected"] += 1
+
+
+def check(manager: AppointmentManager, data: dict, stats: Stats) -> list:
+    failures = []
+    appointments = [manager._get_appointment_by_id(a) for a in stats.appointment_ids]
+    booked = Counter((a.doctor_id, a.start_time) for a in appointments if a.status == AppointmentStatus.BOOKED)
+
+    doubles = {slot: n for slot, n in booked.items() if n > 1}
+    if doubles:
+        failures.append(f"double booked slots: {doubles}")
+
+    expected = stats.ops["create_ok"] - stats.ops["cancel_ok"]
+    if sum(booked.values()) != expected:
+        failures.append(f"{sum(booked.values())} BOOKED appointments, expected creates - cancels = {expected}")
+
+    for doctor_id, schedule in data["availability_map"].items():
+        free = {t for entry in manager.get_available_slots(doctor_id) for day in entry["schedule"] for t in day["slots"]}
+        taken = {dt.strftime("%H:%M") for (d, dt) in booked if d == doctor_id}
+        if free != set(schedule[DAY]) - taken:
+            failures.append(f"free slots of {doctor_id} disagree with bookings: free={sorted(free)} taken={sorted(taken)}")
+
+    repository = getattr(manager, "repository", None)
+    if isinstance(repository, AppointmentStore):
+        indexed = dict(repository.booked)
+        scanned = {(a.doctor_id, a.start_time): a.id for a in repository.appointments if a.status == AppointmentStatus.BOOKED}
+        if indexed != scanned:
+            failures.append("booked index drifted from the appointment list")
+
+    return failures
+
+
+async def run(args) -> int:
+    data = build_data(args.doctors, args.slots, args.clients)
+
+    if args.shards > 1:
+        manager = ShardedAppointmentManager(args.shards, data=data)
+    elif args.backend == "sqlite":
+        if os.path.exists(args.sqlite_path):
+            os.remove(args.sqlite_path)
+        repository = SQLiteAppointmentRepository(args.sqlite_path, pool_size=8)
+        repository.seed(data)
+    else:
+        repository = AppointmentStore.from_data(data)
+    if args.shards <= 1:
+        manager = AppointmentManager(repository=repository)
+        widen_race_window(repository)
+
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=args.clients))
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible to surface races
+
+    stats = Stats()
+    with contextlib.redirect_stdout(io.StringIO()):  # manager methods print a line per call
+        await asyncio.gather(*(client(manager, data, i, args.rounds, stats, args.seed) for i in range(args.clients)))
+
+    print(f"backend={args.backend} shards={args.shards} clients={args.clients} rounds={args.rounds} "
+          f"slots={args.doctors * args.slots}")
+    for op, count in sorted(stats.ops.items()):
+        print(f"  {op:<16} {count:>8,}")
+
+    failures = check(manager, data, stats)
+    if isinstance(manager, ShardedAppointmentManager):
+        manager.close()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("PASS: no double booking, indexes consistent" if not failures else f"{len(failures)} invariant(s) violated")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("memory", "sqlite"), default="memory")
+    parser.add_argument("--sqlite-path", default="booking_stress.db")
+    parser.add_argument("--shards", type=int, default=1)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--doctors", type=int, default=2)
+    parser.add_argument("--slots", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=11)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Boot-time benchmark: load a synthetic CSV catalogue, write a snapshot, then boot from the snapshot.
+
+    python -m appointment.test.catalogue_load_benchmark --doctors 20000 --days 30 --slots 16
+    python -m appointment.test.catalogue_load_benchmark --dir /tmp/catalogue --keep
+
+The catalogue has doctors x days x slots availability rows; a share of the slots is booked.
+"""
+import argparse
+import csv
+import os
+import random
+import resource
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+
+from appointment.appointment_manager import AppointmentManager
+from appointment.util.loader import load_catalogue, load_snapshot, write_snapshot
+
+FIRST_DAY = date(2025, 9, 1)
+BRANCHES = ["Kardiyoloji", "KBB", "Nöroloji", "Dahiliye", "Göz Hastalıkları"]
+CITIES = [("Ankara", "Çankaya"), ("İstanbul", "Kadıköy"), ("İzmir", "Bornova")]
+
+
+def write_catalogue(directory: str, n_doctors: int, n_days: int, n_slots: int, booked_ratio: float, seed: int) -> int:
+    rng = random.Random(seed)
+    n_hospitals = max(1, n_doctors // 100)
+    n_patients = max(1, n_doctors * 5)
+    times = [f"{8 + k // 2:02d}:{30 * (k % 2):02d}" for k in range(n_slots)]
+    days = [(FIRST_DAY + timedelta(days=d)).isoformat() for d in range(n_days)]
+
+    def table(name, header, rows):
+        with open(os.path.join(directory, f"{name}.csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+    table("hospitals", ["id", "name", "city", "district"],
+          ([f"h{i}", f"Hospital {i}", *CITIES[i % len(CITIES)]] for i in range(n_hospitals)))
+    table("doctors", ["id", "hospital_id", "name", "branch"],
+          ([f"d{i}", f"h{i % n_hospitals}", f"Dr. {i}", BRANCHES[i % len(BRANCHES)]] for i in range(n_doctors)))
+    table("patients", ["id", "name", "age"], ([f"p{i}", f"Patient {i}", 20 + i % 60] for i in range(n_patients)))
+    table("availability", ["doctor_id", "date", "time"],
+          ([f"d{i}", day, t] for i in range(n_doctors) for day in days for t in times))
+
+    booked = []
+    for i in range(n_doctors):
+        for day in days:
+            for k, t in enumerate(times):
+                if rng.random() < booked_ratio:
+                    end = times[k + 1] if k + 1 < len(times) else f"{8 + (k + 1) // 2:02d}:{30 * ((k + 1) % 2):02d}"
+                    booked.append([f"a{len(booked)}", f"d{i}", f"p{rng.randrange(n_patients)}", f"h{i % n_hospitals}",
+                                   f"{day} {t}", f"{day} {end}", "BOOKED"])
+    table("appointments", ["id", "doctor_id", "patient_id", "hospital_id", "start_time", "end_time", "status"], booked)
+    return n_doctors * n_days * n_slots
+
+
+def timed(label: str, fn):
+    started = time.perf_counter()
+    result = fn()
+    print(f"{label:<36} {time.perf_counter() - started:>9.3f}s   max RSS {max_rss_mb():>7,.0f} MB")
+    return result
+
+
+def max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--doctors", type=int, default=5_000)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--slots", type=int, default=16)
+    parser.add_argument("--booked", type=float, default=0.2, help="share of slots with a BOOKED appointment")
+    parser.add_argument("--dir", default=None, help="catalogue directory (default: a temporary one)")
+    parser.add_argument("--keep", action="store_true", help="keep the generated catalogue and snapshot")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    directory = args.dir or tempfile.mkdtemp(prefix="catalogue_")
+    os.makedirs(directory, exist_ok=True)
+    snapshot = os.path.join(directory, "catalogue.snap")
+
+    try:
+        rows = timed("generate CSV catalogue", lambda: write_catalogue(
+            directory, args.doctors, args.days, args.slots, args.booked, args.seed))
+        print(f"availability rows: {rows:,}\n")
+
+        store = timed("load_catalogue (CSV, chunked)", lambda: load_catalogue(directory))
+        timed("write_snapshot", lambda: write_snapshot(store, snapshot))
+        print(f"snapshot size: {os.path.getsize(snapshot) / 2**20:,.1f} MB")
+        del store
+
+        mapped = timed("load_snapshot (mmap)", lambda: load_snapshot(snapshot))
+        manager = timed("AppointmentManager (search index)", lambda: AppointmentManager(repository=mapped))
+        timed("first find_earliest_slots", lambda: manager.find_earliest_slots(branch="Kardiyoloji", city="Ankara"))
+        timed("first get_available_slots", lambda: manager.get_available_slots("d0"))
+    finally:
+        if not args.keep:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Memory benchmark for the appointment domain models: bytes per object before and after slotting.
+
+    python -m appointment.test.model_memory_benchmark --appointments 1000000
+
+tracemalloc makes this slow (roughly 10 s per 100k appointments).
+
+"before" replays the previous models (plain dataclasses, hospitals as dicts) and keeps the id strings
+of every parsed row; "after" uses the slotted models, with ids shared by AppointmentStore.
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from appointment.util.core.models import Appointment, AppointmentStatus, Doctor, Hospital, Patient
+from appointment.util.store import AppointmentStore
+
+BASE = datetime(2025, 9, 1, 8, 0)
+SLOT = timedelta(minutes=30)
+BRANCHES = ["Kardiyoloji", "KBB", "Nöroloji", "Dahiliye", "Göz Hastalıkları"]
+
+
+# ---- Previous models ----
+
+@dataclass(frozen=True)
+class LegacyDoctor:
+    id: str
+    hospital_id: str
+    name: str
+    branch: str
+
+@dataclass
+class LegacyPatient:
+    id: str
+    name: str
+    age: int
+
+@dataclass
+class LegacyAppointment:
+    id: str
+    doctor_id: str
+    patient_id: str
+    start_time: datetime
+    end_time: datetime
+    status: AppointmentStatus = AppointmentStatus.BOOKED
+    hospital_id: Optional[str] = None
+
+
+# ---------- helpers ----------
+
+def fresh(text: str) -> str:
+    """A new string object equal to `text`, like every value a parser returns."""
+    return text.encode().decode()
+
+
+def rows(n: int, n_doctors: int, n_patients: int, n_hospitals: int):
+    """Appointment rows as a loader sees them: every field is a fresh string (parsed from CSV / SQL)."""
+    for i in range(n):
+        start = BASE + (i // n_doctors) * SLOT
+        yield (f"a{i}", "d%d" % (i % n_doctors), "p%d" % (i * 7919 % n_patients), start, start + SLOT,
+               "BOOKED", "h%d" % (i % n_doctors % n_hospitals))
+
+
+def measure(build):
+    """(result, bytes still allocated by build())"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def report(label: str, size: int, count: int) -> None:
+    print(f"{label:<34} {count:>10,} objects {size / 2**20:>9.1f} MB {size / count:>8.1f} B/object")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--appointments", type=int, default=200_000)
+    parser.add_argument("--doctors", type=int, default=10_000)
+    parser.add_argument("--patients", type=int, default=100_000)
+    parser.add_argument("--hospitals", type=int, default=100)
+    args = parser.parse_args()
+
+    def location(i):
+        return ("Ankara", "İstanbul", "İzmir")[i % 3], ("Çankaya", "Kadıköy", "Bornova")[i % 3]
+
+    # Reference data: strings are rebuilt per row, as when read from a file or database.
+    _, before_h = measure(lambda: [
+        {"id": f"h{i}", "name": f"Hospital {i}", "city": fresh(location(i)[0]), "district": fresh(location(i)[1])}
+        for i in range(args.hospitals)])
+    hospitals, after_h = measure(lambda: [
+        Hospital(id=f"h{i}", name=f"Hospital {i}", city=fresh(location(i)[0]), district=fresh(location(i)[1]))
+        for i in range(args.hospitals)])
+    _, before_d = measure(lambda: [
+        LegacyDoctor(f"d{i}", f"h{i % args.hospitals}", f"Dr. {i}", fresh(BRANCHES[i % 5])) for i in range(args.doctors)])
+    doctors, after_d = measure(lambda: [
+        Doctor(f"d{i}", f"h{i % args.hospitals}", f"Dr. {i}", fresh(BRANCHES[i % 5])) for i in range(args.doctors)])
+    _, before_p = measure(lambda: [LegacyPatient(f"p{i}", f"Patient {i}", 30) for i in range(args.patients)])
+    patients, after_p = measure(lambda: [Patient(f"p{i}", f"Patient {i}", 30) for i in range(args.patients)])
+
+    n = args.appointments
+    _, before_a = measure(lambda: [
+        LegacyAppointment(a, d, p, s, e, AppointmentStatus[st], h)
+        for a, d, p, s, e, st, h in rows(n, args.doctors, args.patients, args.hospitals)])
+
+    def slotted():
+        return [Appointment(a, d, p, s, e, AppointmentStatus[st], h)
+                for a, d, p, s, e, st, h in rows(n, args.doctors, args.patients, args.hospitals)]
+
+    _, slotted_a = measure(slotted)
+
+    store = AppointmentStore(hospitals, doctors, patients, [], {})
+
+    def slotted_shared():
+        appointments = slotted()
+        for app in appointments:
+            store._share_ids(app)  # what AppointmentStore does for every appointment it indexes
+        return appointments
+
+    _, shared_a = measure(slotted_shared)
+
+    print(f"appointments={n:,} doctors={args.doctors:,} patients={args.patients:,} hospitals={args.hospitals:,}\n")
+    report("hospitals: dict", before_h, args.hospitals)
+    report("hospitals: Hospital (slots)", after_h, args.hospitals)
+    report("doctors: dataclass", before_d, args.doctors)
+    report("doctors: slots + interned", after_d, args.doctors)
+    report("patients: dataclass", before_p, args.patients)
+    report("patients: slots", after_p, args.patients)
+    report("appointments: dataclass", before_a, n)
+    report("appointments: slots", slotted_a, n)
+    report("appointments: slots + shared ids", shared_a, n)
+    print(f"\nper appointment: {before_a / n:.0f} B -> {shared_a / n:.0f} B ({1 - shared_a / before_a:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
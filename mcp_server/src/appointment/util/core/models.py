@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -9,27 +10,43 @@ class AppointmentStatus(Enum):
     CANCELLED = "İPTAL"
     COMPLETED = "TAMAMLANDI"
 
-@dataclass(frozen=True)
+def _intern(obj, *fields: str) -> None:
+    """Share one string object per distinct value of low-cardinality fields (city, branch, ...)."""
+    for name in fields:
+        value = getattr(obj, name)
+        if isinstance(value, str):
+            object.__setattr__(obj, name, sys.intern(value))
+
+# Models are slotted: no per-instance __dict__, which dominates memory at millions of appointments.
+
+@dataclass(frozen=True, slots=True)
 class Hospital:
     id: str
     name: str
     city: str
     district: str
 
-@dataclass(frozen=True)
+    def __post_init__(self):
+        _intern(self, "id", "city", "district")
+
+@dataclass(frozen=True, slots=True)
 class Doctor:
     id: str
     hospital_id: str
     name: str
     branch: str
 
-@dataclass
+    def __post_init__(self):
+        _intern(self, "hospital_id", "branch")
+
+@dataclass(slots=True)
 class Patient:
     id: str
     name: str
     age: int
 
-@dataclass
+# No __post_init__ on the hot path: the store points doctor_id / patient_id at the Doctor / Patient id objects.
+@dataclass(slots=True)
 class Appointment:
     id: str
     doctor_id: str
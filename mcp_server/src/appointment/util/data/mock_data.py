@@ -1,19 +1,19 @@
 from datetime import datetime
-from appointment.util.core.models import Doctor, Patient, Appointment, AppointmentStatus
+from appointment.util.core.models import Hospital, Doctor, Patient, Appointment, AppointmentStatus
 
 def str_to_dt(dt_str):
     return datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
 
 MOCK_DATA = {
     "hospitals": [
-        {"id": "1", "name": "Medipol Hospital", "city": "Ankara", "district": "Çankaya"},
-        {"id": "2", "name": "Hacettepe Hospital", "city": "Ankara", "district": "Çankaya"},
-        {"id": "3", "name": "Acıbadem Hospital", "city": "İstanbul", "district": "Fatih"},
-        {"id": "4", "name": "Haseki Hospital", "city": "İstanbul", "district": "Fatih"},
-        {"id": "5", "name": "Öztan Hospital", "city": "İzmir", "district": "Bornova"},
-        {"id": "6", "name": "YKB Private Hospital", "city": "İzmir", "district": "Bornova"},
-        {"id": "7", "name": "Sorgun Devlet Hastanesi", "city": "Yozgat", "district": "Sorgun"},
-        {"id": "8", "name": "EKABI Hospital", "city": "Yozgat", "district": "Sorgun"}
+        Hospital(id="1", name="Medipol Hospital", city="Ankara", district="Çankaya"),
+        Hospital(id="2", name="Hacettepe Hospital", city="Ankara", district="Çankaya"),
+        Hospital(id="3", name="Acıbadem Hospital", city="İstanbul", district="Fatih"),
+        Hospital(id="4", name="Haseki Hospital", city="İstanbul", district="Fatih"),
+        Hospital(id="5", name="Öztan Hospital", city="İzmir", district="Bornova"),
+        Hospital(id="6", name="YKB Private Hospital", city="İzmir", district="Bornova"),
+        Hospital(id="7", name="Sorgun Devlet Hastanesi", city="Yozgat", district="Sorgun"),
+        Hospital(id="8", name="EKABI Hospital", city="Yozgat", district="Sorgun")
     ],
 
     "doctors": [
@@ -0,0 +1,2 @@
+from .catalogue import catalogue_mtime, iter_chunks, iter_records, load_catalogue
+from .snapshot import load_snapshot, write_snapshot
\ No newline at end of file
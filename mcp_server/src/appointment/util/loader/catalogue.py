@@ -0,0 +1,137 @@
+"""
+A catalogue is a directory with one table per file, as CSV (with a header row) or JSONL:
+
+    hospitals     id, name, city, district
+    doctors       id, hospital_id, name, branch
+    patients      id, name, age
+    availability  doctor_id, date (YYYY-MM-DD), time (HH:MM)     -- one row per working slot
+    appointments  id, doctor_id, patient_id, hospital_id, start_time, end_time (YYYY-MM-DD HH:MM), status
+
+Only hospitals and doctors are required.
+"""
+import csv
+import gc
+import json
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from appointment.util.core.models import Appointment, AppointmentStatus, Doctor, Hospital, Patient
+from appointment.util.store.appointment_store import AppointmentStore
+from appointment.util.store.slot_calendar import SlotCalendar
+
+TABLES = ("hospitals", "doctors", "patients", "availability", "appointments")
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+# ---- Public API ----
+
+def find_table(directory: str, table: str) -> Optional[str]:
+    for extension in (".jsonl", ".csv"):
+        path = os.path.join(directory, table + extension)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def catalogue_mtime(directory: str) -> float:
+    """Newest modification time of the catalogue's tables (0.0 if there are none)."""
+    paths = [find_table(directory, table) for table in TABLES]
+    return max((os.path.getmtime(p) for p in paths if p), default=0.0)
+
+
+def iter_records(path: str) -> Iterator[dict]:
+    """Rows of a CSV / JSONL file as dicts, one at a time."""
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+@contextmanager
+def paused_gc():
+    """
+    Bulk loads allocate millions of long-lived objects, and every few hundred allocations the
+    cyclic GC would rescan all of them. Pause it while loading, then freeze the loaded objects
+    so later collections in the server skip them too.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.freeze()
+        if was_enabled:
+            gc.enable()
+
+
+def iter_chunks(records: Iterable, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def load_catalogue(directory: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AppointmentStore:
+    """
+    Stream a catalogue into an AppointmentStore. Reference tables are read first; appointments
+    are then parsed and indexed one chunk at a time, so the raw rows never sit in memory together.
+    """
+    with paused_gc():
+        hospitals = [_hospital(r) for r in _table(directory, "hospitals", required=True)]
+        doctors = [_doctor(r) for r in _table(directory, "doctors", required=True)]
+        patients = [_patient(r) for r in _table(directory, "patients")]
+
+        # Availability rows go straight into the calendar's epoch-minute arrays, one row at a time.
+        calendar = SlotCalendar.from_rows(
+            (sys.intern(str(row["doctor_id"])), row["date"], row["time"]) for row in _table(directory, "availability")
+        )
+
+        store = AppointmentStore(hospitals, doctors, patients, [], calendar=calendar)
+        for chunk in iter_chunks(_table(directory, "appointments"), chunk_size):
+            store.extend(_appointment(r) for r in chunk)
+
+    print(f"Loaded catalogue {directory}: {len(hospitals)} hospitals, {len(doctors)} doctors, "
+          f"{len(patients)} patients, {len(store.appointments)} appointments")
+    return store
+
+
+# ---------- helpers ----------
+
+def _table(directory: str, table: str, required: bool = False) -> Iterator[dict]:
+    path = find_table(directory, table)
+    if path is None:
+        if required:
+            raise FileNotFoundError(f"Catalogue {directory} has no {table}.csv or {table}.jsonl")
+        return iter(())
+    return iter_records(path)
+
+
+def _hospital(row: dict) -> Hospital:
+    return Hospital(id=str(row["id"]), name=row["name"], city=row.get("city"), district=row.get("district"))
+
+
+def _doctor(row: dict) -> Doctor:
+    return Doctor(id=str(row["id"]), hospital_id=str(row["hospital_id"]), name=row["name"], branch=row.get("branch"))
+
+
+def _patient(row: dict) -> Patient:
+    return Patient(id=str(row["id"]), name=row.get("name"), age=int(row["age"]) if row.get("age") not in (None, "") else None)
+
+
+def _appointment(row: dict) -> Appointment:
+    # fromisoformat is implemented in C and accepts "YYYY-MM-DD HH:MM"; much cheaper than strptime.
+    return Appointment(
+        id=str(row["id"]),
+        doctor_id=str(row["doctor_id"]),
+        patient_id=str(row["patient_id"]),
+        hospital_id=str(row["hospital_id"]) if row.get("hospital_id") not in (None, "") else None,
+        start_time=datetime.fromisoformat(row["start_time"]),
+        end_time=datetime.fromisoformat(row["end_time"]),
+        status=AppointmentStatus[row.get("status") or "BOOKED"],
+    )
@@ -0,0 +1,134 @@
+"""
+Binary snapshot of an AppointmentStore, memory-mapped at startup.
+
+Layout (little- or big-endian as recorded in the header, int64 arrays 8-byte aligned):
+
+    b"APPTSNAP" | u64 header length | header (JSON) | padding | sections...
+
+The header holds the reference tables and the offset / length of every section:
+availability as CSR arrays (doctor -> days -> epoch minutes, see SlotCalendar.columns)
+and appointments as one compact JSON array. The availability arrays are never copied:
+SlotCalendar reads them through memoryviews and builds a doctor's days on first use.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Dict, List
+
+from appointment.util.core.models import Appointment, AppointmentStatus, Doctor, Hospital, Patient
+from appointment.util.loader.catalogue import paused_gc
+from appointment.util.store.appointment_store import AppointmentStore
+from appointment.util.store.slot_calendar import SlotCalendar, dt_to_epoch_minute, epoch_minute_to_dt
+
+MAGIC = b"APPTSNAP"
+VERSION = 1
+ARRAY_SECTIONS = ("doctor_offsets", "day_ordinals", "day_offsets", "minutes")
+
+
+# ---- Public API ----
+
+def write_snapshot(store: AppointmentStore, path: str) -> None:
+    """Write the store atomically (temp file + rename), so a crash never leaves a torn snapshot."""
+    doctor_ids, *arrays = store.calendar.columns()
+    appointments = json.dumps(
+        [
+            [a.id, a.doctor_id, a.patient_id, a.hospital_id,
+             dt_to_epoch_minute(a.start_time), dt_to_epoch_minute(a.end_time), a.status.name]
+            for a in store.appointments
+        ],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    # Offsets depend on the header length, so lay the sections out relative to the data start first.
+    sections: Dict[str, List[int]] = {}
+    position = 0
+    for name, values in zip(ARRAY_SECTIONS, arrays):
+        sections[name] = [position, len(values)]
+        position += len(values) * values.itemsize
+    sections["appointments"] = [position, len(appointments)]
+
+    header = {
+        "version": VERSION,
+        "byteorder": sys.byteorder,
+        "hospitals": [[h.id, h.name, h.city, h.district] for h in store.hospitals],
+        "doctors": [[d.id, d.hospital_id, d.name, d.branch] for d in store.doctors],
+        "patients": [[p.id, p.name, p.age] for p in store.patients],
+        "calendar_doctors": doctor_ids,
+        "sections": sections,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    data_start = _align(len(MAGIC) + 8 + len(header_bytes))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * (data_start - f.tell()))
+        # Section offsets in the header are relative to data_start.
+        for values in arrays:
+            values.tofile(f)
+        f.write(appointments)
+        _fsync(f)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: str) -> AppointmentStore:
+    """Map a snapshot and build the store; availability stays in the mapping (zero-copy)."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mapped[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not an appointment snapshot")
+    (header_length,) = struct.unpack_from("<Q", mapped, len(MAGIC))
+    header_start = len(MAGIC) + 8
+    header = json.loads(mapped[header_start:header_start + header_length])
+    if header["version"] != VERSION:
+        raise ValueError(f"Snapshot {path} has version {header['version']}, expected {VERSION}")
+
+    data_start = _align(header_start + header_length)
+    sections = header["sections"]
+    arrays = [_int64_section(mapped, data_start, *sections[name], header["byteorder"]) for name in ARRAY_SECTIONS]
+    calendar = SlotCalendar.from_columns(header["calendar_doctors"], *arrays)
+
+    with paused_gc():
+        hospitals = [Hospital(*row) for row in header["hospitals"]]
+        doctors = [Doctor(*row) for row in header["doctors"]]
+        patients = [Patient(*row) for row in header["patients"]]
+        store = AppointmentStore(hospitals, doctors, patients, [], {}, calendar=calendar)
+
+        offset, length = sections["appointments"]
+        rows = json.loads(mapped[data_start + offset:data_start + offset + length])
+        store.extend(
+            Appointment(
+                id=app_id, doctor_id=doctor_id, patient_id=patient_id, hospital_id=hospital_id,
+                start_time=epoch_minute_to_dt(start), end_time=epoch_minute_to_dt(end), status=AppointmentStatus[status],
+            )
+            for app_id, doctor_id, patient_id, hospital_id, start, end, status in rows
+        )
+    return store
+
+
+# ---------- helpers ----------
+
+def _align(position: int, to: int = 8) -> int:
+    return -(-position // to) * to
+
+
+def _int64_section(mapped: mmap.mmap, data_start: int, offset: int, count: int, byteorder: str):
+    start = data_start + offset
+    if byteorder == sys.byteorder:
+        return memoryview(mapped)[start:start + count * 8].cast("q")
+    # Written on a machine with the other byte order: fall back to a swapped copy.
+    values = array("q", mapped[start:start + count * 8])
+    values.byteswap()
+    return values
+
+
+def _fsync(f: BinaryIO) -> None:
+    f.flush()
+    os.fsync(f.fileno())
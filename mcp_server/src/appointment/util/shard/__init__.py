@@ -0,0 +1,3 @@
+from .partition import shard_of, partition_data
+from .client import ShardClient, ShardError
+from .worker import SHARD_METHODS, run_shard
\ No newline at end of file
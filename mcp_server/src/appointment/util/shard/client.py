@@ -0,0 +1,95 @@
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import Future
+from typing import Dict
+
+from appointment.util.shard.worker import run_shard
+
+DEFAULT_START_TIMEOUT = 120.0
+
+
+class ShardError(RuntimeError):
+    """A shard failed outside the domain rules (crashed, unexpected exception)."""
+
+
+class ShardClient:
+    """
+    Router-side handle of one shard process. Calls are pipelined over a duplex pipe: `call` returns
+    a Future right away and a reader thread resolves it when the shard replies, so one router
+    can have requests in flight on every shard at once.
+    """
+
+    def __init__(self, index: int, shard_count: int, data: dict = None, start_timeout: float = DEFAULT_START_TIMEOUT):
+        self.index = index
+        self._conn, child_conn = multiprocessing.Pipe(duplex=True)
+        self.process = multiprocessing.Process(
+            target=run_shard, args=(index, shard_count, child_conn, data), name=f"appointment-shard-{index}", daemon=True)
+        self.process.start()
+        child_conn.close()
+
+        if not self._conn.poll(start_timeout):
+            self.process.terminate()
+            raise ShardError(f"Appointment shard {index} did not start within {start_timeout:.0f}s.")
+        try:
+            self._conn.recv()  # ("ready", index)
+        except EOFError:
+            raise ShardError(f"Appointment shard {index} exited during startup (exit code {self.process.exitcode}).")
+
+        self._ids = itertools.count()
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._reader = threading.Thread(target=self._read_replies, name=f"appointment-shard-{index}-reader", daemon=True)
+        self._reader.start()
+
+    # ---- Public API ----
+
+    def call(self, method: str, **kwargs) -> Future:
+        """Send one request; the Future holds the result, or raises ValueError / ShardError."""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise ShardError(f"Appointment shard {self.index} is not running.")
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            self._conn.send((request_id, method, kwargs))
+        return future
+
+    def close(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+
+    # ---------- helpers ----------
+
+    def _read_replies(self) -> None:
+        while True:
+            try:
+                request_id, ok, result = self._conn.recv()
+            except (EOFError, OSError):
+                break
+
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(result)
+            else:
+                is_value_error, message = result
+                future.set_exception(ValueError(message) if is_value_error else ShardError(message))
+
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(ShardError(f"Appointment shard {self.index} exited."))
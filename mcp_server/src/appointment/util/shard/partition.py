@@ -0,0 +1,31 @@
+import zlib
+
+
+def shard_of(doctor_id: str, shard_count: int) -> int:
+    """Shard owning a doctor. crc32, not hash(): str hashes are salted per process."""
+    return zlib.crc32(str(doctor_id).encode("utf-8")) % shard_count
+
+
+def partition_data(data: dict, index: int, shard_count: int) -> dict:
+    """
+    The part of a MOCK_DATA shaped dict owned by one shard: its doctors with their availability
+    and appointments. Hospitals and patients are small reference tables and go to every shard.
+
+    Availability is either an "availability_map" or a "calendar" (a SlotCalendar, as a loaded store
+    holds it); a calendar is cut down to the shard's doctors without going back through strings.
+    """
+    def owned(doctor_id: str) -> bool:
+        return shard_of(doctor_id, shard_count) == index
+
+    doctors = [d for d in data["doctors"] if owned(d.id)]
+    shard = {
+        "hospitals": list(data["hospitals"]),
+        "doctors": doctors,
+        "patients": list(data["patients"]),
+        "appointments": [a for a in data["appointments"] if owned(a.doctor_id)],
+    }
+    if data.get("calendar") is not None:
+        shard["calendar"] = data["calendar"].subset(d.id for d in doctors)
+    else:
+        shard["availability_map"] = {d: schedule for d, schedule in data["availability_map"].items() if owned(d)}
+    return shard
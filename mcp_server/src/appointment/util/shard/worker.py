@@ -0,0 +1,48 @@
+from multiprocessing.connection import Connection
+
+# What the router may call on a shard: AppointmentManager methods plus two internal reads.
+SHARD_METHODS = frozenset({
+    "get_available_slots", "find_earliest_slots", "get_patient_appointments",
+    "create_appointment", "update_appointment", "cancel_appointment",
+    "get_appointment", "reference_data",
+})
+
+
+def run_shard(index: int, shard_count: int, conn: Connection, data: dict = None) -> None:
+    """
+    Entry point of a shard process: own the doctors with shard_of(doctor_id) == index and answer
+    (request_id, method, kwargs) messages one at a time until the pipe closes or None arrives.
+    Replies are (request_id, ok, result) with result = (is_value_error, message) on failure.
+    `data` (MOCK_DATA shaped) replaces the configured catalogue, as in create_repository.
+    """
+    # Imported here because appointment.util.store imports this package (partition_data).
+    from appointment.appointment_manager import AppointmentManager
+    from appointment.util.store import create_repository
+
+    manager = AppointmentManager(repository=create_repository(data, shard=(index, shard_count)))
+    handlers = {name: getattr(manager, name) for name in SHARD_METHODS if hasattr(manager, name)}
+    handlers["get_appointment"] = manager.repository.get_appointment
+    handlers["reference_data"] = lambda: (manager.repository.list_hospitals(), manager.repository.list_doctors())
+
+    print(f"Appointment shard {index}/{shard_count} ready: {len(manager.repository.list_doctors())} doctors")
+    conn.send(("ready", index))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+
+        request_id, method, kwargs = message
+        try:
+            handler = handlers.get(method)
+            if handler is None:
+                raise ValueError(f"Unknown shard method '{method}'.")
+            reply = (request_id, True, handler(**kwargs))
+        except Exception as e:
+            reply = (request_id, False, (isinstance(e, ValueError), str(e)))
+        conn.send(reply)
+
+    conn.close()
@@ -0,0 +1,6 @@
+from .repository import AppointmentRepository, SlotAlreadyBookedError
+from .appointment_store import AppointmentStore
+from .slot_calendar import SlotCalendar
+from .search_index import SearchIndex, normalize_term
+from .sqlite_repository import SQLiteAppointmentRepository, SQLiteConnectionPool
+from .factory import create_repository
\ No newline at end of file
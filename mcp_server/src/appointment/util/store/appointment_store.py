@@ -0,0 +1,203 @@
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import threading
+
+from appointment.util.core.models import Appointment, AppointmentStatus, Doctor, Hospital, Patient
+from appointment.util.store.repository import AppointmentRepository, SlotAlreadyBookedError
+from appointment.util.store.slot_calendar import SlotCalendar, epoch_minute_to_dt
+
+
+class AppointmentStore(AppointmentRepository):
+    """
+    Indexed in-memory appointment data (the "memory" backend; mutates the given lists in place).
+
+    Every mutation goes through `add` / `set_status`, which keep the indexes consistent:
+    - hospitals_by_id, doctors_by_id, patients_by_id, appointments_by_id
+    - booked: (doctor_id, start_time) -> appointment_id of the BOOKED appointment in that slot
+    - by_patient: patient_id -> appointments in insertion order
+    - calendar: parsed availability with a free/booked bitmap per doctor-day
+
+    Tool calls may run on several threads. Writes take a lock striped by (doctor_id, day), so
+    check-then-write on a slot is atomic and each day's bitmap has a single writer at a time,
+    while bookings for different doctor-days proceed in parallel. The parallelism comes from
+    MCPServer._off_loop, which runs every synchronous tool on a worker thread (asyncio.to_thread);
+    tools run on the event loop would serialize anyway.
+    """
+
+    LOCK_STRIPES = 256
+
+    def __init__(
+        self,
+        hospitals: List[Hospital],
+        doctors: List[Doctor],
+        patients: List[Patient],
+        appointments: List[Appointment],
+        availability_map: Optional[Dict[str, Dict[str, List[str]]]] = None,
+        calendar: Optional[SlotCalendar] = None,
+    ):
+        self.hospitals = hospitals
+        self.doctors = doctors
+        self.patients = patients
+        self.appointments = appointments
+
+        self.hospitals_by_id: Dict[str, Hospital] = {h.id: h for h in hospitals}
+        self.doctors_by_id: Dict[str, Doctor] = {d.id: d for d in doctors}
+        self.patients_by_id: Dict[str, Patient] = {p.id: p for p in patients}
+        # A prebuilt calendar (streamed from a catalogue, mapped from a snapshot) replaces parsing
+        # availability_map; the raw map is not kept, the calendar is the only copy of the availability.
+        self.calendar = calendar if calendar is not None else SlotCalendar(availability_map)
+
+        self.appointments_by_id: Dict[str, Appointment] = {}
+        self.booked: Dict[Tuple[str, datetime], str] = {}
+        self.by_patient: Dict[str, List[Appointment]] = {}
+        self._stripes = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+
+        for app in appointments:
+            self._index(app)
+
+    @classmethod
+    def from_data(cls, data: dict) -> "AppointmentStore":
+        return cls(
+            hospitals=data["hospitals"],
+            doctors=data["doctors"],
+            patients=data["patients"],
+            appointments=data["appointments"],
+            availability_map=data.get("availability_map"),
+            calendar=data.get("calendar"),
+        )
+
+    # ---- Lookups ----
+
+    def list_hospitals(self) -> List[dict]:
+        return self.hospitals
+
+    def list_doctors(self) -> List[Doctor]:
+        return self.doctors
+
+    def get_hospital(self, hospital_id: str) -> Optional[dict]:
+        return self.hospitals_by_id.get(hospital_id)
+
+    def get_doctor(self, doctor_id: str) -> Optional[Doctor]:
+        return self.doctors_by_id.get(doctor_id)
+
+    def get_patient(self, patient_id: str) -> Optional[Patient]:
+        return self.patients_by_id.get(patient_id)
+
+    def get_appointment(self, appointment_id: str) -> Optional[Appointment]:
+        return self.appointments_by_id.get(appointment_id)
+
+    def is_booked(self, doctor_id: str, start_time: datetime) -> bool:
+        return (doctor_id, start_time) in self.booked
+
+    def booked_appointment_id(self, doctor_id: str, start_time: datetime) -> Optional[str]:
+        return self.booked.get((doctor_id, start_time))
+
+    def patient_appointments(self, patient_id: str) -> List[Appointment]:
+        return self.by_patient.get(patient_id, [])
+
+    def has_slot(self, doctor_id: str, start_time: datetime) -> bool:
+        return self.calendar.has_slot(doctor_id, start_time)
+
+    def free_slots(self, doctor_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[dict]:
+        return self.calendar.free_slots(doctor_id, start_date=start_date, end_date=end_date)
+
+    def earliest_free_slots(self, doctor_ids: List[str], limit: int, after: Optional[datetime] = None,
+                            end_date: Optional[str] = None) -> List[Tuple[str, datetime]]:
+        return [
+            (doctor_id, epoch_minute_to_dt(minute))
+            for minute, doctor_id in self.calendar.earliest_free(doctor_ids, limit, after=after, end_date=end_date)
+        ]
+
+    # ---- Mutations ----
+
+    def book(self, appointment: Appointment) -> Appointment:
+        self.add(appointment)
+        return appointment
+
+    def cancel(self, appointment_id: str) -> Appointment:
+        appointment = self.appointments_by_id[appointment_id]
+        self.set_status(appointment, AppointmentStatus.CANCELLED)
+        return appointment
+
+    def reschedule(self, old_appointment_id: str, new_appointment: Appointment) -> Appointment:
+        old_appointment = self.appointments_by_id[old_appointment_id]
+
+        with self._locked(old_appointment, new_appointment):
+            if old_appointment.status != AppointmentStatus.BOOKED:
+                raise ValueError("this appointment already cancelled.")
+
+            self._set_status(old_appointment, AppointmentStatus.CANCELLED)
+            try:
+                self._add(new_appointment)
+            except Exception:
+                self._set_status(old_appointment, AppointmentStatus.BOOKED)
+                raise
+
+        return new_appointment
+
+    def add(self, appointment: Appointment) -> None:
+        with self._locked(appointment):
+            self._add(appointment)
+
+    def set_status(self, appointment: Appointment, status: AppointmentStatus) -> None:
+        with self._locked(appointment):
+            self._set_status(appointment, status)
+
+    def extend(self, appointments: Iterable[Appointment]) -> None:
+        """Bulk load (one chunk of a catalogue); indexes as it goes. Not for use while serving tool calls."""
+        for appointment in appointments:
+            self._add(appointment)
+
+    # ---------- helpers ----------
+
+    def _locked(self, *appointments: Appointment) -> ExitStack:
+        """Hold the stripes of the appointments' doctor-days, acquired in index order (no lock-order deadlocks)."""
+        stripes = sorted({hash((a.doctor_id, a.start_time.toordinal())) % self.LOCK_STRIPES for a in appointments})
+        stack = ExitStack()
+        for stripe in stripes:
+            stack.enter_context(self._stripes[stripe])
+        return stack
+
+    def _add(self, appointment: Appointment) -> None:
+        if appointment.status == AppointmentStatus.BOOKED and self.is_booked(appointment.doctor_id, appointment.start_time):
+            raise SlotAlreadyBookedError(f"The slot {appointment.start_time:%Y-%m-%d %H:%M} is already booked.")
+
+        self.appointments.append(appointment)
+        self._index(appointment)
+
+    def _set_status(self, appointment: Appointment, status: AppointmentStatus) -> None:
+        slot = (appointment.doctor_id, appointment.start_time)
+
+        if status == AppointmentStatus.BOOKED:
+            holder = self.booked.get(slot)
+            if holder is not None and holder != appointment.id:
+                raise SlotAlreadyBookedError(f"The slot {appointment.start_time:%Y-%m-%d %H:%M} is already booked.")
+            self.booked[slot] = appointment.id
+            self.calendar.mark_booked(*slot)
+
+        elif self.booked.get(slot) == appointment.id:
+            del self.booked[slot]
+            self.calendar.mark_free(*slot)
+
+        appointment.status = status
+
+    def _share_ids(self, appointment: Appointment) -> None:
+        """Point the appointment's ids at the Doctor / Patient / Hospital strings, so millions of rows hold no copies."""
+        doctor = self.doctors_by_id.get(appointment.doctor_id)
+        if doctor is not None:
+            appointment.doctor_id = doctor.id
+        patient = self.patients_by_id.get(appointment.patient_id)
+        if patient is not None:
+            appointment.patient_id = patient.id
+        hospital = self.hospitals_by_id.get(appointment.hospital_id)
+        if hospital is not None:
+            appointment.hospital_id = hospital.id
+
+    def _index(self, appointment: Appointment) -> None:
+        self._share_ids(appointment)
+        self.appointments_by_id[appointment.id] = appointment
+        self.by_patient.setdefault(appointment.patient_id, []).append(appointment)
+        if appointment.status == AppointmentStatus.BOOKED:
+            self.booked[(appointment.doctor_id, appointment.start_time)] = appointment.id
+            self.calendar.mark_booked(appointment.doctor_id, appointment.start_time)
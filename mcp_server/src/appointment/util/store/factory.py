@@ -0,0 +1,78 @@
+import os
+from typing import Tuple
+
+from appointment.util.data import MOCK_DATA
+from appointment.util.shard.partition import partition_data
+from appointment.util.store.appointment_store import AppointmentStore
+from appointment.util.store.repository import AppointmentRepository
+from appointment.util.store.sqlite_repository import SQLiteAppointmentRepository
+
+
+def create_repository(data: dict = None, backend: str = None, shard: Tuple[int, int] = None) -> AppointmentRepository:
+    """
+    Backend chosen by APPOINTMENT_BACKEND ("memory" by default, or "sqlite").
+
+    Without `data`, the catalogue in APPOINTMENT_DATA_DIR (CSV / JSONL) is loaded if set, else MOCK_DATA.
+    The memory backend boots from APPOINTMENT_SNAPSHOT_PATH when it is newer than the catalogue,
+    and writes it after loading the catalogue.
+    The SQLite database (APPOINTMENT_SQLITE_PATH) is seeded with the data on first use.
+
+    `shard=(index, count)` keeps only that shard's doctors (see appointment.util.shard); each shard
+    gets its own snapshot / database file, suffixed ".shard<index>of<count>".
+    """
+    backend = (backend or os.getenv("APPOINTMENT_BACKEND", "memory")).strip().lower()
+    data_dir = os.getenv("APPOINTMENT_DATA_DIR", "").strip() if data is None else ""
+    suffix = f".shard{shard[0]}of{shard[1]}" if shard else ""
+
+    def source_data() -> dict:
+        full = _catalogue_data(data_dir) if data_dir else (data if data is not None else MOCK_DATA)
+        return partition_data(full, *shard) if shard else full
+
+    if backend == "memory":
+        snapshot_path = os.getenv("APPOINTMENT_SNAPSHOT_PATH", "").strip()
+        if data_dir:
+            return _load_memory_store(data_dir, snapshot_path + suffix if snapshot_path else "", shard)
+        return AppointmentStore.from_data(source_data())
+
+    if backend == "sqlite":
+        repository = SQLiteAppointmentRepository(
+            path=os.getenv("APPOINTMENT_SQLITE_PATH", "appointments.db").strip() + suffix,
+            pool_size=int(os.getenv("APPOINTMENT_SQLITE_POOL_SIZE", "4").strip()),
+        )
+        if repository.is_empty():
+            repository.seed(source_data())
+        return repository
+
+    raise ValueError(f"Unknown APPOINTMENT_BACKEND '{backend}' (expected 'memory' or 'sqlite').")
+
+
+def _load_memory_store(data_dir: str, snapshot_path: str, shard: Tuple[int, int] = None) -> AppointmentStore:
+    # Imported here because the loader package itself imports appointment.util.store.
+    from appointment.util.loader import catalogue_mtime, load_catalogue, load_snapshot, write_snapshot
+
+    if snapshot_path and os.path.exists(snapshot_path) and os.path.getmtime(snapshot_path) >= catalogue_mtime(data_dir):
+        print(f"Loading appointment snapshot {snapshot_path}")
+        return load_snapshot(snapshot_path)
+
+    store = load_catalogue(data_dir)
+    if shard:
+        store = AppointmentStore.from_data(partition_data(_store_data(store), *shard))
+    if snapshot_path:
+        write_snapshot(store, snapshot_path)
+    return store
+
+
+def _catalogue_data(data_dir: str) -> dict:
+    from appointment.util.loader import load_catalogue
+
+    return _store_data(load_catalogue(data_dir))
+
+
+def _store_data(store: AppointmentStore) -> dict:
+    return {
+        "hospitals": store.hospitals,
+        "doctors": store.doctors,
+        "patients": store.patients,
+        "appointments": store.appointments,
+        "calendar": store.calendar,
+    }
@@ -0,0 +1,89 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from appointment.util.core.models import Appointment, Doctor, Hospital, Patient
+
+
+class SlotAlreadyBookedError(ValueError):
+    """The (doctor, start_time) slot already holds a BOOKED appointment."""
+
+
+class AppointmentRepository(ABC):
+    """
+    Storage backend of the appointment domain. AppointmentManager validates requests;
+    the repository answers lookups and applies writes atomically.
+    """
+
+    # ---- Reference data ----
+
+    @abstractmethod
+    def list_hospitals(self) -> List[Hospital]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_doctors(self) -> List[Doctor]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_hospital(self, hospital_id: str) -> Optional[Hospital]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_doctor(self, doctor_id: str) -> Optional[Doctor]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_patient(self, patient_id: str) -> Optional[Patient]:
+        raise NotImplementedError
+
+    # ---- Appointments ----
+
+    @abstractmethod
+    def get_appointment(self, appointment_id: str) -> Optional[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def patient_appointments(self, patient_id: str) -> List[Appointment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def booked_appointment_id(self, doctor_id: str, start_time: datetime) -> Optional[str]:
+        raise NotImplementedError
+
+    def is_booked(self, doctor_id: str, start_time: datetime) -> bool:
+        return self.booked_appointment_id(doctor_id, start_time) is not None
+
+    # ---- Availability ----
+
+    @abstractmethod
+    def has_slot(self, doctor_id: str, start_time: datetime) -> bool:
+        """True if the doctor works in this slot (booked or not)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def free_slots(self, doctor_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[dict]:
+        """[{"date": "YYYY-MM-DD", "slots": ["HH:MM", ...]}, ...], days with at least one free slot."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def earliest_free_slots(self, doctor_ids: List[str], limit: int, after: Optional[datetime] = None,
+                            end_date: Optional[str] = None) -> List[Tuple[str, datetime]]:
+        """The `limit` earliest free (doctor_id, start_time) slots across the doctors, in time order."""
+        raise NotImplementedError
+
+    # ---- Writes ----
+
+    @abstractmethod
+    def book(self, appointment: Appointment) -> Appointment:
+        """Insert a BOOKED appointment; raises SlotAlreadyBookedError if the slot is taken."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def cancel(self, appointment_id: str) -> Appointment:
+        raise NotImplementedError
+
+    @abstractmethod
+    def reschedule(self, old_appointment_id: str, new_appointment: Appointment) -> Appointment:
+        """Cancel the old appointment and book the new one as a single unit; on failure nothing changes."""
+        raise NotImplementedError
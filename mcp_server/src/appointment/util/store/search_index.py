@@ -0,0 +1,153 @@
+import difflib
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from appointment.util.core.models import Doctor, Hospital
+
+# Python's str.lower() maps "İ" to "i" + combining dot and "I" to "i"; Turkish wants "i" and "ı".
+_TURKISH_UPPER = str.maketrans({"İ": "i", "I": "ı"})
+# After lowercasing, fold Turkish letters to ASCII so "Cankaya", "ÇANKAYA" and "çankaya" share a key.
+_ASCII_FOLD = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+
+
+def normalize_term(text: Optional[str]) -> str:
+    """Search key of a city / district / branch: Turkish-aware lowercase, ASCII folded, single spaces."""
+    if not text:
+        return ""
+    return " ".join(text.translate(_TURKISH_UPPER).lower().translate(_ASCII_FOLD).split())
+
+
+class _TermIndex:
+    """Normalized term -> positions, resolved by exact, then prefix, then fuzzy match."""
+
+    FUZZY_MATCHES = 3
+    FUZZY_CUTOFF = 0.8
+
+    def __init__(self):
+        self._postings: Dict[str, List[int]] = {}
+        self._keys: List[str] = []
+
+    def add(self, term: Optional[str], position: int) -> None:
+        key = normalize_term(term)
+        if key:
+            self._postings.setdefault(key, []).append(position)
+
+    def freeze(self) -> None:
+        self._keys = sorted(self._postings)
+
+    def match(self, query: Optional[str]) -> Optional[Set[str]]:
+        """Index keys matching the query; None if the query is empty (no filter)."""
+        key = normalize_term(query)
+        if not key:
+            return None
+        return set(self._match(key))
+
+    def positions(self, keys: Set[str]) -> List[int]:
+        return sorted(position for key in keys for position in self._postings[key])
+
+    def count(self, keys: Set[str]) -> int:
+        return sum(len(self._postings[key]) for key in keys)
+
+    # ---------- helpers ----------
+
+    def _match(self, key: str) -> List[str]:
+        if key in self._postings:
+            return [key]
+
+        prefixed = []
+        i = bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i].startswith(key):
+            prefixed.append(self._keys[i])
+            i += 1
+        if prefixed:
+            return prefixed
+
+        return difflib.get_close_matches(key, self._keys, n=self.FUZZY_MATCHES, cutoff=self.FUZZY_CUTOFF)
+
+
+class SearchIndex:
+    """
+    Location / branch search over hospitals and doctors (reference data, built once).
+
+    City, district and branch queries are matched on normalized keys: an exact key wins,
+    otherwise every key starting with the query ("kardiyo"), otherwise close spellings ("Istambul").
+    Results keep the source order and are returned one page at a time.
+    """
+
+    def __init__(self, hospitals: List[Hospital], doctors: List[Doctor]):
+        self.hospitals = hospitals
+        self.doctors = doctors
+
+        self._cities = _TermIndex()
+        self._districts = _TermIndex()
+        self._hospital_keys: List[Tuple[str, str]] = []
+        for position, hospital in enumerate(hospitals):
+            self._cities.add(hospital.city, position)
+            self._districts.add(hospital.district, position)
+            self._hospital_keys.append((normalize_term(hospital.city), normalize_term(hospital.district)))
+
+        self._branches = _TermIndex()
+        self._doctor_branch: List[str] = []
+        self._doctors_by_hospital: Dict[str, List[int]] = {}
+        for position, doctor in enumerate(doctors):
+            self._branches.add(doctor.branch, position)
+            self._doctor_branch.append(normalize_term(doctor.branch))
+            self._doctors_by_hospital.setdefault(doctor.hospital_id, []).append(position)
+
+        for index in (self._cities, self._districts, self._branches):
+            index.freeze()
+
+    # ---- Public API ----
+
+    def search_hospitals(self, city: str = None, district: str = None,
+                         page: int = 1, page_size: int = 20) -> Tuple[List[Hospital], int]:
+        """(hospitals on the page, total matches)"""
+        return self._page(self.hospitals, self._hospital_positions(city, district), page, page_size)
+
+    def search_doctors(self, hospital_id: str = None, branch: str = None,
+                       page: int = 1, page_size: int = 20) -> Tuple[List[Doctor], int]:
+        """(doctors on the page, total matches)"""
+        positions = self._doctor_positions([hospital_id] if hospital_id else None, branch)
+        return self._page(self.doctors, positions, page, page_size)
+
+    def find_doctors(self, branch: str = None, city: str = None, district: str = None,
+                     hospital_id: str = None) -> List[Doctor]:
+        """Every doctor of the branch in the given hospital, or in the hospitals of the given location."""
+        if hospital_id:
+            hospital_ids = [hospital_id]
+        elif city or district:
+            hospital_ids = [self.hospitals[p].id for p in self._hospital_positions(city, district)]
+        else:
+            hospital_ids = None
+        return [self.doctors[p] for p in self._doctor_positions(hospital_ids, branch)]
+
+    # ---------- helpers ----------
+
+    def _hospital_positions(self, city: Optional[str], district: Optional[str]) -> Sequence[int]:
+        cities, districts = self._cities.match(city), self._districts.match(district)
+
+        # Walk the postings of the more selective filter and check the other one per hospital.
+        if cities is not None and (districts is None or self._cities.count(cities) <= self._districts.count(districts)):
+            return [p for p in self._cities.positions(cities)
+                    if districts is None or self._hospital_keys[p][1] in districts]
+        if districts is not None:
+            return [p for p in self._districts.positions(districts)
+                    if cities is None or self._hospital_keys[p][0] in cities]
+        return range(len(self.hospitals))
+
+    def _doctor_positions(self, hospital_ids: Optional[List[str]], branch: Optional[str]) -> Sequence[int]:
+        branches = self._branches.match(branch)
+
+        if hospital_ids is not None:
+            positions = [p for h in hospital_ids for p in self._doctors_by_hospital.get(h, ())
+                         if branches is None or self._doctor_branch[p] in branches]
+            return positions if len(hospital_ids) == 1 else sorted(positions)
+        if branches is not None:
+            return self._branches.positions(branches)
+        return range(len(self.doctors))
+
+    @staticmethod
+    def _page(items: list, positions: Sequence[int], page: int, page_size: int) -> Tuple[list, int]:
+        page, page_size = max(1, page), max(1, page_size)
+        start = (page - 1) * page_size
+        return [items[p] for p in positions[start:start + page_size]], len(positions)
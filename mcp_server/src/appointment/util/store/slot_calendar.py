@@ -0,0 +1,268 @@
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def epoch_minute(day: date, hour: int, minute: int) -> int:
+    """Minutes since 0001-01-01 00:00 (proleptic ordinal); compact, sortable and timezone free."""
+    return day.toordinal() * MINUTES_PER_DAY + hour * 60 + minute
+
+
+def dt_to_epoch_minute(dt: datetime) -> int:
+    return epoch_minute(dt, dt.hour, dt.minute)
+
+
+_LABELS = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(MINUTES_PER_DAY))
+_MINUTE_OF_LABEL = {label: m for m, label in enumerate(_LABELS)}
+
+
+def minute_label(minute: int) -> str:
+    """ "HH:MM" of an epoch minute (one shared string per minute of the day)."""
+    return _LABELS[minute % MINUTES_PER_DAY]
+
+
+_MINUTE_DELTAS = tuple(timedelta(minutes=m) for m in range(MINUTES_PER_DAY))
+
+
+@lru_cache(maxsize=1 << 16)
+def _day_start(ordinal: int) -> datetime:
+    return datetime.fromordinal(ordinal)
+
+
+def epoch_minute_to_dt(minute: int) -> datetime:
+    ordinal, minute_of_day = divmod(minute, MINUTES_PER_DAY)
+    return _day_start(ordinal) + _MINUTE_DELTAS[minute_of_day]
+
+
+class _Day:
+    """
+    One doctor-day: sorted epoch-minute slots and a booked bitmap (bit i = slot i booked).
+    `minutes` is an array, or a zero-copy memoryview into a mapped snapshot.
+    """
+    __slots__ = ("date", "ordinal", "minutes", "booked")
+
+    def __init__(self, ordinal: int, minutes: Sequence[int]):
+        self.date = date.fromordinal(ordinal).isoformat()
+        self.ordinal = ordinal
+        self.minutes = minutes
+        self.booked = 0  # a plain int; stays 0 (no allocation) until something is booked
+
+    @classmethod
+    def parse(cls, day: str, times: Iterable[str]) -> "_Day":
+        parsed = date.fromisoformat(day)
+        return cls(parsed.toordinal(), array("q", sorted({epoch_minute(parsed, int(t[:2]), int(t[3:5])) for t in times})))
+
+    def index_of(self, minute: int) -> int:
+        i = bisect_left(self.minutes, minute)
+        return i if i < len(self.minutes) and self.minutes[i] == minute else -1
+
+    def free_labels(self) -> List[str]:
+        booked = self.booked
+        if not booked:
+            return [_LABELS[m % MINUTES_PER_DAY] for m in self.minutes]
+        return [_LABELS[m % MINUTES_PER_DAY] for i, m in enumerate(self.minutes) if not booked >> i & 1]
+
+
+class _Columns:
+    """Availability of every doctor as flat arrays: doctor -> day range -> minute range (CSR layout)."""
+    __slots__ = ("doctor_index", "doctor_offsets", "day_ordinals", "day_offsets", "minutes")
+
+    def __init__(self, doctor_ids: List[str], doctor_offsets: Sequence[int], day_ordinals: Sequence[int],
+                 day_offsets: Sequence[int], minutes: Sequence[int]):
+        self.doctor_index = {doctor_id: i for i, doctor_id in enumerate(doctor_ids)}
+        self.doctor_offsets = doctor_offsets
+        self.day_ordinals = day_ordinals
+        self.day_offsets = day_offsets
+        self.minutes = minutes
+
+    def days(self, doctor_id: str) -> Optional[List[_Day]]:
+        i = self.doctor_index.get(doctor_id)
+        if i is None:
+            return None
+        return [
+            _Day(self.day_ordinals[d], self.minutes[self.day_offsets[d]:self.day_offsets[d + 1]])
+            for d in range(self.doctor_offsets[i], self.doctor_offsets[i + 1])
+        ]
+
+
+class SlotCalendar:
+    """
+    Availability parsed once into per-doctor, date-sorted days of epoch-minute slots, with a
+    free/booked bitmap per day that booking and cancel events flip. Reads never parse dates.
+
+    A calendar built `from_columns` (e.g. over a memory-mapped snapshot) creates a doctor's
+    days on first use, so startup cost does not grow with the number of availability entries.
+    """
+
+    def __init__(self, availability_map: Dict[str, Dict[str, List[str]]] = None):
+        # doctor_id -> (days sorted by date, their ordinals); replaced as a pair so readers never see a mix.
+        self._schedules: Dict[str, Tuple[List[_Day], List[int]]] = {}
+        self._columns: Optional[_Columns] = None
+        self._doctor_ids: List[str] = []
+
+        for doctor_id, schedule in (availability_map or {}).items():
+            days = sorted((_Day.parse(day, times) for day, times in schedule.items()), key=lambda d: d.ordinal)
+            self._schedules[doctor_id] = (days, [d.ordinal for d in days])
+            self._doctor_ids.append(doctor_id)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, str, str]]) -> "SlotCalendar":
+        """
+        Calendar straight from (doctor_id, "YYYY-MM-DD", "HH:MM") rows, e.g. a streamed availability
+        table: slots are kept as epoch minutes per doctor-day, never as a nested map of strings.
+        """
+        pending: Dict[Tuple[str, str], array] = {}
+        for doctor_id, day, time in rows:
+            minutes = pending.get((doctor_id, day))
+            if minutes is None:
+                minutes = pending[doctor_id, day] = array("q")
+            minute = _MINUTE_OF_LABEL.get(time)
+            if minute is None:
+                hour, _, minute = time.partition(":")
+                minute = int(hour) * 60 + int(minute[:2])
+            minutes.append(minute)
+
+        by_doctor: Dict[str, List[_Day]] = {}
+        for (doctor_id, day), minutes in pending.items():
+            ordinal = date.fromisoformat(day).toordinal()
+            start = ordinal * MINUTES_PER_DAY
+            by_doctor.setdefault(doctor_id, []).append(_Day(ordinal, array("q", sorted({start + m for m in minutes}))))
+
+        calendar = cls()
+        for doctor_id, days in by_doctor.items():
+            days.sort(key=lambda d: d.ordinal)
+            calendar._schedules[doctor_id] = (days, [d.ordinal for d in days])
+            calendar._doctor_ids.append(doctor_id)
+        return calendar
+
+    @classmethod
+    def from_columns(cls, doctor_ids: List[str], doctor_offsets: Sequence[int], day_ordinals: Sequence[int],
+                     day_offsets: Sequence[int], minutes: Sequence[int]) -> "SlotCalendar":
+        """Zero-copy calendar over CSR arrays (see `columns`); the sequences may be memoryviews."""
+        calendar = cls()
+        calendar._columns = _Columns(doctor_ids, doctor_offsets, day_ordinals, day_offsets, minutes)
+        calendar._doctor_ids = list(doctor_ids)
+        return calendar
+
+    def columns(self) -> Tuple[List[str], array, array, array, array]:
+        """(doctor_ids, doctor_offsets, day_ordinals, day_offsets, minutes): the whole availability as flat arrays."""
+        doctor_offsets, day_ordinals, day_offsets, minutes = array("q", [0]), array("q"), array("q", [0]), array("q")
+        for doctor_id in self._doctor_ids:
+            for day in self._schedule(doctor_id)[0]:
+                day_ordinals.append(day.ordinal)
+                minutes.extend(day.minutes)
+                day_offsets.append(len(minutes))
+            doctor_offsets.append(len(day_ordinals))
+        return list(self._doctor_ids), doctor_offsets, day_ordinals, day_offsets, minutes
+
+    def subset(self, doctor_ids: Iterable[str]) -> "SlotCalendar":
+        """Calendar of only these doctors (e.g. one shard's); slot arrays are shared, booked bits start clear."""
+        calendar = SlotCalendar()
+        for doctor_id in doctor_ids:
+            schedule = self._schedule(doctor_id)
+            if schedule is None:
+                continue
+            calendar._schedules[doctor_id] = ([_Day(d.ordinal, d.minutes) for d in schedule[0]], list(schedule[1]))
+            calendar._doctor_ids.append(doctor_id)
+        return calendar
+
+    def iter_slots(self) -> Iterator[Tuple[str, str, str]]:
+        """Every working slot as a (doctor_id, "YYYY-MM-DD", "HH:MM") row, booked or not."""
+        for doctor_id in self._doctor_ids:
+            for day in self._schedule(doctor_id)[0]:
+                for minute in day.minutes:
+                    yield doctor_id, day.date, _LABELS[minute % MINUTES_PER_DAY]
+
+    # ---- Lookups ----
+
+    def has_slot(self, doctor_id: str, start: datetime) -> bool:
+        """True if the doctor works in this slot (booked or not)."""
+        return self._locate(doctor_id, start) is not None
+
+    def free_slots(self, doctor_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[dict]:
+        """[{"date": "YYYY-MM-DD", "slots": ["HH:MM", ...]}, ...] for days in [start_date, end_date] with a free slot."""
+        schedule = self._schedule(doctor_id)
+        if schedule is None:
+            return []
+
+        days, ordinals = schedule
+        lo = bisect_left(ordinals, date.fromisoformat(start_date).toordinal()) if start_date else 0
+        hi = bisect_right(ordinals, date.fromisoformat(end_date).toordinal()) if end_date else len(days)
+
+        schedule = []
+        for day in days[lo:hi]:
+            free = day.free_labels()
+            if free:
+                schedule.append({"date": day.date, "slots": free})
+        return schedule
+
+    def earliest_free(self, doctor_ids: Iterable[str], limit: int, after: Optional[datetime] = None,
+                      end_date: Optional[str] = None) -> List[Tuple[int, str]]:
+        """
+        The `limit` earliest free (epoch_minute, doctor_id) slots across the doctors, at or after `after`
+        and on or before `end_date`. A k-way merge of the per-doctor sorted slot streams: only about
+        `limit` slots are generated past the first one of each doctor.
+        """
+        start = dt_to_epoch_minute(after) if after else 0
+        end = (date.fromisoformat(end_date).toordinal() + 1) * MINUTES_PER_DAY if end_date else None
+
+        streams = [self._iter_free(doctor_id, start, end) for doctor_id in doctor_ids if self._schedule(doctor_id)]
+        return list(islice(heapq.merge(*streams), limit))
+
+    # ---- Events ----
+
+    def mark_booked(self, doctor_id: str, start: datetime) -> None:
+        located = self._locate(doctor_id, start)
+        if located is not None:
+            day, i = located
+            day.booked |= 1 << i
+
+    def mark_free(self, doctor_id: str, start: datetime) -> None:
+        located = self._locate(doctor_id, start)
+        if located is not None:
+            day, i = located
+            day.booked &= ~(1 << i)
+
+    # ---------- helpers ----------
+
+    def _schedule(self, doctor_id: str) -> Optional[Tuple[List[_Day], List[int]]]:
+        schedule = self._schedules.get(doctor_id)
+        if schedule is None and self._columns is not None:
+            days = self._columns.days(doctor_id)
+            if days is not None:
+                # setdefault keeps the first copy if two threads materialize the same doctor.
+                schedule = self._schedules.setdefault(doctor_id, (days, [d.ordinal for d in days]))
+        return schedule
+
+    def _iter_free(self, doctor_id: str, start: int, end: Optional[int]) -> Iterator[Tuple[int, str]]:
+        """Free (epoch_minute, doctor_id) slots of one doctor in [start, end), in time order."""
+        days, ordinals = self._schedule(doctor_id)
+        for day in islice(days, bisect_left(ordinals, start // MINUTES_PER_DAY), None):
+            booked, minutes = day.booked, day.minutes
+            for i in range(bisect_left(minutes, start), len(minutes)):
+                minute = minutes[i]
+                if end is not None and minute >= end:
+                    return
+                if not booked >> i & 1:
+                    yield minute, doctor_id
+
+    def _locate(self, doctor_id: str, start: datetime) -> Optional[Tuple[_Day, int]]:
+        schedule = self._schedule(doctor_id)
+        if schedule is None:
+            return None
+
+        days, ordinals = schedule
+        ordinal = start.toordinal()
+        d = bisect_left(ordinals, ordinal)
+        if d == len(ordinals) or ordinals[d] != ordinal:
+            return None
+
+        day = days[d]
+        i = day.index_of(ordinal * MINUTES_PER_DAY + start.hour * 60 + start.minute)
+        return (day, i) if i >= 0 else None
@@ -0,0 +1,309 @@
+import json
+import queue
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+from appointment.util.core.models import Appointment, AppointmentStatus, Doctor, Hospital, Patient
+from appointment.util.store.repository import AppointmentRepository, SlotAlreadyBookedError
+
+DT_FORMAT = "%Y-%m-%d %H:%M"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hospitals (
+    id       TEXT PRIMARY KEY,
+    name     TEXT NOT NULL,
+    city     TEXT,
+    district TEXT
+);
+
+CREATE TABLE IF NOT EXISTS doctors (
+    id          TEXT PRIMARY KEY,
+    hospital_id TEXT,
+    name        TEXT NOT NULL,
+    branch      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_doctors_hospital_branch ON doctors (hospital_id, branch);
+
+CREATE TABLE IF NOT EXISTS patients (
+    id   TEXT PRIMARY KEY,
+    name TEXT,
+    age  INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS availability (
+    doctor_id TEXT NOT NULL,
+    day       TEXT NOT NULL,  -- YYYY-MM-DD
+    time      TEXT NOT NULL,  -- HH:MM
+    PRIMARY KEY (doctor_id, day, time)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS appointments (
+    id          TEXT PRIMARY KEY,
+    doctor_id   TEXT NOT NULL,
+    patient_id  TEXT NOT NULL,
+    hospital_id TEXT,
+    start_time  TEXT NOT NULL,  -- YYYY-MM-DD HH:MM, sorts chronologically
+    end_time    TEXT NOT NULL,
+    status      TEXT NOT NULL   -- AppointmentStatus name
+);
+-- At most one BOOKED appointment per doctor slot; cancelled rows are kept as history.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_appointments_booked_slot
+    ON appointments (doctor_id, start_time) WHERE status = 'BOOKED';
+CREATE INDEX IF NOT EXISTS idx_appointments_patient ON appointments (patient_id, start_time);
+"""
+
+# Message of an uq_appointments_booked_slot violation (SQLite names the columns, not the index).
+_BOOKED_SLOT_VIOLATION = "UNIQUE constraint failed: appointments.doctor_id, appointments.start_time"
+
+
+class SQLiteConnectionPool:
+    """Fixed-size pool of SQLite connections shared across threads (WAL, one writer at a time)."""
+
+    def __init__(self, path: str, size: int = 4, busy_timeout: float = 30.0):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        # Every connection to ":memory:" is a separate database, so it cannot be pooled.
+        self.size = 1 if path == ":memory:" else max(1, size)
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        for _ in range(self.size):
+            self._idle.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        # isolation_level=None: no implicit transactions; writes open them explicitly.
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE takes the write lock up front, so check-then-write inside is atomic."""
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        for _ in range(self.size):
+            self._idle.get().close()
+
+
+class SQLiteAppointmentRepository(AppointmentRepository):
+    """Persistent backend; double booking is ruled out by a partial unique index, not by application checks."""
+
+    def __init__(self, path: str = "appointments.db", pool_size: int = 4):
+        self.pool = SQLiteConnectionPool(path, size=pool_size)
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    # ---- Setup ----
+
+    def is_empty(self) -> bool:
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT 1 FROM doctors LIMIT 1").fetchone() is None
+
+    def seed(self, data: dict) -> None:
+        """Bulk load a MOCK_DATA shaped dict in one transaction."""
+        with self.pool.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO hospitals (id, name, city, district) VALUES (?, ?, ?, ?)",
+                ((h.id, h.name, h.city, h.district) for h in data["hospitals"]),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO doctors (id, hospital_id, name, branch) VALUES (?, ?, ?, ?)",
+                ((d.id, d.hospital_id, d.name, d.branch) for d in data["doctors"]),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO patients (id, name, age) VALUES (?, ?, ?)",
+                ((p.id, p.name, p.age) for p in data["patients"]),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO availability (doctor_id, day, time) VALUES (?, ?, ?)",
+                data["calendar"].iter_slots() if data.get("calendar") is not None else (
+                    (doctor_id, day, time_s)
+                    for doctor_id, schedule in data["availability_map"].items()
+                    for day, times in schedule.items()
+                    for time_s in times
+                ),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO appointments "
+                "(id, doctor_id, patient_id, hospital_id, start_time, end_time, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._appointment_row(a) for a in data["appointments"]),
+            )
+
+    def close(self) -> None:
+        self.pool.close()
+
+    # ---- Lookups ----
+
+    def list_hospitals(self) -> List[Hospital]:
+        with self.pool.connection() as conn:
+            return [Hospital(**row) for row in conn.execute("SELECT id, name, city, district FROM hospitals ORDER BY rowid")]
+
+    def list_doctors(self) -> List[Doctor]:
+        with self.pool.connection() as conn:
+            return [Doctor(**row) for row in conn.execute("SELECT id, hospital_id, name, branch FROM doctors ORDER BY rowid")]
+
+    def get_hospital(self, hospital_id: str) -> Optional[Hospital]:
+        row = self._one("SELECT id, name, city, district FROM hospitals WHERE id = ?", hospital_id)
+        return Hospital(**row) if row else None
+
+    def get_doctor(self, doctor_id: str) -> Optional[Doctor]:
+        row = self._one("SELECT id, hospital_id, name, branch FROM doctors WHERE id = ?", doctor_id)
+        return Doctor(**row) if row else None
+
+    def get_patient(self, patient_id: str) -> Optional[Patient]:
+        row = self._one("SELECT id, name, age FROM patients WHERE id = ?", patient_id)
+        return Patient(**row) if row else None
+
+    def get_appointment(self, appointment_id: str) -> Optional[Appointment]:
+        row = self._one("SELECT * FROM appointments WHERE id = ?", appointment_id)
+        return self._to_appointment(row) if row else None
+
+    def patient_appointments(self, patient_id: str) -> List[Appointment]:
+        with self.pool.connection() as conn:
+            rows = conn.execute("SELECT * FROM appointments WHERE patient_id = ? ORDER BY rowid", (patient_id,))
+            return [self._to_appointment(row) for row in rows]
+
+    def booked_appointment_id(self, doctor_id: str, start_time: datetime) -> Optional[str]:
+        row = self._one(
+            "SELECT id FROM appointments WHERE doctor_id = ? AND start_time = ? AND status = 'BOOKED'",
+            doctor_id, start_time.strftime(DT_FORMAT),
+        )
+        return row["id"] if row else None
+
+    def has_slot(self, doctor_id: str, start_time: datetime) -> bool:
+        return self._one(
+            "SELECT 1 FROM availability WHERE doctor_id = ? AND day = ? AND time = ?",
+            doctor_id, start_time.strftime("%Y-%m-%d"), start_time.strftime("%H:%M"),
+        ) is not None
+
+    def free_slots(self, doctor_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[dict]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT av.day, av.time FROM availability av
+                WHERE av.doctor_id = ? AND av.day >= ? AND av.day <= ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM appointments ap
+                      WHERE ap.doctor_id = av.doctor_id AND ap.status = 'BOOKED'
+                        AND ap.start_time = av.day || ' ' || av.time
+                  )
+                ORDER BY av.day, av.time
+                """,
+                (doctor_id, start_date or "", end_date or "9999-12-31"),
+            ).fetchall()
+
+        schedule: List[dict] = []
+        for row in rows:
+            if not schedule or schedule[-1]["date"] != row["day"]:
+                schedule.append({"date": row["day"], "slots": []})
+            schedule[-1]["slots"].append(row["time"])
+        return schedule
+
+    def earliest_free_slots(self, doctor_ids: List[str], limit: int, after: Optional[datetime] = None,
+                            end_date: Optional[str] = None) -> List[Tuple[str, datetime]]:
+        after_day, after_time = (after.strftime("%Y-%m-%d"), after.strftime("%H:%M")) if after else ("", "")
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT av.doctor_id, av.day, av.time FROM availability av
+                WHERE av.doctor_id IN (SELECT value FROM json_each(?))
+                  AND (av.day > ? OR (av.day = ? AND av.time >= ?)) AND av.day <= ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM appointments ap
+                      WHERE ap.doctor_id = av.doctor_id AND ap.status = 'BOOKED'
+                        AND ap.start_time = av.day || ' ' || av.time
+                  )
+                ORDER BY av.day, av.time, av.doctor_id
+                LIMIT ?
+                """,
+                (json.dumps(list(doctor_ids)), after_day, after_day, after_time, end_date or "9999-12-31", limit),
+            ).fetchall()
+        return [(row["doctor_id"], datetime.strptime(f"{row['day']} {row['time']}", DT_FORMAT)) for row in rows]
+
+    # ---- Writes ----
+
+    def book(self, appointment: Appointment) -> Appointment:
+        with self.pool.transaction() as conn:
+            self._insert(conn, appointment)
+        return appointment
+
+    def cancel(self, appointment_id: str) -> Appointment:
+        with self.pool.transaction() as conn:
+            conn.execute("UPDATE appointments SET status = 'CANCELLED' WHERE id = ?", (appointment_id,))
+        return self.get_appointment(appointment_id)
+
+    def reschedule(self, old_appointment_id: str, new_appointment: Appointment) -> Appointment:
+        with self.pool.transaction() as conn:
+            cancelled = conn.execute(
+                "UPDATE appointments SET status = 'CANCELLED' WHERE id = ? AND status = 'BOOKED'",
+                (old_appointment_id,),
+            ).rowcount
+            if cancelled != 1:
+                raise ValueError("this appointment already cancelled.")
+            self._insert(conn, new_appointment)
+        return new_appointment
+
+    # ---------- helpers ----------
+
+    def _one(self, sql: str, *params) -> Optional[sqlite3.Row]:
+        with self.pool.connection() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def _insert(self, conn: sqlite3.Connection, appointment: Appointment) -> None:
+        try:
+            conn.execute(
+                "INSERT INTO appointments (id, doctor_id, patient_id, hospital_id, start_time, end_time, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._appointment_row(appointment),
+            )
+        except sqlite3.IntegrityError as e:
+            # Only the booked-slot index means the slot is taken; other violations (NOT NULL, duplicate id) are bugs.
+            if _BOOKED_SLOT_VIOLATION not in str(e):
+                raise
+            raise SlotAlreadyBookedError(
+                f"The slot {appointment.start_time.strftime(DT_FORMAT)} is already booked."
+            ) from e
+
+    @staticmethod
+    def _appointment_row(appointment: Appointment) -> tuple:
+        return (
+            appointment.id,
+            appointment.doctor_id,
+            appointment.patient_id,
+            appointment.hospital_id,
+            appointment.start_time.strftime(DT_FORMAT),
+            appointment.end_time.strftime(DT_FORMAT),
+            appointment.status.name,
+        )
+
+    @staticmethod
+    def _to_appointment(row: sqlite3.Row) -> Appointment:
+        return Appointment(
+            id=row["id"],
+            doctor_id=sys.intern(row["doctor_id"]),
+            patient_id=row["patient_id"],
+            hospital_id=sys.intern(row["hospital_id"]) if row["hospital_id"] else None,
+            start_time=datetime.strptime(row["start_time"], DT_FORMAT),
+            end_time=datetime.strptime(row["end_time"], DT_FORMAT),
+            status=AppointmentStatus[row["status"]],
+        )
@@ -1,9 +1,13 @@
 from fastmcp import FastMCP
 from dotenv import find_dotenv, load_dotenv
+import asyncio
+import functools
+import hashlib
 import inspect
+import json
 from typing import Literal
 from starlette.requests import Request
-from starlette.responses import PlainTextResponse
+from starlette.responses import PlainTextResponse, JSONResponse
 
 from tools import ToolBase
 
@@ -14,16 +18,63 @@ class MCPServer:
 
         self.server_name = server_name
         self.mcp = FastMCP(name=server_name)
+        self._manifest = None
 
         @self.mcp.custom_route("/health", methods=["GET"])
         async def health_check(request: Request) -> PlainTextResponse:
             return PlainTextResponse("OK")
 
+        @self.mcp.custom_route("/manifest", methods=["GET"])
+        async def manifest(request: Request) -> JSONResponse:
+            """Tool names and JSON schemas plus a content hash, so clients can cache the toolset."""
+            return JSONResponse(await self.get_manifest())
+
     def register_tools(self, tool_instances: list[ToolBase]):
         for tool_class in tool_instances:
             for name, method in inspect.getmembers(tool_class, inspect.ismethod):
                 if not name.startswith('_'):
-                    self.mcp.tool()(method)
+                    self.mcp.tool()(self._off_loop(method))
+
+        self._manifest = None
+
+    @staticmethod
+    def _off_loop(method):
+        """
+        Run a synchronous tool on a worker thread, so a tool waiting on I/O does not stall the event loop.
+        This applies to every tool of the server: synchronous tools now run concurrently, so state they
+        share must be locked (see AppointmentStore's striped locks).
+        """
+        if inspect.iscoroutinefunction(method):
+            return method
+
+        @functools.wraps(method)
+        async def run(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return run
+
+    async def get_manifest(self) -> dict:
+        if self._manifest is None:
+            tools = await self.mcp.get_tools()
+            specs = sorted(
+                (
+                    {
+                        "name": tool.name,
+                        "description": tool.description or "",
+                        "input_schema": tool.parameters,
+                    }
+                    for tool in tools.values()
+                ),
+                key=lambda spec: spec["name"],
+            )
+            canonical = json.dumps(specs, sort_keys=True, ensure_ascii=False).encode("utf-8")
+            self._manifest = {
+                "server": self.server_name,
+                "hash": hashlib.sha256(canonical).hexdigest(),
+                "tools": specs,
+            }
+
+        return self._manifest
 
     def run(self, transport: Literal["stdio", "http", "sse", "streamable-http"] = "sse", **kwargs):
         self.mcp.run(transport=transport, **kwargs)
@@ -46,4 +97,4 @@ if __name__ == "__main__":
 
     except Exception as e:
         print(f"Error: {e}")
-        exit(1)
\ No newline at end of file
+        exit(1)
@@ -5,6 +5,7 @@ from loguru import logger
 
 from server.mcp_server import MCPServer
 from tools import AppointmentTools
+from appointment.sharded_appointment_manager import ShardedAppointmentManager
 
 load_dotenv(find_dotenv())
 
@@ -17,8 +18,16 @@ def start_appointment_mcp():
     host = "0.0.0.0"
 
     logger.info(f"Running Appointment MCP Server (Port: {port}, host:{host})")
+    shards = int(os.getenv("APPOINTMENT_SHARDS", "1").strip())
+    if shards > 1:
+        # Doctors are split across worker processes; this process only routes tool calls to them.
+        logger.info(f"Starting {shards} appointment shards")
+        tools = AppointmentTools(service=ShardedAppointmentManager(shards))
+    else:
+        tools = AppointmentTools()
+
     server = MCPServer(SERVER_NAME)
-    server.register_tools(tool_instances=[AppointmentTools()])
+    server.register_tools(tool_instances=[tools])
     server.run(transport="sse", host=host, port=port)
 
 
@@ -5,8 +5,9 @@ from appointment.appointment_manager import AppointmentManager
 
 class AppointmentTools(ToolBase):
 
-    def __init__(self):
-        self.service = AppointmentManager()
+    def __init__(self, service=None):
+        # Anything with the AppointmentManager API, e.g. ShardedAppointmentManager.
+        self.service = service if service is not None else AppointmentManager()
 
     # ---------- HELPERS ----------
 
@@ -26,7 +27,13 @@ class AppointmentTools(ToolBase):
 
     # ---------- PUBLIC TOOLS ----------
 
-    def get_available_hospitals(self, city: str, district: str = None) -> dict:
+    def get_available_hospitals(
+            self,
+            city: str,
+            district: str = None,
+            page: Annotated[int, Field(
+                description="1-based result page. Request the next page only if the previous result had has_more=true.")] = 1
+    ) -> dict:
         """
         Retrieves a list of active hospitals from the database, optionally filtered by location (City/District).
 
@@ -52,24 +59,33 @@ class AppointmentTools(ToolBase):
           RULE: Send this only if explicitly mentioned. Default is None.
 
         --- BEHAVIOR ---
-        - Returns a list of dictionaries containing 'id', 'name'.
+        - Names are matched case-insensitively and tolerate missing Turkish characters or small typos
+          ("Istanbul", "cankaya"), so pass the user's wording as-is.
+        - Returns one page of hospitals with 'id', 'name', 'district'.
 
         Returns:
-            On success: {"hospitals": [{"id": "1", "name": "Acıbadem", ...]}
+            On success: {"hospitals": [{"id": "1", "name": "Acıbadem", ...}], "total": 12, "page": 1, "page_size": 20, "has_more": false}
             On error: {"error": "Database connection failed"}
         """
         try:
-            hospitals = self.service.get_available_hospitals(city=city, district=district)
-            return {"hospitals": hospitals}
+            return self.service.get_available_hospitals(city=city, district=district, page=page)
         except Exception as e:
             return {"error": str(e)}
 
-    def get_available_slots(self, doctor_id: str) -> dict:
+    def get_available_slots(
+            self,
+            doctor_id: str,
+            start_date: Annotated[str, Field(
+                description="Optional first day to include, in STRICT 'YYYY-MM-DD' format. Leave None for no lower bound.")] = None,
+            end_date: Annotated[str, Field(
+                description="Optional last day to include, in STRICT 'YYYY-MM-DD' format. Leave None for no upper bound.")] = None
+    ) -> dict:
         """
-        Retrieves the full list of available appointment slots for a KNOWN doctor.
+        Retrieves the list of available appointment slots for a KNOWN doctor.
 
-        This tool returns the doctor's entire schedule.
+        Without a date range this tool returns the doctor's entire schedule.
         Use it after the user has selected a specific doctor to see when they are free.
+        If the user asks about a specific day or week, pass start_date/end_date to narrow the result.
 
         --- CRITICAL RULE ---
         You MUST know the 'doctor_id' before calling this tool.
@@ -86,16 +102,71 @@ class AppointmentTools(ToolBase):
                 RULE: You must extract this from the output of 'get_doctors_by_hospital_and_branch'.
                 Never guess or hallucinate an ID.
 
+            start_date / end_date (str, OPTIONAL): Inclusive day range, "YYYY-MM-DD".
+
         Returns:
             On success: {"available_slots": [{"doctor_name": "...", "schedule": [{"date": "...", "slots": [...]}]}]}
             On error: {"error": "Doctor not found" or other messages}
         """
         try:
-            slots = self.service.get_available_slots(doctor_id=doctor_id)
+            slots = self.service.get_available_slots(doctor_id=doctor_id, start_date=start_date, end_date=end_date)
             return {"available_slots": slots}
         except Exception as e:
             return {"error": str(e)}
 
+    def find_earliest_slots(
+            self,
+            branch: str = None,
+            city: str = None,
+            district: str = None,
+            hospital_id: str = None,
+            start_date: Annotated[str, Field(
+                description="Optional first day to search from, in STRICT 'YYYY-MM-DD' format. Leave None to search from the beginning.")] = None,
+            end_date: Annotated[str, Field(
+                description="Optional last day to include, in STRICT 'YYYY-MM-DD' format. Leave None for no upper bound.")] = None,
+            limit: Annotated[int, Field(description="How many of the earliest slots to return (1-50).")] = 5
+    ) -> dict:
+        """
+        Finds the EARLIEST free appointment slots across all matching doctors in ONE call.
+
+        Prefer this tool whenever the user cares about "the soonest" appointment rather than a
+        specific doctor. It replaces calling 'get_doctors_by_hospital_and_branch' and then
+        'get_available_slots' once per doctor.
+
+        --- USE CASES ---
+        1. "What is the earliest cardiology appointment in Ankara?" -> branch="Kardiyoloji", city="Ankara"
+        2. "Any free slot at this hospital next week?" -> hospital_id="1", start_date/end_date of that week
+        3. "I need a neurologist as soon as possible." -> branch="Nöroloji"
+
+        --- ARGUMENTS ---
+        Args:
+            branch (str, OPTIONAL): Medical branch (e.g., "Kardiyoloji", "KBB"). Typos and missing Turkish characters are tolerated.
+            city (str, OPTIONAL): City of the hospitals to consider (e.g., "İstanbul").
+            district (str, OPTIONAL): District of the hospitals to consider (e.g., "Çankaya").
+            hospital_id (str, OPTIONAL): Restrict to a single hospital; takes precedence over city/district.
+                RULE: Must come from 'get_available_hospitals'. Never guess an ID.
+            start_date / end_date (str, OPTIONAL): Inclusive day range, "YYYY-MM-DD".
+            limit (int, OPTIONAL): Number of slots to return, default 5.
+
+        Returns:
+            On success: {"slots": [{"date": "2025-08-10", "time": "09:00", "doctor_id": "101", "doctor_name": "Dr. X",
+                                    "branch": "Kardiyoloji", "hospital_id": "1", "hospital_name": "..."}, ...],
+                         "doctors_considered": 12}
+            On error: {"error": <error message>}
+        """
+        try:
+            return self.service.find_earliest_slots(
+                branch=branch,
+                city=city,
+                district=district,
+                hospital_id=hospital_id,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit
+            )
+        except Exception as e:
+            return {"error": str(e)}
+
     def get_patient_appointments(self, patient_id: str) -> dict:
         """
         Retrieves the entire appointment history and upcoming schedule for a specific patient.
@@ -250,7 +321,13 @@ class AppointmentTools(ToolBase):
         except Exception as e:
             return {"error": str(e)}
 
-    def get_doctors_by_hospital_and_branch(self, hospital_id: str, branch: str) -> dict:
+    def get_doctors_by_hospital_and_branch(
+            self,
+            hospital_id: str,
+            branch: str,
+            page: Annotated[int, Field(
+                description="1-based result page. Request the next page only if the previous result had has_more=true.")] = 1
+    ) -> dict:
         """
         Retrieves a targeted list of doctors working at a specific hospital within a specific medical branch.
 
@@ -274,14 +351,14 @@ class AppointmentTools(ToolBase):
                 (e.g., if user says "heart doctor", convert to "Kardiyoloji"; if "eye", convert to "Göz Hastalıkları").
 
         Returns:
-            On success: {"doctors": [{"id": "...", "name": "..."}, ...]}
+            On success: {"doctors": [{"id": "...", "name": "...", "branch": "..."}, ...], "total": 3, "page": 1, "page_size": 20, "has_more": false}
             On error: {"error": <error message>}
         """
         try:
-            docs = self.service.get_doctors_by_hospital_and_branch(
+            return self.service.get_doctors_by_hospital_and_branch(
                 hospital_id=hospital_id,
-                branch=branch
+                branch=branch,
+                page=page
             )
-            return {"doctors": docs}
         except Exception as e:
             return {"error": str(e)}
\ No newline at end of file